@@ -0,0 +1 @@
+"""Micro-benchmarks for the analysis hot paths (run with python -m benchmarks)."""
@@ -0,0 +1,120 @@
+"""
+Run the benchmark suite and compare it with the committed baseline.
+
+Usage (from the repository root):
+    python -m benchmarks                    # run and check for regressions
+    python -m benchmarks -k engine_analyze  # only matching benchmarks
+    python -m benchmarks --update-baseline  # record a new baseline
+
+Exits with status 1 when any benchmark is slower than the baseline by more
+than the threshold percentage.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .cases import all_benchmarks
+from .harness import (
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    run_benchmark,
+    write_baseline,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD_PCT = 25.0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Harmonic analysis benchmarks")
+    parser.add_argument(
+        "-k", "--filter", default="", help="Only run benchmarks containing this"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD_PCT,
+        help="Allowed ops/sec drop against the baseline, in percent",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Seconds to time each benchmark"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results as the new baseline instead of comparing",
+    )
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in all_benchmarks() if args.filter in b.name]
+    if not benchmarks:
+        print(f"No benchmarks match {args.filter!r}")
+        return 1
+
+    # Main play: run and report each benchmark as it finishes
+    print(
+        f"{'benchmark':<36} {'ops/sec':>11} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'peak KiB':>9} {'blocks':>7}"
+    )
+    results = []
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, min_time=args.min_time)
+        results.append(result)
+        print(
+            f"{result.name:<36} {result.ops_per_sec:>11.1f} {result.p50_ms:>9.3f} "
+            f"{result.p99_ms:>9.3f} {result.peak_alloc_kib:>9.1f} "
+            f"{result.alloc_blocks:>7}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([result.to_dict() for result in results], indent=2) + "\n"
+        )
+
+    if args.update_baseline:
+        if args.filter:
+            # Keep the entries of benchmarks that were not re-run
+            merged = dict(load_baseline(args.baseline))
+            merged.update({result.name: result.to_dict() for result in results})
+            results_to_write = [
+                BenchmarkResult(**entry) for _, entry in sorted(merged.items())
+            ]
+        else:
+            results_to_write = results
+        write_baseline(args.baseline, results_to_write)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    # Victory lap: fail on throughput regressions that survive a re-run
+    baseline = load_baseline(args.baseline)
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        suspects = {regression.name for regression in regressions}
+        reruns = [
+            run_benchmark(benchmark, min_time=args.min_time)
+            for benchmark in benchmarks
+            if benchmark.name in suspects
+        ]
+        regressions = find_regressions(reruns, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0f}%:")
+        for regression in regressions:
+            print(
+                f"  {regression.name}: {regression.ops_per_sec:.1f} ops/sec "
+                f"vs {regression.baseline_ops_per_sec:.1f} "
+                f"({regression.change_pct:+.1f}%)"
+            )
+        return 1
+
+    print("\nNo regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
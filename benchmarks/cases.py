@@ -0,0 +1,133 @@
+"""
+Benchmark definitions for the analysis hot paths.
+
+Inputs are generated deterministically so runs are comparable with the
+committed baseline. Heavy objects (service, engine) are built once and shared.
+"""
+
+import random
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+from harmonic_analysis.core.pattern_engine.calibration import Calibrator
+from harmonic_analysis.core.pattern_engine.token_converter import (
+    normalize_melody_input,
+    romanize_chord,
+)
+from harmonic_analysis.core.utils.chord_detection import detect_chord_from_pitches
+from harmonic_analysis.dto import serialize_dataclass
+from harmonic_analysis.services.unified_pattern_service import UnifiedPatternService
+
+from .harness import Benchmark
+
+LENGTHS = (4, 16, 64, 256, 1024, 4096)
+
+KEY = "C major"
+CHORDS = ["C", "Am", "F", "G7", "Dm", "G", "Em", "A7", "Dm7", "Bb", "Fm", "C/E"]
+ROMANS = ["I", "vi", "IV", "V7", "ii", "V", "iii", "V7/ii", "ii7", "♭VII", "iv", "I6"]
+MELODY = ["E4", "D4", "C4", "D4", "E4", "G4", "F4", "E4", "D4", "B3", "C4", "G4"]
+SCALE = ["D", "E", "F", "G", "A", "B", "C"]
+PITCH_SETS = [
+    [60, 64, 67],
+    [55, 59, 62, 65],
+    [57, 60, 64],
+    [62, 65, 69, 72],
+    [64, 67, 71, 74],
+    [59, 62, 65, 68],
+    [52, 60, 67],
+    [60, 65, 67],
+]
+
+
+@lru_cache(maxsize=None)
+def _service() -> UnifiedPatternService:
+    return UnifiedPatternService()
+
+
+def _cycle(items: List[str], length: int) -> List[str]:
+    return [items[i % len(items)] for i in range(length)]
+
+
+def _inputs(kind: str, length: int) -> Dict[str, Any]:
+    """analyze_with_patterns() keyword arguments for an input kind."""
+    if kind == "chords":
+        return {"chords": _cycle(CHORDS, length), "key_hint": KEY}
+    if kind == "romans":
+        return {"romans": _cycle(ROMANS, length), "key_hint": KEY}
+    if kind == "melody":
+        return {"melody": _cycle(MELODY, length), "key_hint": KEY}
+    return {"notes": SCALE, "key_hint": "D dorian"}
+
+
+def _sizes(kind: str) -> List[int]:
+    # A scale is a fixed set of notes, so it has a single natural size
+    return [len(SCALE)] if kind == "scale" else list(LENGTHS)
+
+
+def _engine_analyze(kind: str, length: int) -> Callable[[], Any]:
+    service = _service()
+    context = service._prepare_analysis(**_inputs(kind, length)).context
+
+    def run() -> Any:
+        # Derived features are per-analysis work; don't reuse the last op's
+        context.clear_derived()
+        return service.engine.analyze(context)
+
+    return run
+
+
+def _service_analyze(kind: str, length: int) -> Callable[[], Any]:
+    service = _service()
+    inputs = _inputs(kind, length)
+    return lambda: service.analyze_with_patterns(**inputs)
+
+
+def _romanize() -> Callable[[], Any]:
+    return lambda: [romanize_chord(chord, KEY) for chord in CHORDS]
+
+
+def _detect_chords() -> Callable[[], Any]:
+    return lambda: [detect_chord_from_pitches(pitches) for pitches in PITCH_SETS]
+
+
+def _normalize_melody() -> Callable[[], Any]:
+    melody = _cycle(MELODY, 16)
+    return lambda: normalize_melody_input(melody, KEY)
+
+
+def _calibrator_fit() -> Callable[[], Any]:
+    rng = random.Random(0)
+    raw = [rng.random() for _ in range(200)]
+    targets = [min(1.0, max(0.0, 0.8 * x + 0.1 + rng.gauss(0, 0.05))) for x in raw]
+    calibrator = Calibrator()
+    return lambda: calibrator.fit(raw, targets)
+
+
+def _serialize() -> Callable[[], Any]:
+    envelope = _service().analyze_with_patterns(**_inputs("chords", 16))
+    return lambda: serialize_dataclass(envelope)
+
+
+def _bind(factory: Callable[..., Callable[[], Any]], *args: Any) -> Benchmark:
+    """Benchmark named after the factory and its arguments."""
+    name = ".".join([factory.__name__.lstrip("_"), *map(str, args)])
+    return Benchmark(name, lambda: factory(*args))
+
+
+def all_benchmarks() -> List[Benchmark]:
+    """Every benchmark in the suite, in reporting order."""
+    benchmarks = []
+    for factory in (_engine_analyze, _service_analyze):
+        for kind in ("chords", "romans", "scale", "melody"):
+            benchmarks.extend(_bind(factory, kind, n) for n in _sizes(kind))
+    benchmarks.extend(
+        _bind(factory)
+        for factory in (
+            _romanize,
+            _detect_chords,
+            _normalize_melody,
+            _calibrator_fit,
+            _serialize,
+        )
+    )
+    return benchmarks
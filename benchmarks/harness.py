@@ -0,0 +1,201 @@
+"""
+Timing, allocation and baseline-comparison harness for the benchmark suite.
+
+Each benchmark is timed op by op until it has run for a minimum time, then run
+once more under tracemalloc to record its peak allocation. Results are compared
+against a committed JSON baseline by throughput (ops/sec).
+"""
+
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+BASELINE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A named operation to time; setup() returns the zero-argument op."""
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing and allocation figures for one benchmark."""
+
+    name: str
+    rounds: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    peak_alloc_kib: float
+    alloc_blocks: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A benchmark whose throughput dropped below the allowed threshold."""
+
+    name: str
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+
+    @property
+    def change_pct(self) -> float:
+        """Throughput change against the baseline, in percent."""
+        return (self.ops_per_sec / self.baseline_ops_per_sec - 1.0) * 100.0
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    min_time: float = 0.2,
+    min_rounds: int = 3,
+    max_rounds: int = 10_000,
+) -> BenchmarkResult:
+    """
+    Time a benchmark and measure its allocations.
+
+    Args:
+        benchmark: Benchmark to run
+        min_time: Minimum total seconds spent in timed rounds
+        min_rounds: Minimum number of timed rounds
+        max_rounds: Upper bound on timed rounds for very fast ops
+
+    Returns:
+        BenchmarkResult for the benchmark
+    """
+    op = benchmark.setup()
+    op()  # warm caches before timing
+
+    # Main play: time individual ops with the collector out of the way
+    timings: List[float] = []
+    total = 0.0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while (len(timings) < min_rounds or total < min_time) and (
+            len(timings) < max_rounds
+        ):
+            started = time.perf_counter()
+            op()
+            elapsed = time.perf_counter() - started
+            timings.append(elapsed)
+            total += elapsed
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    # Victory lap: one traced op for peak memory and allocated blocks
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(
+        max(stat.count_diff, 0) for stat in after.compare_to(before, "filename")
+    )
+
+    samples = np.array(timings) * 1000.0
+    return BenchmarkResult(
+        name=benchmark.name,
+        rounds=len(timings),
+        ops_per_sec=len(timings) / total if total > 0 else float("inf"),
+        p50_ms=float(np.percentile(samples, 50)),
+        p99_ms=float(np.percentile(samples, 99)),
+        peak_alloc_kib=peak / 1024.0,
+        alloc_blocks=blocks,
+    )
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load baseline results keyed by benchmark name.
+
+    Args:
+        path: Baseline JSON file
+
+    Returns:
+        Mapping of benchmark name to result dictionary (empty if missing)
+
+    Raises:
+        ValueError: If the file has an unsupported baseline version
+    """
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"Unsupported baseline version {data.get('version')!r} in {path}"
+        )
+    results: Dict[str, Dict[str, Any]] = data.get("results", {})
+    return results
+
+
+def write_baseline(path: Path, results: Iterable[BenchmarkResult]) -> None:
+    """
+    Write results as the new baseline.
+
+    Args:
+        path: Baseline JSON file
+        results: Benchmark results to record
+    """
+    data = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            result.name: {
+                field: round(value, 3) if isinstance(value, float) else value
+                for field, value in result.to_dict().items()
+            }
+            for result in results
+        },
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold_pct: float,
+) -> List[Regression]:
+    """
+    Compare results against the baseline throughput.
+
+    Args:
+        results: Fresh benchmark results
+        baseline: Baseline results keyed by name (see load_baseline())
+        threshold_pct: Allowed throughput drop in percent
+
+    Returns:
+        Regressions for benchmarks slower than the threshold allows;
+        benchmarks missing from the baseline are never regressions
+    """
+    regressions = []
+    for result in results:
+        reference: Optional[Dict[str, Any]] = baseline.get(result.name)
+        if not reference:
+            continue
+        floor = reference["ops_per_sec"] * (1.0 - threshold_pct / 100.0)
+        if result.ops_per_sec < floor:
+            regressions.append(
+                Regression(result.name, reference["ops_per_sec"], result.ops_per_sec)
+            )
+    return regressions
@@ -0,0 +1,235 @@
+"""
+In-process response cache for the analysis routes.
+
+Opening move: most traffic repeats a few hundred progressions, so serialized
+responses are kept in an LRU cache with a TTL, keyed by a canonical hash of
+the normalized request. Each entry carries a strong ETag (hash of the body)
+so clients can revalidate with If-None-Match and get a 304.
+
+Cached responses depend on the bundled resources (pattern library, glossary,
+profiles, knowledge base) and the library version; when either changes the
+whole cache is dropped on the next lookup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Optional
+
+from harmonic_analysis import __version__
+from harmonic_analysis.resources.bundle import BUNDLED_RESOURCES, RESOURCES_DIR
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+def resource_version() -> str:
+    """
+    Identify the library version and bundled resource files in use.
+
+    Stats the files rather than hashing them, so it is cheap enough to check
+    on every lookup.
+    """
+    parts = [__version__]
+    for name in BUNDLED_RESOURCES:
+        try:
+            stat = os.stat(RESOURCES_DIR / name)
+            parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{name}:missing")
+    return "|".join(parts)
+
+
+def cache_key(route: str, request: Dict[str, Any]) -> str:
+    """
+    Hash a normalized request into a cache key.
+
+    Args:
+        route: Route (or input type) the request belongs to
+        request: JSON-compatible normalized request fields
+
+    Returns:
+        Hex digest identifying the request
+    """
+    canonical = json.dumps(
+        [route, request], sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A serialized response and its validator."""
+
+    body: bytes
+    etag: str
+    expires_at: float
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Whether an If-None-Match header names this entry's ETag."""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+
+
+@dataclass
+class CacheStats:
+    """Counters for cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    """Entries dropped to stay within max_entries."""
+
+    expirations: int = 0
+    """Entries dropped because their TTL ran out."""
+
+    invalidations: int = 0
+    """Times the whole cache was dropped for a resource/version change."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export counters (including the hit rate)."""
+        data: Dict[str, Any] = {
+            stat.name: getattr(self, stat.name) for stat in fields(self)
+        }
+        lookups = self.hits + self.misses
+        data["hit_rate"] = self.hits / lookups if lookups else 0.0
+        return data
+
+
+class ResponseCache:
+    """Thread-safe LRU/TTL cache of serialized responses."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        version: Callable[[], str] = resource_version,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is
+                evicted (0 disables caching)
+            ttl_seconds: Lifetime of an entry
+            version: Returns the current resource version; a change drops
+                every entry
+            clock: Monotonic time source (seconds)
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._version = version
+        self._clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._current_version = version()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_version(self) -> None:
+        version = self._version()
+        if version != self._current_version:
+            self._current_version = version
+            if self._entries:
+                self._entries.clear()
+                self.stats.invalidations += 1
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a response, counting a hit or miss.
+
+        Args:
+            key: Key from cache_key()
+
+        Returns:
+            The live entry, or None
+        """
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def put(self, key: str, payload: Any) -> CacheEntry:
+        """
+        Serialize and store a response.
+
+        Args:
+            key: Key from cache_key()
+            payload: JSON-compatible response body
+
+        Returns:
+            The entry (returned even when caching is disabled)
+        """
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        entry = CacheEntry(
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            expires_at=self._clock() + self.ttl_seconds,
+        )
+        if self.max_entries == 0:
+            return entry
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return entry
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Cache size, limits and counters."""
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "entries": size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            **self.stats.to_dict(),
+        }
+
+
+def cache_from_env() -> ResponseCache:
+    """
+    Build the response cache from environment settings.
+
+    HARMONIC_ANALYSIS_RESPONSE_CACHE_SIZE sets max_entries (0 disables it)
+    and HARMONIC_ANALYSIS_RESPONSE_CACHE_TTL the TTL in seconds.
+    """
+    return ResponseCache(
+        max_entries=int(
+            os.environ.get("HARMONIC_ANALYSIS_RESPONSE_CACHE_SIZE", DEFAULT_MAX_ENTRIES)
+        ),
+        ttl_seconds=float(
+            os.environ.get("HARMONIC_ANALYSIS_RESPONSE_CACHE_TTL", DEFAULT_TTL_SECONDS)
+        ),
+    )
@@ -0,0 +1,278 @@
+"""
+In-process background jobs for long-running analyses.
+
+Opening move: a full-file chordify can take minutes, far longer than a web
+request (or the proxy in front of it) should stay open. Jobs run on a small
+local thread pool instead; the client gets a job id right away and polls for
+status, progress and the result. No broker is involved: jobs live in memory
+for the lifetime of the process, and finished jobs are dropped after a TTL.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUED = 32
+DEFAULT_TTL_SECONDS = 3600.0
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+ProgressFn = Callable[[str, float], None]
+"""Reports (stage, fraction done) from inside a running job."""
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is rejected because too many are already queued."""
+
+
+@dataclass
+class Job:
+    """State of one background job."""
+
+    id: str
+    status: str = QUEUED
+    stage: str = QUEUED
+    """Coarse step the job is on (set by the job's progress reports)."""
+
+    progress: float = 0.0
+    """Fraction done, from 0.0 to 1.0."""
+
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished (either way)."""
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the job for the status endpoint."""
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": round(self.progress, 3),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.status == SUCCEEDED:
+            data["result"] = self.result
+        if self.status == FAILED:
+            data["error"] = self.error
+        return data
+
+
+class JobQueue:
+    """Bounded worker pool plus an in-memory, TTL-expiring job store."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            max_workers: Jobs running at once
+            max_queued: Jobs allowed to wait for a worker; beyond that
+                submit() raises JobQueueFullError
+            ttl_seconds: How long a finished job (and its result) is kept
+            clock: Monotonic time source used for expiry (seconds)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queued < 0:
+            raise ValueError("max_queued must not be negative")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._jobs: Dict[str, Job] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._on_cancel: Dict[str, Callable[[], None]] = {}
+        self._closed = False
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="analysis-job"
+        )
+
+    def _purge_expired(self) -> None:
+        now = self._clock()
+        for job_id in [j for j, at in self._expires_at.items() if at <= now]:
+            del self._expires_at[job_id]
+            del self._jobs[job_id]
+
+    def submit(
+        self,
+        work: Callable[[ProgressFn], Any],
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            work: Called on a worker thread with a progress callback; its
+                return value becomes the job result, an exception fails it
+            on_cancel: Called instead of ``work`` if the queue shuts down
+                before the job starts (e.g. to release the job's files)
+
+        Returns:
+            A snapshot of the queued job (its id is what clients poll)
+
+        Raises:
+            JobQueueFullError: If max_queued jobs are already waiting, or
+                the queue has been closed
+        """
+        with self._lock:
+            if self._closed:
+                raise JobQueueFullError("Job queue is shutting down")
+            self._purge_expired()
+            queued = sum(1 for job in self._jobs.values() if job.status == QUEUED)
+            if queued >= self.max_queued:
+                raise JobQueueFullError(
+                    f"Job queue is full ({queued} waiting); retry later"
+                )
+            job = Job(id=uuid.uuid4().hex)
+            self._jobs[job.id] = job
+            if on_cancel is not None:
+                self._on_cancel[job.id] = on_cancel
+            snapshot = Job(**vars(job))
+            # Under the lock, so close() can't shut the pool down in between
+            self._pool.submit(self._run, job, work)
+        return snapshot
+
+    def _update(self, job: Job, **changes: Any) -> None:
+        with self._lock:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            if job.done:
+                self._expires_at[job.id] = self._clock() + self.ttl_seconds
+
+    def _run(self, job: Job, work: Callable[[ProgressFn], Any]) -> None:
+        with self._lock:
+            if job.status != QUEUED:
+                return  # Cancelled by close() before a worker got to it
+            self._on_cancel.pop(job.id, None)
+            job.status = job.stage = RUNNING
+            job.started_at = time.time()
+
+        def report(stage: str, progress: float) -> None:
+            self._update(job, stage=stage, progress=min(max(progress, 0.0), 1.0))
+
+        try:
+            result = work(report)
+        except Exception as exc:
+            logger.warning(f"⚠️ Job {job.id} failed: {exc}")
+            self._update(
+                job,
+                status=FAILED,
+                stage=FAILED,
+                error=str(exc) or type(exc).__name__,
+                finished_at=time.time(),
+            )
+        else:
+            self._update(
+                job,
+                status=SUCCEEDED,
+                stage=SUCCEEDED,
+                progress=1.0,
+                result=result,
+                finished_at=time.time(),
+            )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job.
+
+        Returns:
+            A snapshot of the job, or None if it is unknown or expired
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            return None if job is None else Job(**vars(job))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Pool limits and job counts by status."""
+        with self._lock:
+            self._purge_expired()
+            counts = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        return {
+            "max_workers": self.max_workers,
+            "max_queued": self.max_queued,
+            "ttl_seconds": self.ttl_seconds,
+            "jobs": counts,
+        }
+
+    def close(self) -> None:
+        """
+        Stop the workers, failing jobs that have not started.
+
+        Queued jobs are marked failed and their on_cancel callbacks run;
+        running jobs finish in the background.
+        """
+        callbacks = []
+        with self._lock:
+            self._closed = True
+            # Same lock as _run(), so a worker can't start a job marked here
+            for job in self._jobs.values():
+                if job.status != QUEUED:
+                    continue
+                job.status = job.stage = FAILED
+                job.error = "Job queue shut down before the job started"
+                job.finished_at = time.time()
+                self._expires_at[job.id] = self._clock() + self.ttl_seconds
+                callbacks.append(self._on_cancel.pop(job.id, None))
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning(f"⚠️ Job cleanup failed: {exc}")
+
+
+def job_queue_from_env() -> JobQueue:
+    """
+    Build the job queue from environment settings.
+
+    HARMONIC_ANALYSIS_JOB_WORKERS sets the pool size,
+    HARMONIC_ANALYSIS_JOB_MAX_QUEUED the waiting-job limit and
+    HARMONIC_ANALYSIS_JOB_TTL how long finished jobs are kept (seconds).
+    """
+    return JobQueue(
+        max_workers=int(
+            os.environ.get("HARMONIC_ANALYSIS_JOB_WORKERS", DEFAULT_WORKERS)
+        ),
+        max_queued=int(
+            os.environ.get("HARMONIC_ANALYSIS_JOB_MAX_QUEUED", DEFAULT_MAX_QUEUED)
+        ),
+        ttl_seconds=float(
+            os.environ.get("HARMONIC_ANALYSIS_JOB_TTL", DEFAULT_TTL_SECONDS)
+        ),
+    )
@@ -7,12 +7,30 @@ This module provides the main entry point for the REST API server.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
 
 
+@asynccontextmanager
+async def lifespan(app: "FastAPI") -> AsyncIterator[None]:
+    """
+    Build and warm the shared services before the app accepts requests.
+
+    Startup finishes only after the warm-up analysis, so the server never
+    serves a request from a cold service; shutdown stops their worker pools.
+    """
+    from .state import start_services, stop_services
+
+    app.state.services = await start_services()
+    try:
+        yield
+    finally:
+        stop_services()
+
+
 def create_app() -> "FastAPI":
     """
     Create and configure the FastAPI application.
@@ -49,6 +67,7 @@ def create_app() -> "FastAPI":
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
 
     # Big play: configure CORS for local development
@@ -63,6 +63,20 @@ class ProgressionRequest(BaseModel):
         return value  # type: ignore[no-any-return]
 
 
+# Largest batch accepted by /api/analyze/batch in one request
+MAX_BATCH_ITEMS = 1000
+
+
+class BatchAnalysisRequest(BaseModel):
+    """Request model for analyzing many progressions in one call."""
+
+    items: List[ProgressionRequest] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Progressions to analyze (same shape as /api/analyze)",
+    )
+
+
 class ScaleRequest(BaseModel):
     """Request model for dedicated scale analysis."""
 
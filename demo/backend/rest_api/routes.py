@@ -7,29 +7,44 @@ These routes handle chord/roman/melody/scale analysis plus file uploads.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
 import re
+import shutil
 import tempfile
 from dataclasses import asdict
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from harmonic_analysis import ALL_KEYS
 from harmonic_analysis.api.analysis import analyze_melody, analyze_scale
 from harmonic_analysis.core.pattern_engine.glossary_provider import GlossaryProvider
+from harmonic_analysis.services.analysis_executor import AnalysisQueueFullError
 from harmonic_analysis.services.pattern_analysis_service import PatternAnalysisService
 
-# Educational imports with graceful fallback
-try:
-    from harmonic_analysis.educational import EducationalService, is_available
-
-    EDUCATIONAL_AVAILABLE = is_available()
-except ImportError:
-    EDUCATIONAL_AVAILABLE = False
-    EducationalService = None  # type: ignore
-
-from .models import MelodyRequest, ProgressionRequest, ScaleRequest
+from .cache import CacheEntry, cache_key
+from .jobs import JobQueueFullError
+from .models import (
+    BatchAnalysisRequest,
+    MelodyRequest,
+    ProgressionRequest,
+    ScaleRequest,
+)
+from .state import AppServices, current_services, get_services
 
 # Kickoff: Constants from demo
 MISSING_SCALE_KEY_MSG = (
@@ -38,17 +53,18 @@ MISSING_SCALE_KEY_MSG = (
 MISSING_MELODY_KEY_MSG = (
     "Melody analysis requires a key context. Please provide --key parameter."
 )
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
-# Main play: Initialize services
+# Main play: services live for the whole application (see state.py)
 def get_service() -> PatternAnalysisService:
-    """Get or create the pattern analysis service."""
-    return PatternAnalysisService()
+    """Get the shared pattern analysis service."""
+    return get_services().analysis
 
 
 def get_glossary_provider() -> GlossaryProvider:
-    """Get or create the glossary service."""
-    return GlossaryProvider()
+    """Get the shared glossary service."""
+    return get_services().glossary
 
 
 # Helper functions
@@ -137,9 +153,9 @@ def _serialize_envelope(
 
     # Big play: add educational content if requested and available
     educational_payload = None
-    if include_educational and EDUCATIONAL_AVAILABLE:
+    edu_service = get_services().educational if include_educational else None
+    if edu_service is not None:
         try:
-            edu_service = EducationalService()
             # Extract patterns from primary analysis
             patterns = []
             if envelope.primary and hasattr(envelope.primary, "patterns"):
@@ -217,65 +233,198 @@ def root() -> Dict[str, Any]:
         "version": "1.0.0",
         "endpoints": {
             "progression": "/api/analyze (POST)",
+            "batch": "/api/analyze/batch (POST, NDJSON response)",
             "scale": "/api/analyze/scale (POST)",
             "melody": "/api/analyze/melody (POST)",
             "file": "/api/analyze/file (POST)",
+            "file_job": "/api/jobs/file (POST, returns a job id)",
+            "job": "/api/jobs/{id} (GET)",
             "glossary": "/api/glossary/{term} (GET)",
+            "ready": "/api/ready (GET)",
+            "cache": "/api/cache (GET)",
             "docs": "/api/docs (GET)",
         },
     }
 
 
+# Route: Readiness probe
+@router.get("/api/ready")
+def readiness() -> JSONResponse:
+    """
+    Report whether the shared services are built and warmed up.
+
+    Returns 503 until the startup warm-up analysis has finished, with the
+    build and warm-up times once it has.
+    """
+    services = current_services()
+    if services is None:
+        return JSONResponse(status_code=503, content={"ready": False})
+    return JSONResponse(
+        status_code=200 if services.ready else 503, content=services.to_dict()
+    )
+
+
+# Route: Response cache statistics
+@router.get("/api/cache")
+def cache_stats() -> Dict[str, Any]:
+    """Report response cache size and hit/miss/eviction counters."""
+    return get_services().response_cache.to_dict()
+
+
+def _tokens(items: List[str]) -> List[str]:
+    """Trim whitespace around input tokens (" G7" analyzes differently)."""
+    return [item.strip() for item in items]
+
+
+def _progression_kwargs(request: ProgressionRequest) -> Dict[str, Any]:
+    """
+    Map a progression request to normalized analyze_with_patterns() arguments.
+
+    Raises:
+        HTTPException: 400 if the request has no input
+    """
+    common = {
+        "profile": request.profile or "classical",
+        "key_hint": resolve_key_input(request.key),
+    }
+    if request.chords:
+        return {"chord_symbols": _tokens(request.chords), **common}
+    if request.romans:
+        return {"romans": _tokens(request.romans), **common}
+    if request.melody:
+        return {"melody": _tokens(request.melody), **common}
+    if request.scales:
+        return {"notes": _tokens(request.scales[0]), **common}
+    raise HTTPException(
+        status_code=400,
+        detail="Must provide chords, romans, melody, or scale input",
+    )
+
+
+async def _analyze_progression(
+    services: AppServices, request: ProgressionRequest
+) -> CacheEntry:
+    """
+    Analyze one progression request, serving repeats from the response cache.
+
+    The cache key covers the normalized input, its type, the resolved key,
+    the profile and whether educational content was requested. Errors are
+    never cached.
+
+    Raises:
+        HTTPException: 400 for invalid input, 503 when the analysis queue
+            is full
+    """
+    kwargs = _progression_kwargs(request)
+    key = cache_key(
+        "analyze", {**kwargs, "include_educational": request.include_educational}
+    )
+    entry = services.response_cache.get(key)
+    if entry is not None:
+        return entry
+
+    try:
+        envelope = await services.analysis.analyze_with_patterns_async(**kwargs)
+    except AnalysisQueueFullError as exc:
+        # Shed load early instead of queueing behind the backlog
+        raise HTTPException(status_code=503, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return services.response_cache.put(
+        key,
+        _serialize_envelope(envelope, include_educational=request.include_educational),
+    )
+
+
 # Route: Progression analysis (chords/romans/melody/scale)
 @router.post("/api/analyze")
-async def analyze_progression_endpoint(request: ProgressionRequest) -> Dict[str, Any]:
+async def analyze_progression_endpoint(
+    request: ProgressionRequest, http_request: Request
+) -> Response:
     """
     Analyze chord progressions, roman numerals, melodies, or scales.
 
     Main play: Route the request to appropriate analyzer based on input type.
-    This unified endpoint handles all four analysis modes.
+    This unified endpoint handles all four analysis modes. Responses carry an
+    ETag; a matching If-None-Match gets an empty 304.
     """
-    service = get_service()
+    entry = await _analyze_progression(get_services(), request)
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if entry.matches(http_request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
 
-    try:
-        # Prepare input based on request type
-        # Use unified service for all analysis types
-        if request.chords:
-            envelope = await service.analyze_with_patterns_async(
-                chord_symbols=request.chords,
-                profile=request.profile or "classical",
-                key_hint=resolve_key_input(request.key),
-            )
-        elif request.romans:
-            envelope = await service.analyze_with_patterns_async(
-                romans=request.romans,
-                profile=request.profile or "classical",
-                key_hint=resolve_key_input(request.key),
-            )
-        elif request.melody:
-            envelope = await service.analyze_with_patterns_async(
-                melody=request.melody,
-                profile=request.profile or "classical",
-                key_hint=resolve_key_input(request.key),
+
+async def _stream_batch(
+    services: AppServices, request: BatchAnalysisRequest
+) -> AsyncIterator[bytes]:
+    """
+    Analyze batch items concurrently, yielding NDJSON lines as each finishes.
+
+    At most twice the executor's in-flight limit is submitted at a time, so a
+    large batch waits here instead of filling (or overflowing) the shared
+    analysis queue ahead of other clients.
+    """
+
+    def line(payload: Dict[str, Any]) -> bytes:
+        return (json.dumps(payload) + "\n").encode()
+
+    async def run(index: int, item: ProgressionRequest) -> bytes:
+        try:
+            entry = await _analyze_progression(services, item)
+        except HTTPException as exc:
+            return line(
+                {"index": index, "status": exc.status_code, "error": exc.detail}
             )
-        elif request.scales:
-            envelope = await service.analyze_with_patterns_async(
-                notes=request.scales[0],
-                profile=request.profile or "classical",
-                key_hint=resolve_key_input(request.key),
+        except Exception as exc:
+            return line(
+                {"index": index, "status": 500, "error": f"Analysis failed: {exc}"}
             )
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail="Must provide chords, romans, melody, or scale input",
+        # Splice the cached body in rather than re-serializing it
+        return b'{"index": %d, "status": 200, "result": %s}\n' % (index, entry.body)
+
+    window = services.analysis.executor.config.in_flight_limit * 2
+    items: Iterator[Tuple[int, ProgressionRequest]] = enumerate(request.items)
+    pending: Set["asyncio.Task[bytes]"] = set()
+    try:
+        while True:
+            # Opening move: top the window up with the next items
+            for index, item in items:
+                pending.add(asyncio.ensure_future(run(index, item)))
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+
+            # Main play: stream whatever finished first
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
             )
+            for task in done:
+                yield task.result()
+    finally:
+        # Client went away: don't keep analyzing for nobody
+        for task in pending:
+            task.cancel()
 
-        return _serialize_envelope(
-            envelope, include_educational=request.include_educational
-        )
 
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc))
+# Route: Batch progression analysis
+@router.post("/api/analyze/batch")
+async def analyze_batch_endpoint(request: BatchAnalysisRequest) -> StreamingResponse:
+    """
+    Analyze many progressions in one request.
+
+    Big play: items fan out over the shared service's executor and each
+    result streams back as one JSON line the moment it is ready, tagged with
+    its input index (so lines arrive in completion order). A failing item
+    yields an inline ``{"index", "status", "error"}`` line instead of
+    failing the batch; successful lines carry the /api/analyze response as
+    ``result``.
+    """
+    return StreamingResponse(
+        _stream_batch(get_services(), request), media_type="application/x-ndjson"
+    )
 
 
 # Route: Dedicated scale analysis
@@ -314,6 +463,72 @@ async def analyze_melody_endpoint(request: MelodyRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=400, detail=str(exc))
 
 
+async def _save_upload(file: UploadFile) -> Tuple[str, str]:
+    """
+    Stream an upload to a private temp directory, hashing it on the way.
+
+    Each upload gets its own directory, so concurrent uploads of the same
+    filename never collide, while the file keeps its (basename) name for
+    the titles and logs file processing derives from it.
+
+    Returns:
+        (path of the saved file, SHA-256 hex digest of its contents)
+    """
+    upload_dir = tempfile.mkdtemp(prefix="upload_")
+    file_path = os.path.join(upload_dir, f"upload_{os.path.basename(file.filename)}")
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        raise
+    return file_path, digest.hexdigest()
+
+
+def _check_upload_name(file: UploadFile) -> None:
+    """
+    Reject uploads without a supported score file name.
+
+    Raises:
+        HTTPException: 400 for a missing name or unsupported extension
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No filename provided")
+
+    file_ext = os.path.splitext(file.filename)[1].lower()
+    if file_ext not in [".xml", ".mxl", ".mid", ".midi"]:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unsupported file format: {file_ext}. "
+                "Expected .xml, .mxl, .mid, or .midi"
+            ),
+        )
+
+
+def _file_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape analyze_uploaded_file() output into the file analysis response."""
+    return {
+        "chord_symbols": result["chord_symbols"],
+        "chordified_symbols_with_measures": result.get(
+            "chordified_symbols_with_measures", []
+        ),
+        "key_hint": result.get("key_hint"),
+        "metadata": result.get("metadata", {}),
+        "notation_url": result.get("notation_url"),
+        "download_url": result.get("download_url"),
+        "analysis_result": result.get("analysis_result"),
+        "measure_count": result.get("measure_count", 0),
+        "truncated_for_display": result.get("truncated_for_display", False),
+        "is_midi": result.get("is_midi", False),
+        "parsing_logs": result.get("parsing_logs"),
+        "window_size_used": result.get("window_size_used"),
+    }
+
+
 # Route: File upload analysis
 @router.post("/api/analyze/file")
 async def analyze_file_endpoint(
@@ -331,34 +546,20 @@ async def analyze_file_endpoint(
     Upload and analyze MusicXML or MIDI files.
 
     Opening move: Accept file upload with configuration options.
-    Main play: Parse file, extract chords, optionally run analysis.
+    Main play: Parse file, extract chords, optionally run analysis. Re-uploads
+    of an identical file with the same options reuse the cached parse.
     Victory lap: Return chord symbols, key, metadata, and notation files.
+
+    Long runs (e.g. process_full_file) hold the request open; prefer
+    POST /api/jobs/file for those.
     """
     # Opening move: validate file type
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided")
-
-    file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in [".xml", ".mxl", ".mid", ".midi"]:
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"Unsupported file format: {file_ext}. "
-                "Expected .xml, .mxl, .mid, or .midi"
-            ),
-        )
+    _check_upload_name(file)
 
-    # Main play: save uploaded file to temp location
+    # Main play: stream uploaded file to temp location
+    temp_file_path, content_hash = await _save_upload(file)
+    services = get_services()
     try:
-        # Create temp file with proper extension
-        temp_dir = tempfile.gettempdir()
-        temp_file_path = os.path.join(temp_dir, f"upload_{file.filename}")
-
-        # Write uploaded content
-        contents = await file.read()
-        with open(temp_file_path, "wb") as f:
-            f.write(contents)
-
         # Process the file using library's file processing
         from demo.lib.music_file_processing import analyze_uploaded_file
 
@@ -372,25 +573,13 @@ async def analyze_file_endpoint(
             auto_window=auto_window,
             manual_window_size=manual_window_size,
             key_mode_preference=key_mode_preference,
+            parse_cache=services.parse_cache,
+            content_hash=content_hash,
+            service=services.analysis,
         )
 
         # Victory lap: return comprehensive results
-        return {
-            "chord_symbols": result["chord_symbols"],
-            "chordified_symbols_with_measures": result.get(
-                "chordified_symbols_with_measures", []
-            ),
-            "key_hint": result.get("key_hint"),
-            "metadata": result.get("metadata", {}),
-            "notation_url": result.get("notation_url"),
-            "download_url": result.get("download_url"),
-            "analysis_result": result.get("analysis_result"),
-            "measure_count": result.get("measure_count", 0),
-            "truncated_for_display": result.get("truncated_for_display", False),
-            "is_midi": result.get("is_midi", False),
-            "parsing_logs": result.get("parsing_logs"),
-            "window_size_used": result.get("window_size_used"),
-        }
+        return _file_response(result)
 
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
@@ -399,12 +588,93 @@ async def analyze_file_endpoint(
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"File processing failed: {exc}")
     finally:
-        # Cleanup: remove temp uploaded file
-        if os.path.exists(temp_file_path):
-            try:
-                os.remove(temp_file_path)
-            except Exception:
-                pass  # Best effort cleanup
+        # Cleanup: remove temp uploaded file (best effort)
+        shutil.rmtree(os.path.dirname(temp_file_path), ignore_errors=True)
+
+
+# Route: Background file analysis
+@router.post("/api/jobs/file", status_code=202)
+async def submit_file_job_endpoint(
+    file: UploadFile = File(...),
+    add_chordify: bool = Form(True),
+    label_chords: bool = Form(True),
+    run_analysis: bool = Form(False),
+    profile: str = Form("classical"),
+    process_full_file: bool = Form(False),
+    auto_window: bool = Form(True),
+    manual_window_size: float = Form(1.0),
+    key_mode_preference: str = Form("Major"),
+) -> JSONResponse:
+    """
+    Queue an uploaded MusicXML or MIDI file for background analysis.
+
+    Takes the same form fields as /api/analyze/file but answers 202 as soon
+    as the upload is saved, with the job id to poll at /api/jobs/{id}. The
+    job's result is the /api/analyze/file response. 503 when the job queue
+    is full.
+    """
+    _check_upload_name(file)
+    temp_file_path, content_hash = await _save_upload(file)
+    services = get_services()
+    # The app's warmed service, shut down with it in stop_services()
+    analysis = services.analysis
+
+    def cleanup() -> None:
+        shutil.rmtree(os.path.dirname(temp_file_path), ignore_errors=True)
+
+    def work(report: Callable[[str, float], None]) -> Dict[str, Any]:
+        from demo.lib.music_file_processing import analyze_uploaded_file
+
+        # Main play: runs on a job worker thread, on its own event loop
+        try:
+            result = asyncio.run(
+                analyze_uploaded_file(
+                    file_path=temp_file_path,
+                    add_chordify=add_chordify,
+                    label_chords=label_chords,
+                    run_analysis=run_analysis,
+                    profile=profile,
+                    process_full_file=process_full_file,
+                    auto_window=auto_window,
+                    manual_window_size=manual_window_size,
+                    key_mode_preference=key_mode_preference,
+                    parse_cache=services.parse_cache,
+                    content_hash=content_hash,
+                    on_progress=report,
+                    service=analysis,
+                )
+            )
+        finally:
+            cleanup()
+        return _file_response(result)
+
+    try:
+        # The upload is removed by the job, or on_cancel if it never runs
+        job = services.jobs.submit(work, on_cancel=cleanup)
+    except JobQueueFullError as exc:
+        cleanup()
+        raise HTTPException(status_code=503, detail=str(exc))
+
+    return JSONResponse(
+        status_code=202,
+        content=job.to_dict(),
+        headers={"Location": f"/api/jobs/{job.id}"},
+    )
+
+
+# Route: Background job status
+@router.get("/api/jobs/{job_id}")
+def job_status_endpoint(job_id: str) -> Dict[str, Any]:
+    """
+    Report a job's status, stage and progress, plus its result once done.
+
+    Status is queued, running, succeeded (with ``result``) or failed (with
+    ``error``). Finished jobs are kept for the job TTL, then 404.
+    """
+    job = get_services().jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired job: {job_id}")
+    return job.to_dict()
 
 
 # Route: Glossary lookup
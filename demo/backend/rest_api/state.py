@@ -0,0 +1,157 @@
+"""
+Application-lifetime services for the REST API.
+
+Opening move: build the analysis service, glossary and educational service
+once per process and warm them up before the app accepts traffic. Building a
+PatternAnalysisService loads patterns, the glossary and the calibration
+mapping; doing that per request was the largest fixed cost of every call.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from demo.lib.parse_cache import ParseCache, parse_cache_from_env
+from harmonic_analysis.core.pattern_engine.glossary_provider import GlossaryProvider
+from harmonic_analysis.services.pattern_analysis_service import PatternAnalysisService
+
+from .cache import ResponseCache, cache_from_env
+from .jobs import JobQueue, job_queue_from_env
+
+# Educational imports with graceful fallback
+try:
+    from harmonic_analysis.educational import EducationalService, is_available
+
+    EDUCATIONAL_AVAILABLE = is_available()
+except ImportError:
+    EDUCATIONAL_AVAILABLE = False
+    EducationalService = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Dummy analysis run during warm-up (exercises matching, calibration, glossary)
+WARMUP_INPUT: Dict[str, Any] = {
+    "chord_symbols": ["C", "Am", "F", "G7", "C"],
+    "key_hint": "C major",
+}
+
+
+@dataclass
+class AppServices:
+    """Services shared by every request."""
+
+    analysis: PatternAnalysisService
+    glossary: GlossaryProvider
+    educational: Optional[Any] = None
+    response_cache: ResponseCache = field(default_factory=cache_from_env)
+    """Serialized responses of the analysis routes."""
+
+    parse_cache: ParseCache = field(default_factory=parse_cache_from_env)
+    """Parsed/chordified results of uploaded score files."""
+
+    jobs: JobQueue = field(default_factory=job_queue_from_env)
+    """Background jobs (long-running file analyses)."""
+
+    build_ms: float = 0.0
+    """Time spent constructing the services."""
+
+    warmup_ms: Optional[float] = None
+    """Time spent on the warm-up analysis (None until warmed)."""
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm-up has completed."""
+        return self.warmup_ms is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Readiness report for the /api/ready endpoint."""
+        return {
+            "ready": self.ready,
+            "build_ms": round(self.build_ms, 2),
+            "warmup_ms": None if self.warmup_ms is None else round(self.warmup_ms, 2),
+            "educational_available": self.educational is not None,
+        }
+
+
+_lock = threading.Lock()
+_services: Optional[AppServices] = None
+
+
+def build_services() -> AppServices:
+    """Construct the shared services (not yet warmed)."""
+    started = time.perf_counter()
+    educational = None
+    if EDUCATIONAL_AVAILABLE:
+        try:
+            educational = EducationalService()
+        except Exception as e:
+            logger.warning(f"⚠️ Educational service unavailable: {e}")
+    services = AppServices(
+        analysis=PatternAnalysisService(),
+        glossary=GlossaryProvider(),
+        educational=educational,
+    )
+    services.build_ms = (time.perf_counter() - started) * 1000
+    return services
+
+
+async def warm_up(services: AppServices) -> None:
+    """
+    Run one dummy analysis through the async path.
+
+    Main play: this starts the executor's worker threads and touches every
+    lazily loaded piece (compiled patterns, calibration, knowledge base), so
+    the first real request pays none of it.
+    """
+    started = time.perf_counter()
+    envelope = await services.analysis.analyze_with_patterns_async(**WARMUP_INPUT)
+    if services.educational is not None:
+        services.educational.enrich_analysis(envelope.primary.patterns)
+    services.warmup_ms = (time.perf_counter() - started) * 1000
+    logger.info(
+        f"✅ REST services ready: build={services.build_ms:.1f}ms, "
+        f"warm-up={services.warmup_ms:.1f}ms"
+    )
+
+
+async def start_services() -> AppServices:
+    """Build, warm and install the shared services (app startup)."""
+    global _services
+    services = build_services()
+    await warm_up(services)
+    with _lock:
+        _services = services
+    return services
+
+
+def stop_services() -> None:
+    """Shut down the shared services' pools (app shutdown)."""
+    global _services
+    with _lock:
+        services, _services = _services, None
+    if services is not None:
+        services.jobs.close()
+        services.analysis.close()
+
+
+def current_services() -> Optional[AppServices]:
+    """Return the installed services, or None before startup."""
+    return _services
+
+
+def get_services() -> AppServices:
+    """
+    Return the shared services.
+
+    Normally installed by the app lifespan; when routes are used without it
+    (e.g. a bare router in tests) they are built on first use, unwarmed.
+    """
+    global _services
+    with _lock:
+        if _services is None:
+            _services = build_services()
+        return _services
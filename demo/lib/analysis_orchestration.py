@@ -10,7 +10,6 @@ Coordinates the analysis pipeline:
 This module is the bridge between UI inputs and the analysis library.
 """
 
-import asyncio
 from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 
 if TYPE_CHECKING:
@@ -285,5 +284,8 @@ async def run_analysis_async(
 def run_analysis_sync(
     chord_symbols: List[str], profile: str, key_hint: Optional[str]
 ) -> Any:
-    """Synchronous wrapper for CLI usage."""
-    return asyncio.run(run_analysis_async(chord_symbols, profile, key_hint))
+    """Synchronous analysis for CLI usage (no event loop involved)."""
+    service = get_service()
+    return service.analyze_with_patterns(
+        chord_symbols=chord_symbols, profile=profile, key_hint=key_hint
+    )
@@ -26,15 +26,21 @@ import uuid
 import warnings
 from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from demo.lib.analysis_orchestration import get_service
+from demo.lib.parse_cache import ParseCache, hash_file
 from harmonic_analysis.core.utils.chord_detection import detect_chord_from_pitches
 from harmonic_analysis.core.utils.key_signature import (
     convert_key_signature_to_mode,
     parse_key_signature_from_hint,
 )
 
+if TYPE_CHECKING:
+    from harmonic_analysis.services.pattern_analysis_service import (
+        PatternAnalysisService,
+    )
+
 # Maximum number of measures to include in notation viewer for large files
 # (MIDI files can create massive MusicXML that browsers can't handle)
 # Reduced to 20 for better OSMD performance with dense piano music
@@ -56,6 +62,10 @@ async def analyze_uploaded_file(
     auto_window: bool = True,
     manual_window_size: float = 1.0,
     key_mode_preference: str = "Major",
+    parse_cache: Optional[ParseCache] = None,
+    content_hash: Optional[str] = None,
+    on_progress: Optional[Callable[[str, float], None]] = None,
+    service: Optional[PatternAnalysisService] = None,
 ) -> Dict[str, Any]:
     """
     Process uploaded MusicXML/MIDI file with optional chordify and analysis.
@@ -88,6 +98,14 @@ async def analyze_uploaded_file(
         auto_window: Whether to auto-calculate window size from tempo
         manual_window_size: Manual window size in quarter lengths (if auto_window=False)
         key_mode_preference: "Major" or "Minor" for key signature interpretation
+        parse_cache: Optional cache of parsed/chordified results; a hit skips
+            music21 entirely and only re-runs the (cheap) harmonic analysis
+        content_hash: SHA-256 of the file, if the caller already computed it
+            (e.g. while streaming an upload); hashed here otherwise
+        on_progress: Optional callback receiving (stage, fraction done) as
+            the coarse steps (parsing, analyzing) start
+        service: Analysis service to run on (e.g. the app's warmed one);
+            defaults to the shared demo service
 
     Returns:
         Dictionary containing:
@@ -121,6 +139,230 @@ async def analyze_uploaded_file(
         >>> print(result['analysis_result']['primary']['interpretation'])
         'I - vi - IV - V (Functional cadence in C major)'
     """
+
+    # Opening move: parse/chordify/export, or reuse a cached run for this file
+    def report(stage: str, progress: float) -> None:
+        if on_progress is not None:
+            on_progress(stage, progress)
+
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    processing_options = {
+        "add_chordify": add_chordify,
+        "label_chords": label_chords,
+        "process_full_file": process_full_file,
+        "auto_window": auto_window,
+        "manual_window_size": manual_window_size,
+    }
+    processed = None
+    if parse_cache is not None:
+        cache_key = parse_cache.key(
+            content_hash or hash_file(file_path),
+            {"filename": os.path.basename(file_path), **processing_options},
+        )
+        processed = parse_cache.get(cache_key)
+        if processed is not None:
+            processed["metadata"]["file_path"] = file_path
+            processed["parsing_logs"].append(
+                "♻️  Reused cached parse of identical file (music21 skipped)"
+            )
+    if processed is None:
+        report("parsing", 0.05)
+        processed = process_score_file(file_path, **processing_options)
+        if parse_cache is not None:
+            parse_cache.put(cache_key, processed)
+
+    chord_symbols = processed["chord_symbols"]
+    chordified_symbols_with_measures = processed["chordified_symbols_with_measures"]
+    key_hint = processed["key_hint"]
+    parsing_logs = processed["parsing_logs"]
+
+    # Convert key signature to major or minor based on user preference
+    # This ensures analysis uses the correct tonal center (e.g., B minor vs D major for 2 sharps)
+    if key_hint and run_analysis:
+        sharps_flats = parse_key_signature_from_hint(key_hint)
+        prefer_minor = key_mode_preference == "Minor"
+        converted_key = convert_key_signature_to_mode(sharps_flats, prefer_minor)
+        print(
+            f"DEBUG: Key conversion - Original: {key_hint}, Preference: {key_mode_preference}, Converted: {converted_key}"
+        )
+        key_hint_for_analysis = converted_key
+    else:
+        key_hint_for_analysis = key_hint
+
+    # Optional: run harmonic analysis
+    # CRITICAL: Use chordified symbols if available, otherwise fall back to original
+    analysis_result = None
+    analysis_chord_data = None  # Will contain chord symbols with measure numbers
+
+    # Opening move: add diagnostic logging to trace analysis execution
+    print(
+        f"DEBUG: run_analysis parameter received: {run_analysis} (type: {type(run_analysis)})"
+    )
+
+    if run_analysis:
+        # Use chordified symbols if we created them, otherwise use original
+        if chordified_symbols_with_measures:
+            analysis_chords = [
+                item["chord"] for item in chordified_symbols_with_measures
+            ]
+            analysis_chord_data = chordified_symbols_with_measures
+        elif chord_symbols:
+            analysis_chords = chord_symbols
+            analysis_chord_data = [
+                {"measure": i + 1, "chord": c, "offset": None}
+                for i, c in enumerate(chord_symbols)
+            ]
+        else:
+            analysis_chords = []
+
+        # Main play: log chord data prepared for analysis
+        print(f"DEBUG: Analysis chords prepared: {len(analysis_chords)} chords")
+        print(
+            f"DEBUG: First 3 chords: {analysis_chords[:3] if analysis_chords else 'None'}"
+        )
+
+        if analysis_chords:
+            report("analyzing", 0.9)
+            if service is None:
+                service = get_service()
+            try:
+                # Big play: kick off the harmonic analysis pipeline
+                print(
+                    f"DEBUG: Starting harmonic analysis with key_hint: {key_hint_for_analysis}, profile: {profile}"
+                )
+                analysis_result = await service.analyze_with_patterns_async(
+                    chord_symbols=analysis_chords,
+                    key_hint=key_hint_for_analysis,  # Use converted key based on user preference
+                    profile=profile,
+                )
+                print(
+                    f"DEBUG: Analysis completed successfully. Result type: {type(analysis_result)}"
+                )
+            except Exception as e:
+                # Victory lap gone wrong: surface the error properly for debugging
+                import traceback
+
+                error_msg = f"Analysis failed: {e}"
+                print(f"ERROR: {error_msg}")
+                traceback.print_exc()
+
+                # Add to parsing logs so frontend users can see what happened
+                parsing_logs.append(f"\n❌ Analysis Error: {error_msg}")
+                parsing_logs.append(
+                    f"   File processing succeeded, but harmonic analysis failed"
+                )
+
+                warnings.warn(error_msg, UserWarning)
+
+    # Transform analysis result to match frontend's expected structure
+    # Frontend expects: { summary, analysis: { primary, alternatives }, enhanced_summaries }
+    # Backend provides: AnalysisEnvelope with { primary, alternatives }
+    transformed_analysis = None
+    if analysis_result:
+        result_dict = asdict(analysis_result)
+
+        # Transform primary and alternatives: add 'key' alias while preserving 'key_signature'
+        def transform_interpretation(interp: dict) -> dict:
+            """Transform interpretation to match frontend structure."""
+            transformed = interp.copy()
+            # Create 'key' alias for frontend compatibility while preserving canonical 'key_signature'
+            # Dual-field contract: API consumers expect 'key_signature', frontend UI expects 'key'
+            if "key_signature" in transformed:
+                transformed["key"] = transformed.get("key_signature")
+            return transformed
+
+        primary = transform_interpretation(result_dict["primary"])
+        alternatives = [
+            transform_interpretation(alt) for alt in result_dict.get("alternatives", [])
+        ]
+
+        # Create summary text (convert enum to string if needed)
+        analysis_type = primary["type"]
+        if hasattr(analysis_type, "value"):
+            analysis_type = analysis_type.value
+        elif isinstance(analysis_type, str) and "." in analysis_type:
+            # Handle "AnalysisType.FUNCTIONAL" string format
+            analysis_type = analysis_type.split(".")[-1].lower()
+        summary = f"{analysis_type} analysis in {primary.get('key', 'unknown key')} with {(primary['confidence'] * 100):.1f}% confidence"
+
+        # Build enhanced_summaries from patterns
+        enhanced_summaries = {}
+        if primary.get("patterns"):
+            # Extract pattern names
+            enhanced_summaries["patterns_detected"] = [
+                p.get("name", "Unknown pattern") for p in primary["patterns"]
+            ]
+
+        # Build final structure matching frontend expectations
+        transformed_analysis = {
+            "summary": summary,
+            "analysis": {
+                "primary": primary,
+                "alternatives": alternatives,
+            },
+            "enhanced_summaries": enhanced_summaries if enhanced_summaries else None,
+        }
+
+    # Victory lap: return comprehensive results
+    return {
+        "chord_symbols": chord_symbols,
+        "chordified_symbols_with_measures": chordified_symbols_with_measures,  # Chords with measure info
+        "key_hint": key_hint,
+        "metadata": processed["metadata"],
+        "notation_url": processed[
+            "notation_url"
+        ],  # MusicXML file for OSMD viewer (always 20 measures)
+        "download_url": processed[
+            "download_url"
+        ],  # MusicXML file for download (full or preview)
+        "analysis_result": transformed_analysis,
+        "measure_count": processed["measure_count"],  # Total measures in score
+        "truncated_for_display": processed["measure_count"]
+        > MAX_MEASURES_FOR_DISPLAY,  # Whether notation was truncated
+        "is_midi": processed["is_midi"],  # Flag for MIDI warning display
+        "parsing_logs": (
+            "\n".join(parsing_logs) if parsing_logs else None
+        ),  # Parsing logs and warnings
+        "window_size_used": processed[
+            "window_size_used"
+        ],  # Window size used for chord detection (None if no chordify)
+    }
+
+
+def process_score_file(
+    file_path: str,
+    add_chordify: bool = True,
+    label_chords: bool = True,
+    process_full_file: bool = False,
+    auto_window: bool = True,
+    manual_window_size: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Parse, chordify, label and export a score file (the music21 stage).
+
+    This is the slow part of analyze_uploaded_file() - seconds for a short
+    score, minutes for a full-file chordify - and depends only on the file
+    and these options, which is what makes its output cacheable.
+
+    Args:
+        file_path: Path to the file (.xml, .mxl, .mid, .midi)
+        add_chordify: Whether to add chordify staff to score
+        label_chords: Whether to add chord symbol labels
+        process_full_file: Whether to process entire file (vs first 20 measures)
+        auto_window: Whether to auto-calculate window size from tempo
+        manual_window_size: Manual window size in quarter lengths (if auto_window=False)
+
+    Returns:
+        Dictionary with chord_symbols, chordified_symbols_with_measures,
+        key_hint, metadata, notation_url, download_url, measure_count,
+        is_midi, parsing_logs (list of lines) and window_size_used
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format unsupported or parsing fails
+    """
     # Opening move: import music21 integration and check file exists
     # Capture warnings during file parsing
     from harmonic_analysis.integrations.music21_adapter import Music21Adapter
@@ -208,19 +450,6 @@ async def analyze_uploaded_file(
     key_hint = data["key_hint"]
     metadata = data["metadata"]
 
-    # Convert key signature to major or minor based on user preference
-    # This ensures analysis uses the correct tonal center (e.g., B minor vs D major for 2 sharps)
-    if key_hint and run_analysis:
-        sharps_flats = parse_key_signature_from_hint(key_hint)
-        prefer_minor = key_mode_preference == "Minor"
-        converted_key = convert_key_signature_to_mode(sharps_flats, prefer_minor)
-        print(
-            f"DEBUG: Key conversion - Original: {key_hint}, Preference: {key_mode_preference}, Converted: {converted_key}"
-        )
-        key_hint_for_analysis = converted_key
-    else:
-        key_hint_for_analysis = key_hint
-
     # Initialize window info
     final_window_size = None  # Will be set if chordify is enabled
     chordified_symbols_with_measures = (
@@ -585,133 +814,15 @@ async def analyze_uploaded_file(
             f.write(error_xml)
         print(f"DEBUG: Created placeholder MusicXML file due to export error")
 
-    # Optional: run harmonic analysis
-    # CRITICAL: Use chordified symbols if available, otherwise fall back to original
-    analysis_result = None
-    analysis_chord_data = None  # Will contain chord symbols with measure numbers
-
-    # Opening move: add diagnostic logging to trace analysis execution
-    print(
-        f"DEBUG: run_analysis parameter received: {run_analysis} (type: {type(run_analysis)})"
-    )
-
-    if run_analysis:
-        # Use chordified symbols if we created them, otherwise use original
-        if chordified_symbols_with_measures:
-            analysis_chords = [
-                item["chord"] for item in chordified_symbols_with_measures
-            ]
-            analysis_chord_data = chordified_symbols_with_measures
-        elif chord_symbols:
-            analysis_chords = chord_symbols
-            analysis_chord_data = [
-                {"measure": i + 1, "chord": c, "offset": None}
-                for i, c in enumerate(chord_symbols)
-            ]
-        else:
-            analysis_chords = []
-
-        # Main play: log chord data prepared for analysis
-        print(f"DEBUG: Analysis chords prepared: {len(analysis_chords)} chords")
-        print(
-            f"DEBUG: First 3 chords: {analysis_chords[:3] if analysis_chords else 'None'}"
-        )
-
-        if analysis_chords:
-            service = get_service()
-            try:
-                # Big play: kick off the harmonic analysis pipeline
-                print(
-                    f"DEBUG: Starting harmonic analysis with key_hint: {key_hint_for_analysis}, profile: {profile}"
-                )
-                analysis_result = await service.analyze_with_patterns_async(
-                    chord_symbols=analysis_chords,
-                    key_hint=key_hint_for_analysis,  # Use converted key based on user preference
-                    profile=profile,
-                )
-                print(
-                    f"DEBUG: Analysis completed successfully. Result type: {type(analysis_result)}"
-                )
-            except Exception as e:
-                # Victory lap gone wrong: surface the error properly for debugging
-                import traceback
-
-                error_msg = f"Analysis failed: {e}"
-                print(f"ERROR: {error_msg}")
-                traceback.print_exc()
-
-                # Add to parsing logs so frontend users can see what happened
-                parsing_logs.append(f"\n❌ Analysis Error: {error_msg}")
-                parsing_logs.append(
-                    f"   File processing succeeded, but harmonic analysis failed"
-                )
-
-                warnings.warn(error_msg, UserWarning)
-
-    # Transform analysis result to match frontend's expected structure
-    # Frontend expects: { summary, analysis: { primary, alternatives }, enhanced_summaries }
-    # Backend provides: AnalysisEnvelope with { primary, alternatives }
-    transformed_analysis = None
-    if analysis_result:
-        result_dict = asdict(analysis_result)
-
-        # Transform primary and alternatives: add 'key' alias while preserving 'key_signature'
-        def transform_interpretation(interp: dict) -> dict:
-            """Transform interpretation to match frontend structure."""
-            transformed = interp.copy()
-            # Create 'key' alias for frontend compatibility while preserving canonical 'key_signature'
-            # Dual-field contract: API consumers expect 'key_signature', frontend UI expects 'key'
-            if "key_signature" in transformed:
-                transformed["key"] = transformed.get("key_signature")
-            return transformed
-
-        primary = transform_interpretation(result_dict["primary"])
-        alternatives = [
-            transform_interpretation(alt) for alt in result_dict.get("alternatives", [])
-        ]
-
-        # Create summary text (convert enum to string if needed)
-        analysis_type = primary["type"]
-        if hasattr(analysis_type, "value"):
-            analysis_type = analysis_type.value
-        elif isinstance(analysis_type, str) and "." in analysis_type:
-            # Handle "AnalysisType.FUNCTIONAL" string format
-            analysis_type = analysis_type.split(".")[-1].lower()
-        summary = f"{analysis_type} analysis in {primary.get('key', 'unknown key')} with {(primary['confidence'] * 100):.1f}% confidence"
-
-        # Build enhanced_summaries from patterns
-        enhanced_summaries = {}
-        if primary.get("patterns"):
-            # Extract pattern names
-            enhanced_summaries["patterns_detected"] = [
-                p.get("name", "Unknown pattern") for p in primary["patterns"]
-            ]
-
-        # Build final structure matching frontend expectations
-        transformed_analysis = {
-            "summary": summary,
-            "analysis": {
-                "primary": primary,
-                "alternatives": alternatives,
-            },
-            "enhanced_summaries": enhanced_summaries if enhanced_summaries else None,
-        }
-
-    # Victory lap: return comprehensive results
     return {
         "chord_symbols": chord_symbols,
-        "chordified_symbols_with_measures": chordified_symbols_with_measures,  # Chords with measure info
+        "chordified_symbols_with_measures": chordified_symbols_with_measures,
         "key_hint": key_hint,
         "metadata": metadata,
-        "notation_url": notation_xml_path,  # MusicXML file for OSMD viewer (always 20 measures)
-        "download_url": download_xml_path,  # MusicXML file for download (full or preview)
-        "analysis_result": transformed_analysis,
-        "measure_count": measure_count,  # Total measures in score
-        "truncated_for_display": measure_count
-        > MAX_MEASURES_FOR_DISPLAY,  # Whether notation was truncated
-        "is_midi": is_midi,  # Flag for MIDI warning display
-        "parsing_logs": (
-            "\n".join(parsing_logs) if parsing_logs else None
-        ),  # Parsing logs and warnings
-        "window_size_used": final_window_size,  # Window size used for chord detection (None if no chordify)
+        "notation_url": notation_xml_path,
+        "download_url": download_xml_path,
+        "measure_count": measure_count,
+        "is_midi": is_midi,
+        "parsing_logs": parsing_logs,
+        "window_size_used": final_window_size,
     }
@@ -0,0 +1,191 @@
+"""
+On-disk cache of parsed and chordified score files.
+
+Parsing a MusicXML/MIDI file with music21, chordifying and exporting it takes
+seconds for a short score and minutes for a full-file chordify, and in
+classroom use the same files are uploaded over and over. This cache keeps
+the output of that stage (chords, key, metadata, measure count, logs and the
+two exported MusicXML files) keyed by the file's SHA-256 and the processing
+options, so a re-upload skips music21 entirely.
+
+Layout: one directory per entry holding entry.json, notation.xml and
+download.xml. Entries are written to a scratch directory and renamed into
+place, so concurrent writers and readers never see a partial entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from importlib import metadata as importlib_metadata
+from typing import Any, Dict, Optional
+
+from harmonic_analysis import __version__
+
+# Bump when the shape of cached entries changes
+PARSE_CACHE_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 256
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Exported MusicXML files copied in and out of each entry
+_XML_FILES = {"notation_url": "notation", "download_url": "download"}
+
+
+def hash_file(file_path: str) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _music21_version() -> str:
+    try:
+        return importlib_metadata.version("music21")
+    except importlib_metadata.PackageNotFoundError:
+        return "missing"
+
+
+class ParseCache:
+    """Directory of processed score files, keyed by content hash and options."""
+
+    def __init__(self, directory: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Where entries are stored (created if missing)
+            max_entries: Entries kept before the least recently used are
+                removed
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, content_hash: str, options: Dict[str, Any]) -> str:
+        """
+        Build the entry key for a file and its processing options.
+
+        The library and music21 versions are part of the key, so an upgrade
+        never serves output produced by older code.
+        """
+        canonical = json.dumps(
+            [
+                PARSE_CACHE_VERSION,
+                __version__,
+                _music21_version(),
+                content_hash,
+                options,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a processed result.
+
+        The cached MusicXML files are copied to fresh temp paths, like a
+        normal run produces, so callers may move or delete them freely.
+
+        Returns:
+            The result of process_score_file(), or None on a miss
+        """
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, "entry.json"), encoding="utf-8") as f:
+                processed = json.load(f)
+            file_uuid = str(uuid.uuid4())
+            for field, name in _XML_FILES.items():
+                target = os.path.join(tempfile.gettempdir(), f"{name}_{file_uuid}.xml")
+                shutil.copyfile(os.path.join(entry_dir, f"{name}.xml"), target)
+                processed[field] = target
+            # Mark as recently used for eviction
+            os.utime(entry_dir)
+        except (OSError, ValueError):
+            return None
+        return processed
+
+    def put(self, key: str, processed: Dict[str, Any]) -> bool:
+        """
+        Store a processed result.
+
+        Args:
+            key: Key from key()
+            processed: Result of process_score_file()
+
+        Returns:
+            Whether the entry was stored (results whose MusicXML export
+            failed, or that are not JSON-serializable, are skipped)
+        """
+        if not all(os.path.exists(processed[field]) for field in _XML_FILES):
+            return False
+
+        scratch = tempfile.mkdtemp(prefix=".incoming_", dir=self.directory)
+        try:
+            entry = {k: v for k, v in processed.items() if k not in _XML_FILES}
+            with open(os.path.join(scratch, "entry.json"), "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            for field, name in _XML_FILES.items():
+                shutil.copyfile(processed[field], os.path.join(scratch, f"{name}.xml"))
+            # Atomic publish; losing a race to an identical writer is fine
+            os.rename(scratch, self._entry_dir(key))
+        except (OSError, TypeError, ValueError):
+            shutil.rmtree(scratch, ignore_errors=True)
+            return False
+
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Remove least recently used entries beyond max_entries."""
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            try:
+                entries.append((os.stat(path).st_mtime, path))
+            except OSError:
+                continue  # Evicted concurrently
+        entries.sort()
+        for _, path in entries[: max(0, len(entries) - self.max_entries)]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def __len__(self) -> int:
+        return sum(
+            1
+            for name in os.listdir(self.directory)
+            if not name.startswith(".")
+            and os.path.isdir(os.path.join(self.directory, name))
+        )
+
+
+def parse_cache_from_env() -> ParseCache:
+    """
+    Build the parse cache from environment settings.
+
+    HARMONIC_ANALYSIS_PARSE_CACHE_DIR sets the directory (default: a
+    harmonic_analysis_parse_cache folder in the system temp dir) and
+    HARMONIC_ANALYSIS_PARSE_CACHE_SIZE the number of entries kept.
+    """
+    return ParseCache(
+        directory=os.environ.get(
+            "HARMONIC_ANALYSIS_PARSE_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "harmonic_analysis_parse_cache"),
+        ),
+        max_entries=int(
+            os.environ.get("HARMONIC_ANALYSIS_PARSE_CACHE_SIZE", DEFAULT_MAX_ENTRIES)
+        ),
+    )
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Validate the bundled JSON resources and write their validation stamps.
+
+PatternLoader and KnowledgeBase skip jsonschema for packaged files whose
+contents and schema match a stamp. Re-run this script whenever a bundled
+pattern library, the knowledge base or one of their schemas changes (stale
+stamps are harmless: those files are simply validated in full at load time):
+
+    python scripts/stamp_resources.py
+    python scripts/stamp_resources.py --output /tmp/validation_stamps.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from harmonic_analysis.resources.validation import (
+    RESOURCES_DIR,
+    VALIDATION_STAMPS_RESOURCE,
+    build_validation_stamps,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--output", type=Path, default=RESOURCES_DIR / VALIDATION_STAMPS_RESOURCE
+    )
+    args = parser.parse_args()
+
+    # Main play: full jsonschema validation of every stamped resource
+    stamps = build_validation_stamps()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", encoding="utf-8") as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    print(f"✅ Stamped {len(stamps['resources'])} resources in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,110 +35,230 @@ __version__ = "0.2.0rc4"
 # LAYER 1: MAIN API - Essential Functions for 90% of Users
 # =============================================================================
 
-# Configuration types
-# Import common result types
-from .analysis_types import (
-    AnalysisOptions,
-    AnalysisSuggestions,
-    KeySuggestion,
-    PedagogicalLevel,
-)
-
-# Import all user-facing APIs from the api package
-# Core analysis functions
-from .api.analysis import analyze_melody, analyze_scale
-
-# Character and emotional analysis
-from .api.character import (
-    CharacterSuggestion,
-    EmotionalProfile,
-    ProgressionCharacter,
-    analyze_progression_character,
-    describe_emotional_contour,
-    get_character_suggestions,
-    get_mode_emotional_profile,
-    get_modes_by_brightness,
-)
-
-# Musical data access
-from .api.musical_data import (
-    get_all_degree_to_mode_mappings,
-    get_all_notes,
-    get_all_scale_systems,
-    get_circle_of_fifths,
-    get_complete_musical_reference,
-    get_degree_to_mode_mapping,
-    get_interval_names,
-    get_mode_popularity_ranking,
-    get_mode_to_scale_family_mapping,
-    get_note_to_pitch_class_mapping,
-    get_parent_key_indices,
-    get_parent_key_mapping,
-    get_pitch_class_to_note_mapping,
-    get_relative_major_minor_pairs,
-    get_scale_notes,
-    get_scale_reference_for_frontend,
-    get_scale_system_info,
-    get_scale_system_names,
-    normalize_note_name,
-    note_to_pitch_class,
-    pitch_class_to_note,
-    validate_musical_input,
-)
-
-# Import result types from core analysis
-from .core.scale_melody_analysis import ScaleMelodyAnalysisResult
-
-# Music theory constants
-from .core.utils.music_theory_constants import (
-    ALL_KEYS,
-    ALL_MAJOR_KEYS,
-    ALL_MINOR_KEYS,
-    ALL_MODES,
-    CANONICAL_KEY_MAP,
-    INTERVAL_ABBREVIATIONS,
-    MODAL_CHARACTERISTICS,
-    SCALE_TO_CHORD_MAPPINGS,
-    SEMITONE_TO_INTERVAL_NAME,
-    ScaleDegree,
-    canonicalize_key_signature,
-    describe_step_pattern,
-    get_characteristic_degrees,
-    get_harmonic_implications,
-    get_interval_name,
-    get_modal_characteristics,
-    get_scale_applications,
-)
-
-# Scale and pitch constants
-from .core.utils.scales import (
-    HARMONIC_MINOR_MODES,
-    MAJOR_SCALE_MODES,
-    MELODIC_MINOR_MODES,
-    MODAL_PARENT_KEYS,
-    NOTE_TO_PITCH_CLASS,
-    PITCH_CLASS_NAMES,
-)
-
-# Import DTO types for pattern analysis
-from .dto import (
-    AnalysisEnvelope,
-    AnalysisSummary,
-    AnalysisType,
-    ChromaticElementDTO,
-    ChromaticSummaryDTO,
-    PatternMatchDTO,
-    SectionDTO,
-)
-
-# Import Pattern Analysis Services
-from .services.pattern_analysis_service import PatternAnalysisService
-
-# 🆕 Import Unified Pattern Service (Next Generation)
-from .services.unified_pattern_service import UnifiedPatternService
-
-# Utility functions
-from .utils.analysis_helpers import describe_contour
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Public names grouped by the submodule that defines them. Nothing below is
+# imported until first use, so `import harmonic_analysis` stays cheap and
+# NumPy, scikit-learn and the pattern engine load only when needed.
+_EXPORTS_BY_MODULE: Dict[str, Tuple[str, ...]] = {
+    # Configuration and common result types
+    ".analysis_types": (
+        "AnalysisOptions",
+        "AnalysisSuggestions",
+        "KeySuggestion",
+        "PedagogicalLevel",
+    ),
+    # Core analysis functions
+    ".api.analysis": ("analyze_melody", "analyze_scale"),
+    # Character and emotional analysis
+    ".api.character": (
+        "CharacterSuggestion",
+        "EmotionalProfile",
+        "ProgressionCharacter",
+        "analyze_progression_character",
+        "describe_emotional_contour",
+        "get_character_suggestions",
+        "get_mode_emotional_profile",
+        "get_modes_by_brightness",
+    ),
+    # Musical data access
+    ".api.musical_data": (
+        "get_all_degree_to_mode_mappings",
+        "get_all_notes",
+        "get_all_scale_systems",
+        "get_circle_of_fifths",
+        "get_complete_musical_reference",
+        "get_degree_to_mode_mapping",
+        "get_interval_names",
+        "get_mode_popularity_ranking",
+        "get_mode_to_scale_family_mapping",
+        "get_note_to_pitch_class_mapping",
+        "get_parent_key_indices",
+        "get_parent_key_mapping",
+        "get_pitch_class_to_note_mapping",
+        "get_relative_major_minor_pairs",
+        "get_scale_notes",
+        "get_scale_reference_for_frontend",
+        "get_scale_system_info",
+        "get_scale_system_names",
+        "normalize_note_name",
+        "note_to_pitch_class",
+        "pitch_class_to_note",
+        "validate_musical_input",
+    ),
+    # Result types from core analysis
+    ".core.scale_melody_analysis": ("ScaleMelodyAnalysisResult",),
+    # Music theory constants
+    ".core.utils.music_theory_constants": (
+        "ALL_KEYS",
+        "ALL_MAJOR_KEYS",
+        "ALL_MINOR_KEYS",
+        "ALL_MODES",
+        "CANONICAL_KEY_MAP",
+        "INTERVAL_ABBREVIATIONS",
+        "MODAL_CHARACTERISTICS",
+        "SCALE_TO_CHORD_MAPPINGS",
+        "SEMITONE_TO_INTERVAL_NAME",
+        "ScaleDegree",
+        "canonicalize_key_signature",
+        "describe_step_pattern",
+        "get_characteristic_degrees",
+        "get_harmonic_implications",
+        "get_interval_name",
+        "get_modal_characteristics",
+        "get_scale_applications",
+    ),
+    # Scale and pitch constants
+    ".core.utils.scales": (
+        "HARMONIC_MINOR_MODES",
+        "MAJOR_SCALE_MODES",
+        "MELODIC_MINOR_MODES",
+        "MODAL_PARENT_KEYS",
+        "NOTE_TO_PITCH_CLASS",
+        "PITCH_CLASS_NAMES",
+    ),
+    # DTO types for pattern analysis
+    ".dto": (
+        "AnalysisEnvelope",
+        "AnalysisSummary",
+        "AnalysisType",
+        "ChromaticElementDTO",
+        "ChromaticSummaryDTO",
+        "PatternMatchDTO",
+        "SectionDTO",
+    ),
+    # Pattern analysis services
+    ".services.pattern_analysis_service": ("PatternAnalysisService",),
+    ".services.unified_pattern_service": ("UnifiedPatternService",),
+    # Utility functions
+    ".utils.analysis_helpers": ("describe_contour",),
+}
+
+_LAZY_EXPORTS: Dict[str, str] = {
+    name: module for module, names in _EXPORTS_BY_MODULE.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+if TYPE_CHECKING:
+    # Configuration types
+    # Import common result types
+    from .analysis_types import (
+        AnalysisOptions,
+        AnalysisSuggestions,
+        KeySuggestion,
+        PedagogicalLevel,
+    )
+
+    # Import all user-facing APIs from the api package
+    # Core analysis functions
+    from .api.analysis import analyze_melody, analyze_scale
+
+    # Character and emotional analysis
+    from .api.character import (
+        CharacterSuggestion,
+        EmotionalProfile,
+        ProgressionCharacter,
+        analyze_progression_character,
+        describe_emotional_contour,
+        get_character_suggestions,
+        get_mode_emotional_profile,
+        get_modes_by_brightness,
+    )
+
+    # Musical data access
+    from .api.musical_data import (
+        get_all_degree_to_mode_mappings,
+        get_all_notes,
+        get_all_scale_systems,
+        get_circle_of_fifths,
+        get_complete_musical_reference,
+        get_degree_to_mode_mapping,
+        get_interval_names,
+        get_mode_popularity_ranking,
+        get_mode_to_scale_family_mapping,
+        get_note_to_pitch_class_mapping,
+        get_parent_key_indices,
+        get_parent_key_mapping,
+        get_pitch_class_to_note_mapping,
+        get_relative_major_minor_pairs,
+        get_scale_notes,
+        get_scale_reference_for_frontend,
+        get_scale_system_info,
+        get_scale_system_names,
+        normalize_note_name,
+        note_to_pitch_class,
+        pitch_class_to_note,
+        validate_musical_input,
+    )
+
+    # Import result types from core analysis
+    from .core.scale_melody_analysis import ScaleMelodyAnalysisResult
+
+    # Music theory constants
+    from .core.utils.music_theory_constants import (
+        ALL_KEYS,
+        ALL_MAJOR_KEYS,
+        ALL_MINOR_KEYS,
+        ALL_MODES,
+        CANONICAL_KEY_MAP,
+        INTERVAL_ABBREVIATIONS,
+        MODAL_CHARACTERISTICS,
+        SCALE_TO_CHORD_MAPPINGS,
+        SEMITONE_TO_INTERVAL_NAME,
+        ScaleDegree,
+        canonicalize_key_signature,
+        describe_step_pattern,
+        get_characteristic_degrees,
+        get_harmonic_implications,
+        get_interval_name,
+        get_modal_characteristics,
+        get_scale_applications,
+    )
+
+    # Scale and pitch constants
+    from .core.utils.scales import (
+        HARMONIC_MINOR_MODES,
+        MAJOR_SCALE_MODES,
+        MELODIC_MINOR_MODES,
+        MODAL_PARENT_KEYS,
+        NOTE_TO_PITCH_CLASS,
+        PITCH_CLASS_NAMES,
+    )
+
+    # Import DTO types for pattern analysis
+    from .dto import (
+        AnalysisEnvelope,
+        AnalysisSummary,
+        AnalysisType,
+        ChromaticElementDTO,
+        ChromaticSummaryDTO,
+        PatternMatchDTO,
+        SectionDTO,
+    )
+
+    # Import Pattern Analysis Services
+    from .services.pattern_analysis_service import PatternAnalysisService
+
+    # 🆕 Import Unified Pattern Service (Next Generation)
+    from .services.unified_pattern_service import UnifiedPatternService
+
+    # Utility functions
+    from .utils.analysis_helpers import describe_contour
 
 __all__ = [
     # Version
@@ -5,8 +5,8 @@ This package contains the primary user-facing functions that 90% of users need.
 All functions in this package are exposed at the top level of the library.
 """
 
-# Core analysis functions
-from .analysis import analyze_melody, analyze_scale
+import importlib
+from typing import TYPE_CHECKING, Any
 
 # Character and emotional analysis
 from .character import (
@@ -46,6 +46,23 @@ from .musical_data import (
     validate_musical_input,
 )
 
+# The analysis functions pull in the pattern engine, so load them on first use
+_LAZY_EXPORTS = {"analyze_melody": ".analysis", "analyze_scale": ".analysis"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the analysis functions on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from .analysis import analyze_melody, analyze_scale
+
 __all__ = [
     # Core analysis functions
     "analyze_melody",
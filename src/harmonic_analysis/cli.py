@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 
 # Opening move: import analysis orchestration utilities
 from demo.lib.analysis_orchestration import (
@@ -77,31 +76,23 @@ def main() -> None:
         service = get_service()
         if args.chords:
             chords = validate_list("chord", parse_csv(args.chords))
-            envelope = asyncio.run(
-                service.analyze_with_patterns_async(
-                    chord_symbols=chords, profile=args.profile, key_hint=key_hint
-                )
+            envelope = service.analyze_with_patterns(
+                chord_symbols=chords, profile=args.profile, key_hint=key_hint
             )
         elif args.romans:
             romans = validate_list("roman", parse_csv(args.romans))
-            envelope = asyncio.run(
-                service.analyze_with_patterns_async(
-                    romans=romans, profile=args.profile, key_hint=key_hint
-                )
+            envelope = service.analyze_with_patterns(
+                romans=romans, profile=args.profile, key_hint=key_hint
             )
         elif args.melody:
             melody = validate_list("note", parse_csv(args.melody))
-            envelope = asyncio.run(
-                service.analyze_with_patterns_async(
-                    melody=melody, profile=args.profile, key_hint=key_hint
-                )
+            envelope = service.analyze_with_patterns(
+                melody=melody, profile=args.profile, key_hint=key_hint
             )
         elif args.scale:
             scales = parse_scales(args.scale)
-            envelope = asyncio.run(
-                service.analyze_with_patterns_async(
-                    notes=scales[0], profile=args.profile, key_hint=key_hint
-                )
+            envelope = service.analyze_with_patterns(
+                notes=scales[0], profile=args.profile, key_hint=key_hint
             )
         else:
             raise ValueError(
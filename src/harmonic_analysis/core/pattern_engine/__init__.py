@@ -6,20 +6,75 @@ combines functional and modal analysis through a single, configurable pipeline
 with corpus-based calibration and quality gates.
 """
 
-# New unified engine components
-from .aggregator import Aggregator
-from .calibration import CalibrationMapping, CalibrationMetrics, Calibrator
-from .evidence import Evidence
-
-# Legacy components (to be migrated)
-from .glossary_provider import GlossaryProvider
-from .matcher import Matcher, Pattern, PatternLibrary, Token, load_library
-from .pattern_engine import AnalysisContext, PatternEngine
-from .pattern_loader import PatternLoader
-from .plugin_registry import PatternEvaluator, PluginRegistry
-from .target_builder_unified import TargetAnnotation
-from .target_builder_unified import UnifiedTargetBuilder as TargetBuilder
-from .token_converter import TokenConverter
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+# Public name -> (submodule, attribute). Submodules load on first access so
+# importing one engine module does not drag in the rest of the package.
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    # New unified engine components
+    "AggregationState": (".aggregator", "AggregationState"),
+    "Aggregator": (".aggregator", "Aggregator"),
+    "CalibrationMapping": (".calibration", "CalibrationMapping"),
+    "CalibrationMetrics": (".calibration", "CalibrationMetrics"),
+    "Calibrator": (".calibration", "Calibrator"),
+    "CompiledPattern": (".compiled_pattern", "CompiledPattern"),
+    "CompiledPatternSet": (".compiled_pattern", "CompiledPatternSet"),
+    "PrefilterStats": (".compiled_pattern", "PrefilterStats"),
+    "Evidence": (".evidence", "Evidence"),
+    # Legacy components (to be migrated)
+    "GlossaryProvider": (".glossary_provider", "GlossaryProvider"),
+    "EvidenceDiff": (".incremental_session", "EvidenceDiff"),
+    "IncrementalAnalysisSession": (
+        ".incremental_session",
+        "IncrementalAnalysisSession",
+    ),
+    "Matcher": (".matcher", "Matcher"),
+    "Pattern": (".matcher", "Pattern"),
+    "PatternLibrary": (".matcher", "PatternLibrary"),
+    "Token": (".matcher", "Token"),
+    "load_library": (".matcher", "load_library"),
+    "AnalysisContext": (".pattern_engine", "AnalysisContext"),
+    "PatternEngine": (".pattern_engine", "PatternEngine"),
+    "PatternLoader": (".pattern_loader", "PatternLoader"),
+    "PatternEvaluator": (".plugin_registry", "PatternEvaluator"),
+    "PluginRegistry": (".plugin_registry", "PluginRegistry"),
+    "RomanNumeral": (".roman_numeral", "RomanNumeral"),
+    "parse_roman": (".roman_numeral", "parse_roman"),
+    "TargetAnnotation": (".target_builder_unified", "TargetAnnotation"),
+    "TargetBuilder": (".target_builder_unified", "UnifiedTargetBuilder"),
+    "TokenConverter": (".token_converter", "TokenConverter"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an engine component from its submodule on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _LAZY_EXPORTS[name]
+    value = getattr(importlib.import_module(module, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    # New unified engine components
+    from .aggregator import AggregationState, Aggregator
+    from .calibration import CalibrationMapping, CalibrationMetrics, Calibrator
+    from .compiled_pattern import CompiledPattern, CompiledPatternSet, PrefilterStats
+    from .evidence import Evidence
+
+    # Legacy components (to be migrated)
+    from .glossary_provider import GlossaryProvider
+    from .incremental_session import EvidenceDiff, IncrementalAnalysisSession
+    from .matcher import Matcher, Pattern, PatternLibrary, Token, load_library
+    from .pattern_engine import AnalysisContext, PatternEngine
+    from .pattern_loader import PatternLoader
+    from .plugin_registry import PatternEvaluator, PluginRegistry
+    from .roman_numeral import RomanNumeral, parse_roman
+    from .target_builder_unified import TargetAnnotation
+    from .target_builder_unified import UnifiedTargetBuilder as TargetBuilder
+    from .token_converter import TokenConverter
 
 __all__ = [
     # Legacy (for backwards compatibility during migration)
@@ -33,11 +88,19 @@ __all__ = [
     # New unified engine
     "PatternEngine",
     "AnalysisContext",
+    "IncrementalAnalysisSession",
+    "EvidenceDiff",
     "Evidence",
     "PatternLoader",
+    "CompiledPattern",
+    "CompiledPatternSet",
+    "PrefilterStats",
+    "RomanNumeral",
+    "parse_roman",
     "PluginRegistry",
     "PatternEvaluator",
     "Aggregator",
+    "AggregationState",
     "Calibrator",
     "CalibrationMapping",
     "CalibrationMetrics",
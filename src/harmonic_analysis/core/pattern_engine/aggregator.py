@@ -6,8 +6,10 @@ functional, modal, and combined confidence scores.
 """
 
 import logging
+from bisect import bisect_left, insort
 from collections import defaultdict
-from typing import Any, Dict, List
+from dataclasses import replace
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -71,7 +73,128 @@ class Aggregator:
 
         # Apply conflict resolution
         resolved_evidences = self._resolve_conflicts(evidences)
+        return self._summarize(evidences, resolved_evidences)
 
+    def aggregate_batch(
+        self, evidence_lists: Sequence[List[Evidence]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate the evidence of many analyses in one vectorized pass.
+
+        Conflict resolution runs per analysis; the soft-OR track combination,
+        diversity bonus and combined confidence run as NumPy array operations
+        across the whole batch. Results equal aggregate() for each list.
+
+        Args:
+            evidence_lists: One evidence list per analysis
+
+        Returns:
+            Aggregated score dictionaries in input order
+        """
+        resolved_lists = [self._resolve_conflicts(e) for e in evidence_lists]
+        count = len(evidence_lists)
+        width = max((len(resolved) for resolved in resolved_lists), default=0)
+
+        # Opening move: lay track weights out as (analysis, evidence) matrices
+        weights: Dict[str, np.ndarray] = {}
+        track_orders: List[Dict[str, None]] = []
+        family_counts = np.zeros(count)
+        resolved_counts = np.zeros(count)
+        for row, resolved in enumerate(resolved_lists):
+            order: Dict[str, None] = {}
+            for column, evidence in enumerate(resolved):
+                for track, weight in evidence.track_weights.items():
+                    if track not in weights:
+                        weights[track] = np.zeros((count, width))
+                    weights[track][row, column] = weight
+                    order[track] = None
+            track_orders.append(order)
+            family_counts[row] = len(
+                {
+                    e.pattern_id.split(".")[0] if "." in e.pattern_id else "general"
+                    for e in resolved
+                }
+            )
+            resolved_counts[row] = len(resolved)
+
+        # Main play: soft-OR each track column by column (zero padding is inert)
+        track_scores: Dict[str, np.ndarray] = {}
+        for track, matrix in weights.items():
+            current = np.zeros(count)
+            for column in range(width):
+                current = current + matrix[:, column] * (1 - current)
+            track_scores[track] = current
+
+        diversity = np.where(
+            resolved_counts <= 1,
+            0.0,
+            self.diversity_bonus * np.minimum(1.0, family_counts / 4.0),
+        )
+        zeros = np.zeros(count)
+        confs = [
+            np.minimum(1.0, track_scores.get(track, zeros) + diversity)
+            for track in ("functional", "modal", "chromatic")
+        ]
+
+        # Big play: combined confidence over the active tracks only
+        active = [conf > 0 for conf in confs]
+        active_count = active[0].astype(int) + active[1] + active[2]
+        active_sum = (
+            np.where(active[0], confs[0], 0.0)
+            + np.where(active[1], confs[1], 0.0)
+            + np.where(active[2], confs[2], 0.0)
+        )
+        max_conf = np.maximum(np.maximum(confs[0], confs[1]), confs[2])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            combined = np.where(
+                active_count > 0,
+                0.7 * max_conf + 0.3 * (active_sum / active_count),
+                0.0,
+            )
+
+        # Victory lap: unpack rows into the aggregate() dictionaries
+        functional, modal, chromatic = (conf.tolist() for conf in confs)
+        combined_list = combined.tolist()
+        diversity_list = diversity.tolist()
+        scores = {track: values.tolist() for track, values in track_scores.items()}
+        results: List[Dict[str, Any]] = []
+        for row, evidences in enumerate(evidence_lists):
+            if not evidences:
+                results.append(self.aggregate(evidences))
+                continue
+            results.append(
+                {
+                    "functional_conf": functional[row],
+                    "modal_conf": modal[row],
+                    "chromatic_conf": chromatic[row],
+                    "combined_conf": combined_list[row],
+                    "debug_breakdown": {
+                        "evidence_count": len(evidences),
+                        "resolved_count": len(resolved_lists[row]),
+                        "track_scores": {
+                            track: scores[track][row] for track in track_orders[row]
+                        },
+                        "diversity_bonus": diversity_list[row],
+                        "patterns_detected": list({e.pattern_id for e in evidences}),
+                        "conflict_strategy": self.conflict_strategy,
+                    },
+                }
+            )
+        return results
+
+    def _summarize(
+        self, evidences: List[Evidence], resolved_evidences: List[Evidence]
+    ) -> Dict[str, Any]:
+        """
+        Turn conflict-resolved evidence into the aggregate score dictionary.
+
+        Args:
+            evidences: Original evidence list (in match order)
+            resolved_evidences: Evidence after conflict resolution
+
+        Returns:
+            Aggregated scores and debug info (see aggregate())
+        """
         # Aggregate by track
         track_scores = self._aggregate_by_track(resolved_evidences)
 
@@ -180,39 +303,80 @@ class Aggregator:
         # Sort by score descending
         sorted_evidence = sorted(evidences, key=lambda e: e.raw_score, reverse=True)
 
+        # Index ranks by span start so each evidence only visits spans that
+        # can overlap it (linear in the evidence count for bounded spans)
+        by_start = sorted(
+            range(len(sorted_evidence)), key=lambda i: sorted_evidence[i].span[0]
+        )
+        starts = [sorted_evidence[i].span[0] for i in by_start]
+        max_span = max(e.span[1] - e.span[0] for e in sorted_evidence)
+
         for i, evidence in enumerate(sorted_evidence):
             # Calculate decay from higher-scoring overlapping evidence
             decay_factor = 1.0
 
-            for j in range(i):
+            start, end = evidence.span
+            lo = bisect_left(starts, start - max_span + 1)
+            hi = bisect_left(starts, end, lo)
+            for j in sorted(j for j in by_start[lo:hi] if j < i):
                 if sorted_evidence[j].overlaps(evidence):
-                    # Apply exponential decay based on score difference
-                    score_diff = sorted_evidence[j].raw_score - evidence.raw_score
-                    decay_factor *= 1.0 - self.overlap_decay * np.exp(-score_diff)
-
-            # Create adjusted evidence if decay is significant
-            if decay_factor > 0.1:  # Keep if not too decayed
-                adjusted_score = evidence.raw_score * decay_factor
-
-                # Adjust track weights proportionally
-                adjusted_weights = {
-                    track: weight * decay_factor
-                    for track, weight in evidence.track_weights.items()
-                }
+                    decay_factor *= self._overlap_factor(sorted_evidence[j], evidence)
 
-                processed.append(
-                    Evidence(
-                        pattern_id=evidence.pattern_id,
-                        track_weights=adjusted_weights,
-                        features=evidence.features,
-                        raw_score=adjusted_score,
-                        uncertainty=evidence.uncertainty,
-                        span=evidence.span,
-                    )
-                )
+            adjusted = self._apply_decay(evidence, decay_factor)
+            if adjusted is not None:
+                processed.append(adjusted)
 
         return processed
 
+    def _overlap_factor(self, higher: Evidence, lower: Evidence) -> float:
+        """
+        Decay applied to lower-ranked evidence by an overlapping higher one.
+
+        Args:
+            higher: Evidence ranked earlier in soft-NMS order
+            lower: Overlapping evidence being decayed
+
+        Returns:
+            Multiplicative decay factor
+        """
+        # Apply exponential decay based on score difference
+        score_diff = higher.raw_score - lower.raw_score
+        return float(1.0 - self.overlap_decay * np.exp(-score_diff))
+
+    def _apply_decay(
+        self, evidence: Evidence, decay_factor: float
+    ) -> Optional[Evidence]:
+        """
+        Scale evidence by its soft-NMS decay, dropping it if too decayed.
+
+        Args:
+            evidence: Original evidence
+            decay_factor: Accumulated decay from overlapping evidence
+
+        Returns:
+            Adjusted evidence, or None when decay leaves too little
+        """
+        # Create adjusted evidence if decay is significant
+        if decay_factor <= 0.1:  # Keep if not too decayed
+            return None
+
+        adjusted_score = evidence.raw_score * decay_factor
+
+        # Adjust track weights proportionally
+        adjusted_weights = {
+            track: weight * decay_factor
+            for track, weight in evidence.track_weights.items()
+        }
+
+        return Evidence(
+            pattern_id=evidence.pattern_id,
+            track_weights=adjusted_weights,
+            features=evidence.features,
+            raw_score=adjusted_score,
+            uncertainty=evidence.uncertainty,
+            span=evidence.span,
+        )
+
     def _aggregate_by_track(self, evidences: List[Evidence]) -> Dict[str, float]:
         """
         Sum evidence weights grouped by analysis track.
@@ -261,3 +425,182 @@ class Aggregator:
         # Diversity increases with more families, up to the configured bonus
         diversity_ratio = min(1.0, len(pattern_families) / 4.0)  # Max out at 4 families
         return self.diversity_bonus * diversity_ratio
+
+
+class AggregationState:
+    """
+    Running soft-NMS aggregation over evidence that arrives incrementally.
+
+    Each evidence is stored under a sortable key giving its position in the
+    engine's batch evidence order. Adding or removing evidence recomputes the
+    decay of overlapping evidence only, and result() returns exactly what
+    Aggregator.aggregate() returns for the same ordered evidence list.
+    """
+
+    def __init__(self, aggregator: Aggregator) -> None:
+        """
+        Initialize empty state.
+
+        Args:
+            aggregator: Aggregator whose configuration and scoring to reuse
+        """
+        self.aggregator = aggregator
+        self._evidence: Dict[Hashable, Evidence] = {}
+        self._adjusted: Dict[Hashable, Optional[Evidence]] = {}
+        self._order: List[Any] = []  # keys in batch order
+        self._ranked: List[Tuple[float, Any]] = []  # soft-NMS order
+        self._by_end: List[Tuple[int, Any]] = []  # span-end index
+        self._max_span = 0
+
+    def __len__(self) -> int:
+        """Number of evidence entries held."""
+        return len(self._evidence)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Whether evidence is stored under key."""
+        return key in self._evidence
+
+    def keys(self) -> List[Any]:
+        """Evidence keys in batch order."""
+        return list(self._order)
+
+    @property
+    def evidences(self) -> List[Evidence]:
+        """Original evidence in batch order."""
+        return [self._evidence[key] for key in self._order]
+
+    def get(self, key: Hashable) -> Optional[Evidence]:
+        """Evidence stored under key, if any."""
+        return self._evidence.get(key)
+
+    def add(self, key: Any, evidence: Evidence) -> None:
+        """
+        Add evidence and update the decay of everything it overlaps.
+
+        Args:
+            key: Sortable key giving the evidence's batch position
+            evidence: Evidence to add
+
+        Raises:
+            ValueError: If evidence is already stored under key
+        """
+        if key in self._evidence:
+            raise ValueError(f"Evidence already present for key: {key}")
+
+        self._evidence[key] = evidence
+        insort(self._order, key)
+        insort(self._ranked, (-evidence.raw_score, key))
+        insort(self._by_end, (evidence.span[1], key))
+        self._max_span = max(self._max_span, evidence.span[1] - evidence.span[0])
+        self._refresh(evidence.span)
+
+    def remove(self, key: Any) -> Evidence:
+        """
+        Remove evidence and update the decay of everything it overlapped.
+
+        Args:
+            key: Key the evidence was added under
+
+        Returns:
+            The removed evidence
+
+        Raises:
+            KeyError: If no evidence is stored under key
+        """
+        evidence = self._evidence.pop(key)
+        del self._adjusted[key]
+        self._discard(self._order, key)
+        self._discard(self._ranked, (-evidence.raw_score, key))
+        self._discard(self._by_end, (evidence.span[1], key))
+        self._refresh(evidence.span)
+        return evidence
+
+    def relocate(self, moves: Mapping[Any, Tuple[Any, Evidence]]) -> None:
+        """
+        Move evidence to new keys and spans without recomputing decay.
+
+        Used when chords are inserted or deleted: evidence after the edit
+        shifts uniformly. The caller guarantees the moves change neither
+        which spans overlap nor the relative order of any two keys, so every
+        soft-NMS decay stays valid.
+
+        Args:
+            moves: Old key -> (new key, evidence with its new span)
+        """
+        if not moves:
+            return
+
+        for key, (new_key, evidence) in moves.items():
+            del self._evidence[key]
+            adjusted = self._adjusted.pop(key)
+            self._evidence[new_key] = evidence
+            self._adjusted[new_key] = (
+                replace(adjusted, span=evidence.span) if adjusted else None
+            )
+
+        # Rebuild the indexes; relative order is preserved by contract
+        self._order = sorted(self._evidence)
+        self._ranked = sorted(
+            (-evidence.raw_score, key) for key, evidence in self._evidence.items()
+        )
+        self._by_end = sorted(
+            (evidence.span[1], key) for key, evidence in self._evidence.items()
+        )
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Aggregate the current evidence.
+
+        Returns:
+            Same dictionary Aggregator.aggregate() produces for self.evidences
+        """
+        if not self._evidence or self.aggregator.conflict_strategy != "soft_nms":
+            return self.aggregator.aggregate(self.evidences)
+
+        resolved = [
+            adjusted
+            for _, key in self._ranked
+            if (adjusted := self._adjusted[key]) is not None
+        ]
+        return self.aggregator._summarize(self.evidences, resolved)
+
+    @staticmethod
+    def _discard(items: List[Any], item: Any) -> None:
+        index = bisect_left(items, item)
+        del items[index]
+
+    def _overlapping(self, span: Tuple[int, int]) -> List[Any]:
+        """Keys of stored evidence whose spans overlap span."""
+        start, end = span
+        keys = []
+        # Opening move: skip everything that ends before the span starts
+        for evidence_end, key in self._by_end[
+            bisect_left(self._by_end, (start + 1,)) :
+        ]:
+            if evidence_end >= end + self._max_span:
+                break  # starts at or after span end from here on
+            if self._evidence[key].span[0] < end:
+                keys.append(key)
+        return keys
+
+    def _refresh(self, span: Tuple[int, int]) -> None:
+        """Recompute soft-NMS decay for evidence overlapping span."""
+        for key in self._overlapping(span):
+            evidence = self._evidence[key]
+            rank = (-evidence.raw_score, key)
+
+            # Main play: multiply in decays from higher-ranked overlaps, in
+            # the same order the batch soft-NMS pass visits them
+            higher = sorted(
+                (-self._evidence[other].raw_score, other)
+                for other in self._overlapping(evidence.span)
+                if other != key
+            )
+            decay_factor = 1.0
+            for other_rank in higher:
+                if other_rank >= rank:
+                    break
+                decay_factor *= self.aggregator._overlap_factor(
+                    self._evidence[other_rank[1]], evidence
+                )
+            self._adjusted[key] = self.aggregator._apply_decay(evidence, decay_factor)
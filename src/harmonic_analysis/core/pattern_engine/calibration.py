@@ -5,19 +5,21 @@ This module implements confidence calibration with strict quality gates
 to prevent degradation when signal is insufficient.
 """
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+import json
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 
-if TYPE_CHECKING:
-    # For type checking, import sklearn types
-    from sklearn.isotonic import IsotonicRegression  # type: ignore[import-untyped]
-    from sklearn.linear_model import LogisticRegression  # type: ignore[import-untyped]
-else:
-    # At runtime, import sklearn normally but handle missing stubs
-    from sklearn.isotonic import IsotonicRegression  # type: ignore[import-untyped]
-    from sklearn.linear_model import LogisticRegression  # type: ignore[import-untyped]
+# Serialized calibration artifacts
+CALIBRATION_FORMAT = "harmonic_analysis.calibration"
+CALIBRATION_FORMAT_VERSION = 1
+
+# Packaged artifact (resources/calibration/) and the seed it was fitted with
+DEFAULT_CALIBRATION_RESOURCE = "calibration/default_calibration.json"
+DEFAULT_CALIBRATION_SEED = 42
 
 
 @dataclass(frozen=True)
@@ -92,6 +94,177 @@ class CalibrationMapping:
             # Unknown mapping type - fallback to identity
             return x
 
+    def apply_batch(self, values: Union[np.ndarray, List[float]]) -> np.ndarray:
+        """
+        Apply calibration mapping to many confidence scores at once.
+
+        Args:
+            values: Raw confidence scores (any shape, 0.0-1.0)
+
+        Returns:
+            Float array of calibrated scores with the same shape
+        """
+        x = np.asarray(values, dtype=float)
+        if self.mapping_type == "identity" or not self.passed_gates:
+            return x
+
+        elif self.mapping_type == "platt":
+            A = self.params.get("A", 0.0)
+            B = self.params.get("B", 1.0)
+            return 1.0 / (1.0 + np.exp(-(A * x + B)))
+
+        elif self.mapping_type == "isotonic":
+            X = self.params.get("X", [])
+            Y = self.params.get("Y", [])
+            if not X or not Y:
+                return x
+            return np.interp(x, X, Y)
+
+        else:
+            return x
+
+    def to_dict(self, provenance: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Convert to the versioned artifact format.
+
+        Args:
+            provenance: Optional description of how the mapping was fitted
+
+        Returns:
+            JSON-ready dictionary (see from_dict())
+        """
+        return {
+            "format": CALIBRATION_FORMAT,
+            "version": CALIBRATION_FORMAT_VERSION,
+            "mapping_type": self.mapping_type,
+            "params": {
+                name: (
+                    [float(v) for v in value]
+                    if isinstance(value, (list, tuple, np.ndarray))
+                    else float(value)
+                )
+                for name, value in self.params.items()
+            },
+            "metrics": {
+                name: (int(value) if name == "sample_count" else float(value))
+                for name, value in asdict(self.metrics).items()
+            },
+            "passed_gates": bool(self.passed_gates),
+            "provenance": dict(provenance or {}),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CalibrationMapping":
+        """
+        Build a mapping from the versioned artifact format.
+
+        Args:
+            data: Dictionary produced by to_dict()
+
+        Returns:
+            CalibrationMapping
+
+        Raises:
+            ValueError: If the format or version is not supported
+        """
+        if data.get("format") != CALIBRATION_FORMAT:
+            raise ValueError(f"Not a calibration artifact: {data.get('format')!r}")
+        if data.get("version") != CALIBRATION_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported calibration artifact version {data.get('version')!r}"
+            )
+        return cls(
+            mapping_type=data["mapping_type"],
+            params=dict(data["params"]),
+            metrics=CalibrationMetrics(**data["metrics"]),
+            passed_gates=bool(data["passed_gates"]),
+        )
+
+    def save(self, path: Path, provenance: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write the mapping as a versioned JSON artifact.
+
+        Args:
+            path: Destination file
+            provenance: Optional description of how the mapping was fitted
+        """
+        Path(path).write_text(
+            json.dumps(self.to_dict(provenance), indent=2) + "\n", encoding="utf-8"
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "CalibrationMapping":
+        """
+        Read a mapping written by save().
+
+        Args:
+            path: Artifact file
+
+        Returns:
+            CalibrationMapping
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a supported calibration artifact
+        """
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+@lru_cache(maxsize=1)
+def load_default_calibration() -> CalibrationMapping:
+    """
+    Load the pre-fitted calibration mapping shipped with the package.
+
+    The artifact is parsed once per process; the mapping is immutable.
+
+    Returns:
+        CalibrationMapping from resources/calibration/
+
+    Raises:
+        FileNotFoundError: If the artifact is missing from the installation
+        ValueError: If the artifact is not a supported calibration artifact
+    """
+    from harmonic_analysis.resources.loader import load_json
+
+    return CalibrationMapping.from_dict(load_json(DEFAULT_CALIBRATION_RESOURCE))
+
+
+def synthetic_calibration_data(
+    seed: Optional[int] = DEFAULT_CALIBRATION_SEED,
+) -> Tuple[List[float], List[float]]:
+    """
+    Generate the synthetic training set behind the default calibration.
+
+    Simulates high, medium and low confidence scenarios with known
+    reliability. The same seed always yields the same data.
+
+    Args:
+        seed: Random seed (None for fresh randomness)
+
+    Returns:
+        Tuple of (raw_scores, targets)
+    """
+    rng = np.random.RandomState(seed)
+    raw_scores: List[float] = []
+    targets: List[float] = []
+
+    # High confidence scenarios (strong patterns, clear tonality)
+    high_conf_base = rng.uniform(0.7, 0.95, 50)
+    raw_scores.extend(high_conf_base.tolist())
+    targets.extend(np.clip(high_conf_base * 0.85 + 0.1, 0.0, 1.0).tolist())
+
+    # Medium confidence scenarios (ambiguous patterns, multiple interpretations)
+    med_conf_base = rng.uniform(0.4, 0.7, 80)
+    raw_scores.extend(med_conf_base.tolist())
+    targets.extend(np.clip(med_conf_base * 0.6 + 0.2, 0.0, 1.0).tolist())
+
+    # Low confidence scenarios (weak patterns, chromatic passages)
+    low_conf_base = rng.uniform(0.1, 0.4, 30)
+    raw_scores.extend(low_conf_base.tolist())
+    targets.extend(np.clip(low_conf_base * 0.3 + 0.05, 0.0, 1.0).tolist())
+
+    return raw_scores, targets
+
 
 class Calibrator:
     """
@@ -298,6 +471,12 @@ class Calibrator:
         baseline_metrics: CalibrationMetrics,
     ) -> Optional[CalibrationMapping]:
         """Fit a specific calibration method."""
+        # scikit-learn is only needed when fitting, so keep it off the import path
+        from sklearn.isotonic import IsotonicRegression  # type: ignore[import-untyped]
+        from sklearn.linear_model import (  # type: ignore[import-untyped]
+            LogisticRegression,
+        )
+
         try:
             if method == "platt":
                 # Fit Platt scaling (logistic regression)
@@ -0,0 +1,494 @@
+"""
+Compiled pattern representation for the unified pattern engine.
+
+PatternLoader turns raw pattern JSON into immutable CompiledPattern objects
+once, at load time. Everything the engine used to re-derive on every
+comparison lives here precomputed: normalized sequence tokens, compiled
+regexes, constraint checkers, the resolved evaluator plugin, a scope
+bitmask and an id -> pattern index.
+"""
+
+import threading
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .roman_numeral import roman_match_key
+from .sequence_scanner import (
+    LITERAL,
+    SEQUENCE_MATCHERS,
+    MultiPatternScanner,
+    SequenceToken,
+    compile_sequence_token,
+)
+
+if TYPE_CHECKING:
+    from .pattern_engine import AnalysisContext, PatternEngine
+    from .plugin_registry import PatternEvaluator, PluginRegistry
+
+# Scope bits - a pattern applies when all of its scope bits are present
+SCOPE_HARMONIC = 1
+SCOPE_MELODIC = 2
+SCOPE_SCALE = 4
+SCOPE_BITS: Mapping[str, int] = MappingProxyType(
+    {"harmonic": SCOPE_HARMONIC, "melodic": SCOPE_MELODIC, "scale": SCOPE_SCALE}
+)
+
+ConstraintChecker = Callable[["PatternEngine", "AnalysisContext", int, int, int], bool]
+"""Signature: (engine, context, start, end, context_len) -> passes."""
+
+
+def scope_mask(scope: Sequence[str]) -> int:
+    """Convert a list of scope names into a scope bitmask."""
+    mask = 0
+    for name in scope:
+        mask |= SCOPE_BITS.get(name, 0)
+    return mask
+
+
+def context_scope_mask(context: "AnalysisContext") -> int:
+    """Bitmask of the scopes an analysis context can satisfy."""
+    mask = 0
+    if context.chords:
+        mask |= SCOPE_HARMONIC
+    if context.melody:
+        mask |= SCOPE_MELODIC
+    if context.scales:
+        mask |= SCOPE_SCALE
+    return mask
+
+
+# --------------- Constraint checkers ---------------
+
+
+def _position_checker(position: Any) -> ConstraintChecker:
+    def check(
+        engine: "PatternEngine",
+        context: "AnalysisContext",
+        start: int,
+        end: int,
+        context_len: int,
+    ) -> bool:
+        if position == "start":
+            return start == 0
+        if position == "end":
+            return end == context_len
+        return True
+
+    return check
+
+
+def _key_context_checker(key_context: Any) -> ConstraintChecker:
+    def check(
+        engine: "PatternEngine",
+        context: "AnalysisContext",
+        start: int,
+        end: int,
+        context_len: int,
+    ) -> bool:
+        if key_context == "diatonic" and context.key:
+            return engine._verify_diatonic_context(context, start, end)
+        return True
+
+    return check
+
+
+def _soprano_degree_checker(expected_degrees: Any) -> ConstraintChecker:
+    def check(
+        engine: "PatternEngine",
+        context: "AnalysisContext",
+        start: int,
+        end: int,
+        context_len: int,
+    ) -> bool:
+        return engine._check_soprano_degree(context, end - 1, expected_degrees)
+
+    return check
+
+
+def _bass_motion_checker(expected_motion: Any) -> ConstraintChecker:
+    def check(
+        engine: "PatternEngine",
+        context: "AnalysisContext",
+        start: int,
+        end: int,
+        context_len: int,
+    ) -> bool:
+        return engine._check_bass_motion(context, start, end, expected_motion)
+
+    return check
+
+
+def _voice_leading_checker(expected_quality: Any) -> ConstraintChecker:
+    def check(
+        engine: "PatternEngine",
+        context: "AnalysisContext",
+        start: int,
+        end: int,
+        context_len: int,
+    ) -> bool:
+        return engine._check_voice_leading(context, start, end, expected_quality)
+
+    return check
+
+
+# Evaluated in this order, matching the engine's historical checks
+CONSTRAINT_CHECKERS: Mapping[str, Callable[[Any], ConstraintChecker]] = (
+    MappingProxyType(
+        {
+            "position": _position_checker,
+            "key_context": _key_context_checker,
+            "soprano_degree": _soprano_degree_checker,
+            "bass_motion": _bass_motion_checker,
+            "voice_leading": _voice_leading_checker,
+        }
+    )
+)
+
+
+def compile_constraints(
+    constraints: Mapping[str, Any],
+) -> Tuple[ConstraintChecker, ...]:
+    """
+    Resolve a pattern's constraint block into checker callables.
+
+    Unknown constraint names are ignored, as they always have been.
+
+    Args:
+        constraints: Constraint mapping from the pattern matchers
+
+    Returns:
+        Tuple of checkers to run on every candidate span
+    """
+    return tuple(
+        factory(constraints[name])
+        for name, factory in CONSTRAINT_CHECKERS.items()
+        if name in constraints
+    )
+
+
+# --------------- Compiled representation ---------------
+
+
+@dataclass(frozen=True)
+class CompiledSequence:
+    """One sequence matcher of a pattern, ready for scanning."""
+
+    kind: str
+    """Matcher kind (roman_seq, chord_seq, interval_seq, scale_degrees)."""
+
+    tokens: Tuple[SequenceToken, ...]
+    """Compiled items (pre-normalized literals, compiled regexes, wildcards)."""
+
+    in_window: bool
+    """Whether the sequence length satisfies the pattern's window min/max."""
+
+    required_mask: int = 0
+    """Token-set bits of every literal item (see CompiledPatternSet.token_bits)."""
+
+    def __len__(self) -> int:
+        """Length of the sequence in context items."""
+        return len(self.tokens)
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """Immutable, pre-resolved form of a single pattern definition."""
+
+    id: str
+    index: int
+    """Position of the pattern in its library (evidence ordering)."""
+
+    name: str
+    source: Mapping[str, Any]
+    """Read-only view of the original pattern definition."""
+
+    scope_mask: int
+    tracks: Tuple[str, ...]
+    sequences: Tuple[CompiledSequence, ...]
+    overlap_ok: bool
+    constraints: Tuple[ConstraintChecker, ...]
+    required_mode: Optional[str]
+    """Mode a scale_degrees pattern requires (None when unconstrained)."""
+
+    evaluator: Optional["PatternEvaluator"]
+    """Resolved confidence function (None when compiled without a registry)."""
+
+    tags: FrozenSet[str]
+    """Lower-cased metadata tags."""
+
+    anchor: Optional[str] = None
+    """Position constraint pinning matches to the "start" or "end" (or None)."""
+
+    def applies_to(self, context_mask: int) -> bool:
+        """Check the pattern's scopes against a context scope mask."""
+        return self.scope_mask & ~context_mask == 0
+
+    def admits(self, token_mask: int) -> bool:
+        """
+        Token-set prefilter: can any sequence match the context's tokens?
+
+        A sequence can only match when every literal item it requires is
+        present in the context, i.e. its required bits are a subset.
+
+        Args:
+            token_mask: Bits of the tokens present in the context
+
+        Returns:
+            False when no sequence can possibly match
+        """
+        return any(
+            sequence.in_window and sequence.required_mask & ~token_mask == 0
+            for sequence in self.sequences
+        )
+
+
+@dataclass(frozen=True)
+class CompiledPatternSet:
+    """A compiled pattern library with lookup and scanning structures."""
+
+    patterns: Tuple[CompiledPattern, ...]
+    by_id: Mapping[str, CompiledPattern]
+    scanner: MultiPatternScanner
+    version: int = 1
+    token_bits: Mapping[str, Mapping[Hashable, int]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    """Per matcher kind, the bit assigned to each literal token key."""
+
+    max_window: int = 0
+    """Longest in-window sequence (the widest span any match can cover)."""
+
+    def __len__(self) -> int:
+        """Number of compiled patterns."""
+        return len(self.patterns)
+
+    def __iter__(self) -> Iterator[CompiledPattern]:
+        """Iterate patterns in library order."""
+        return iter(self.patterns)
+
+    def get(self, pattern_id: str) -> Optional[CompiledPattern]:
+        """Look up a compiled pattern by id."""
+        return self.by_id.get(pattern_id)
+
+    def context_token_mask(
+        self, sequences: Mapping[str, Tuple[Sequence[Hashable], Sequence[str]]]
+    ) -> int:
+        """
+        Build the token-set bitmask of a context.
+
+        Args:
+            sequences: Mapping of matcher kind to (keys, raw) context items
+
+        Returns:
+            Union of the bits of every known token present in the context
+        """
+        mask = 0
+        for kind, (keys, _raw) in sequences.items():
+            bits = self.token_bits.get(kind)
+            if not bits:
+                continue
+            for key in set(keys):
+                mask |= bits.get(key, 0)
+        return mask
+
+
+@dataclass
+class PrefilterStats:
+    """Counters for pattern pruning before sequence matching."""
+
+    contexts: int = 0
+    """Contexts matched against the pattern library."""
+
+    patterns_considered: int = 0
+    """Pattern/context pairs seen by the prefilter."""
+
+    pruned_by_scope: int = 0
+    """Pairs rejected because a required scope was missing."""
+
+    pruned_by_tokens: int = 0
+    """Pairs rejected because a required token was absent."""
+
+    # One engine may match contexts on many threads at once
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @property
+    def pruned(self) -> int:
+        """Total pattern/context pairs rejected without matching."""
+        return self.pruned_by_scope + self.pruned_by_tokens
+
+    def record(self, considered: int, by_scope: int, by_tokens: int) -> None:
+        """
+        Add the counts for one matched context (thread-safe).
+
+        Args:
+            considered: Patterns in the library
+            by_scope: Patterns rejected for a missing scope
+            by_tokens: Patterns rejected for an absent token
+        """
+        with self._lock:
+            self.contexts += 1
+            self.patterns_considered += considered
+            self.pruned_by_scope += by_scope
+            self.pruned_by_tokens += by_tokens
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            for stat in fields(self):
+                setattr(self, stat.name, 0)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Export counters (including the derived total)."""
+        data = {stat.name: getattr(self, stat.name) for stat in fields(self)}
+        data["pruned"] = self.pruned
+        return data
+
+
+def compile_sequence(kind: str, items: Sequence[Any]) -> Tuple[SequenceToken, ...]:
+    """Compile the items of one sequence matcher into scanner tokens."""
+    if kind == "roman_seq":
+        return tuple(compile_sequence_token(item, roman_match_key) for item in items)
+    return tuple(compile_sequence_token(str(item)) for item in items)
+
+
+def _required_mask(
+    kind: str,
+    tokens: Sequence[SequenceToken],
+    token_bits: Dict[str, Dict[Hashable, int]],
+) -> int:
+    """Assign (or reuse) a bit per literal token key and OR them together."""
+    bits = token_bits.setdefault(kind, {})
+    mask = 0
+    for token in tokens:
+        if token.kind != LITERAL:
+            continue
+        bit = bits.get(token.key)
+        if bit is None:
+            bit = bits[token.key] = 1 << sum(len(b) for b in token_bits.values())
+        mask |= bit
+    return mask
+
+
+def compile_pattern(
+    pattern: Mapping[str, Any],
+    index: int,
+    plugins: Optional["PluginRegistry"] = None,
+    token_bits: Optional[Dict[str, Dict[Hashable, int]]] = None,
+) -> CompiledPattern:
+    """
+    Compile a single pattern definition.
+
+    Args:
+        pattern: Raw pattern definition from JSON
+        index: Position of the pattern in its library
+        plugins: Registry used to resolve the pattern's confidence function
+        token_bits: Shared token-bit registry for the prefilter (without it
+            the pattern admits every context)
+
+    Returns:
+        CompiledPattern
+    """
+    matchers = pattern.get("matchers", {})
+    window = matchers.get("window", {})
+
+    sequences = []
+    for kind in SEQUENCE_MATCHERS:
+        if kind not in matchers:
+            continue
+        tokens = compile_sequence(kind, matchers[kind])
+        length = len(tokens)
+        in_window = window.get("min", length) <= length <= window.get("max", length)
+        required_mask = (
+            _required_mask(kind, tokens, token_bits) if token_bits is not None else 0
+        )
+        sequences.append(CompiledSequence(kind, tokens, in_window, required_mask))
+
+    evaluator = None
+    if plugins is not None:
+        confidence_fn = pattern.get("evidence", {}).get("confidence_fn", "identity")
+        evaluator = plugins.resolve(confidence_fn)
+
+    metadata = pattern.get("metadata", {})
+    position = matchers.get("constraints", {}).get("position")
+    return CompiledPattern(
+        id=pattern.get("id", ""),
+        index=index,
+        name=str(pattern.get("name", "")),
+        source=MappingProxyType(pattern),  # type: ignore[arg-type]
+        scope_mask=scope_mask(pattern.get("scope", ["harmonic"])),
+        tracks=tuple(pattern.get("track", ["functional"])),
+        sequences=tuple(sequences),
+        overlap_ok=bool(window.get("overlap_ok", True)),
+        constraints=compile_constraints(matchers.get("constraints", {})),
+        required_mode=(matchers.get("mode") if "scale_degrees" in matchers else None),
+        evaluator=evaluator,
+        tags=frozenset(str(tag).lower() for tag in metadata.get("tags", [])),
+        anchor=position if position in ("start", "end") else None,
+    )
+
+
+def compile_pattern_set(
+    patterns: Sequence[Mapping[str, Any]],
+    plugins: Optional["PluginRegistry"] = None,
+    version: int = 1,
+) -> CompiledPatternSet:
+    """
+    Compile a whole pattern library and build its scanner.
+
+    Args:
+        patterns: Raw pattern definitions in library order
+        plugins: Registry used to resolve confidence functions
+        version: Pattern library version
+
+    Returns:
+        CompiledPatternSet
+    """
+    token_bits: Dict[str, Dict[Hashable, int]] = {}
+    compiled = tuple(
+        compile_pattern(pattern, index, plugins, token_bits)
+        for index, pattern in enumerate(patterns)
+    )
+
+    # First definition wins for duplicate ids (historical lookup behaviour)
+    by_id: Dict[str, CompiledPattern] = {}
+    for pattern in compiled:
+        by_id.setdefault(pattern.id, pattern)
+
+    entries: List[Tuple[int, str, Tuple[SequenceToken, ...]]] = [
+        (pattern.index, sequence.kind, sequence.tokens)
+        for pattern in compiled
+        for sequence in pattern.sequences
+    ]
+    return CompiledPatternSet(
+        patterns=compiled,
+        by_id=MappingProxyType(by_id),
+        scanner=MultiPatternScanner(entries),
+        version=version,
+        token_bits=MappingProxyType(
+            {kind: MappingProxyType(bits) for kind, bits in token_bits.items()}
+        ),
+        max_window=max(
+            (
+                len(sequence)
+                for pattern in compiled
+                for sequence in pattern.sequences
+                if sequence.in_window
+            ),
+            default=0,
+        ),
+    )
@@ -7,12 +7,87 @@ for UI presentation. No UI dependencies - pure data transformation.
 """
 
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from .glossary_provider import GlossaryProvider
 
-
-def load_glossary(path: Optional[Path] = None) -> Dict[str, Any]:
+# Common feature keys mapped to human-readable (label, tooltip) pairs
+_FEATURE_MAPPINGS: Dict[str, Tuple[str, str]] = {
+    # Cadence features
+    "has_auth_cadence": (
+        "Authentic Cadence",
+        "Perfect or Imperfect Authentic Cadence detected",
+    ),
+    "has_plagal_cadence": (
+        "Plagal Cadence",
+        "IV-I progression, often at hymn endings",
+    ),
+    "has_half_cadence": (
+        "Half Cadence",
+        "Cadence ending on V, creating expectation",
+    ),
+    "has_deceptive_cadence": (
+        "Deceptive Cadence",
+        "V-vi avoiding resolution to tonic",
+    ),
+    # Modal features
+    "modal_char_score": (
+        "Modal Character",
+        "Strength of modal vs functional characteristics",
+    ),
+    "dorian_character": (
+        "Dorian Character",
+        "Dorian mode characteristics (raised 6th)",
+    ),
+    "phrygian_character": (
+        "Phrygian Character",
+        "Phrygian mode characteristics (lowered 2nd)",
+    ),
+    "mixolydian_character": (
+        "Mixolydian Character",
+        "Mixolydian mode characteristics (lowered 7th)",
+    ),
+    # Functional features
+    "tonal_clarity": (
+        "Tonal Clarity",
+        "Strength of functional harmonic progression",
+    ),
+    "predominant_function": (
+        "Predominant Function",
+        "Pre-dominant harmony (ii, IV, vi)",
+    ),
+    "dominant_function": ("Dominant Function", "Dominant harmony creating tension"),
+    # Chromatic features
+    "outside_key_ratio": (
+        "Chromatic Content",
+        "Proportion of notes outside the diatonic scale",
+    ),
+    "chromatic_density": ("Chromatic Density", "Amount of chromatic alteration"),
+    "secondary_dominants": (
+        "Secondary Dominants",
+        "V/x chords tonicizing other degrees",
+    ),
+    # Voice leading features
+    "voice_leading_smoothness": (
+        "Voice Leading",
+        "Quality of melodic motion between chords",
+    ),
+    "soprano_degree": ("Soprano Degree", "Scale degree of the soprano voice"),
+    # Rhythmic features
+    "harmonic_rhythm": ("Harmonic Rhythm", "Rate of chord change"),
+    # Legacy support for common features
+    "lt_suppression": (
+        "Leading Tone Suppression",
+        "Avoidance of leading tone resolution",
+    ),
+    "raised6_ratio": ("Raised Sixth", "Proportion of raised 6th scale degrees"),
+    "flat7_ratio": ("Lowered Seventh", "Proportion of lowered 7th scale degrees"),
+    # Pattern weight features
+    "pattern_weight": ("Pattern Weight", "Base confidence weight for this pattern"),
+}
+
+
+def load_glossary(path: Optional[Path] = None) -> Mapping[str, Any]:
     """
     Load glossary data using the existing GlossaryProvider.
 
@@ -20,7 +95,8 @@ def load_glossary(path: Optional[Path] = None) -> Dict[str, Any]:
         path: Optional path to glossary.json file. If None, uses default.
 
     Returns:
-        Dictionary containing glossary data with categories and terms
+        Glossary data with categories and terms (the default glossary is
+        shared and read-only)
 
     Raises:
         FileNotFoundError: If glossary file doesn't exist
@@ -33,7 +109,7 @@ def load_glossary(path: Optional[Path] = None) -> Dict[str, Any]:
     return service.glossary
 
 
-def explain_feature(glossary: Dict[str, Any], key: str) -> Tuple[str, str]:
+def explain_feature(glossary: Mapping[str, Any], key: str) -> Tuple[str, str]:
     """
     Get human-readable label and tooltip for a feature key using GlossaryProvider logic.
 
@@ -46,6 +122,7 @@ def explain_feature(glossary: Dict[str, Any], key: str) -> Tuple[str, str]:
         to provide graceful fallback without exceptions.
     """
     # Create a temporary service instance to use existing lookup logic
+    # (cheap: the default glossary is shared through the pattern registry)
     service = GlossaryProvider()
     service.glossary = glossary
 
@@ -55,90 +132,15 @@ def explain_feature(glossary: Dict[str, Any], key: str) -> Tuple[str, str]:
         label = key.replace("_", " ").title()
         return label, definition
 
-    # Map common feature keys to human-readable labels with custom logic
-    feature_mappings = {
-        # Cadence features
-        "has_auth_cadence": (
-            "Authentic Cadence",
-            "Perfect or Imperfect Authentic Cadence detected",
-        ),
-        "has_plagal_cadence": (
-            "Plagal Cadence",
-            "IV-I progression, often at hymn endings",
-        ),
-        "has_half_cadence": (
-            "Half Cadence",
-            "Cadence ending on V, creating expectation",
-        ),
-        "has_deceptive_cadence": (
-            "Deceptive Cadence",
-            "V-vi avoiding resolution to tonic",
-        ),
-        # Modal features
-        "modal_char_score": (
-            "Modal Character",
-            "Strength of modal vs functional characteristics",
-        ),
-        "dorian_character": (
-            "Dorian Character",
-            "Dorian mode characteristics (raised 6th)",
-        ),
-        "phrygian_character": (
-            "Phrygian Character",
-            "Phrygian mode characteristics (lowered 2nd)",
-        ),
-        "mixolydian_character": (
-            "Mixolydian Character",
-            "Mixolydian mode characteristics (lowered 7th)",
-        ),
-        # Functional features
-        "tonal_clarity": (
-            "Tonal Clarity",
-            "Strength of functional harmonic progression",
-        ),
-        "predominant_function": (
-            "Predominant Function",
-            "Pre-dominant harmony (ii, IV, vi)",
-        ),
-        "dominant_function": ("Dominant Function", "Dominant harmony creating tension"),
-        # Chromatic features
-        "outside_key_ratio": (
-            "Chromatic Content",
-            "Proportion of notes outside the diatonic scale",
-        ),
-        "chromatic_density": ("Chromatic Density", "Amount of chromatic alteration"),
-        "secondary_dominants": (
-            "Secondary Dominants",
-            "V/x chords tonicizing other degrees",
-        ),
-        # Voice leading features
-        "voice_leading_smoothness": (
-            "Voice Leading",
-            "Quality of melodic motion between chords",
-        ),
-        "soprano_degree": ("Soprano Degree", "Scale degree of the soprano voice"),
-        # Rhythmic features
-        "harmonic_rhythm": ("Harmonic Rhythm", "Rate of chord change"),
-        # Legacy support for common features
-        "lt_suppression": (
-            "Leading Tone Suppression",
-            "Avoidance of leading tone resolution",
-        ),
-        "raised6_ratio": ("Raised Sixth", "Proportion of raised 6th scale degrees"),
-        "flat7_ratio": ("Lowered Seventh", "Proportion of lowered 7th scale degrees"),
-        # Pattern weight features
-        "pattern_weight": ("Pattern Weight", "Base confidence weight for this pattern"),
-    }
-
-    if key in feature_mappings:
-        return feature_mappings[key]
+    if key in _FEATURE_MAPPINGS:
+        return _FEATURE_MAPPINGS[key]
 
     # Try to extract from glossary using existing paths
     cadences = glossary.get("cadences", {})
     if key.lower() in [k.lower() for k in cadences.keys()]:
         for cadence_key, cadence_data in cadences.items():
             if key.lower() == cadence_key.lower():
-                if isinstance(cadence_data, dict) and "definition" in cadence_data:
+                if isinstance(cadence_data, Mapping) and "definition" in cadence_data:
                     label = cadence_key.replace("_", " ")
                     return label, cadence_data["definition"]
 
@@ -153,7 +155,7 @@ def explain_feature(glossary: Dict[str, Any], key: str) -> Tuple[str, str]:
 
 
 def enrich_features(
-    glossary: Dict[str, Any], features: Dict[str, Any]
+    glossary: Mapping[str, Any], features: Dict[str, Any]
 ) -> Dict[str, Any]:
     """
     Enrich feature dictionary with UI labels and tooltips.
@@ -188,7 +190,7 @@ def enrich_features(
 
 
 def get_summary_terms(
-    glossary: Dict[str, Any], feature_keys: list[str]
+    glossary: Mapping[str, Any], feature_keys: list[str]
 ) -> Dict[str, Dict[str, str]]:
     """
     Generate summary terms mapping for AnalysisSummary.terms field.
@@ -212,7 +214,7 @@ def get_summary_terms(
     return terms
 
 
-def describe_feature(glossary: Dict[str, Any], key: str) -> Dict[str, Any]:
+def describe_feature(glossary: Mapping[str, Any], key: str) -> Dict[str, Any]:
     """
     Get comprehensive description of a feature for documentation/debugging.
 
@@ -249,7 +251,7 @@ def describe_feature(glossary: Dict[str, Any], key: str) -> Dict[str, Any]:
     return description
 
 
-def load_default_glossary() -> Dict[str, Any]:
+def load_default_glossary() -> Mapping[str, Any]:
     """
     Load glossary from default location using GlossaryProvider.
 
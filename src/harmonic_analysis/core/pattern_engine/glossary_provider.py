@@ -6,10 +6,10 @@ terms used in pattern analysis results.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 try:
-    from ...resources import load_glossary
+    from .pattern_registry import get_pattern_registry
 except ImportError:
     # Fallback for testing or when resources aren't available
     from pathlib import Path
@@ -22,11 +22,12 @@ class GlossaryProvider:
         """Initialize glossary provider.
 
         Args:
-            glossary_path: Path to glossary JSON file. If None, uses resource loader.
+            glossary_path: Path to glossary JSON file. If None, shares the
+                read-only packaged glossary from the pattern registry.
         """
         if glossary_path is None:
             try:
-                self.glossary: Dict[str, Any] = load_glossary()
+                self.glossary: Mapping[str, Any] = get_pattern_registry().glossary()
             except (ImportError, NameError):
                 # Fallback to old path-based loading
                 glossary_path_obj = Path(__file__).parent / "glossary.json"
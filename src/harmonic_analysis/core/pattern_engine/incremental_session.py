@@ -0,0 +1,617 @@
+"""
+Incremental analysis for progressions that are built up and edited live.
+
+A live front end appends chords one by one, and a score editor changes,
+inserts or deletes chords in the middle of long progressions. Re-running the
+full pipeline after every keystroke repeats romanization, every pattern scan
+and the whole soft-NMS pass. IncrementalAnalysisSession keeps the romanized
+context, the evidence found so far and a running AggregationState, and only
+re-checks the pattern windows that touch the changed chords.
+
+The envelopes it produces are identical to PatternEngine.analyze() on the
+current progression (apart from timing).
+"""
+
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from harmonic_analysis.dto import AnalysisEnvelope, EvidenceDTO, SectionDTO
+
+from .aggregator import AggregationState
+from .compiled_pattern import SCOPE_HARMONIC, CompiledPattern, CompiledSequence
+from .evidence import Evidence
+from .pattern_engine import AnalysisContext, PatternEngine
+from .roman_numeral import MatchKey, parse_roman
+from .sequence_scanner import LITERAL, SEQUENCE_MATCHERS, find_sequence_starts
+from .token_converter import romanize_chord
+
+# Matchers whose context sequence lines up one-to-one with the chords
+POSITIONAL_MATCHERS = ("roman_seq", "chord_seq")
+
+EvidenceKey = Tuple[int, int, int]
+"""(pattern index, matcher kind index, span start) - the batch evidence order."""
+
+_Entry = Tuple[CompiledPattern, int, CompiledSequence]
+
+
+@dataclass
+class EvidenceDiff:
+    """Evidence that appeared or disappeared because of an edit."""
+
+    added: List[EvidenceDTO] = field(default_factory=list)
+    """New evidence (spans in post-edit chord indices)."""
+
+    removed: List[EvidenceDTO] = field(default_factory=list)
+    """Evidence no longer present (spans in pre-edit chord indices)."""
+
+    def __bool__(self) -> bool:
+        """True when the edit changed any evidence."""
+        return bool(self.added or self.removed)
+
+
+class IncrementalAnalysisSession:
+    """
+    Stateful analysis of a chord progression that is extended or edited.
+
+    Sessions analyze harmonic input in a fixed key (no melody or scales).
+    Patterns whose matches depend on more than the chords inside the window
+    (for example scale-degree sequences) are recomputed in full each time.
+    """
+
+    def __init__(
+        self,
+        engine: PatternEngine,
+        key: str,
+        profile: str = "classical",
+        metadata: Optional[Dict[str, Any]] = None,
+        sections: Optional[List[SectionDTO]] = None,
+    ) -> None:
+        """
+        Start an empty session.
+
+        Args:
+            engine: Pattern engine with patterns loaded
+            key: Key used for romanization and analysis (e.g., "C major")
+            profile: Romanization/analysis profile
+            metadata: Extra context metadata (profile is always included)
+            sections: Optional section annotations for the summary
+
+        Raises:
+            ValueError: If no key is given
+        """
+        if not key:
+            raise ValueError("IncrementalAnalysisSession requires a key")
+
+        self.engine = engine
+        self.key = key
+        self.profile = profile
+        self.metadata: Dict[str, Any] = {"profile": profile, **(metadata or {})}
+        self.sections = list(sections or [])
+
+        self._chords: List[str] = []
+        self._romans: List[str] = []
+        self._keys: Dict[str, List[MatchKey]] = {
+            kind: [] for kind in POSITIONAL_MATCHERS
+        }
+        self._state = AggregationState(engine.aggregator)
+        # Matching reads the live lists; envelopes get a copied snapshot
+        self._live = AnalysisContext(
+            key=key,
+            chords=self._chords,
+            roman_numerals=self._romans,
+            melody=[],
+            scales=[],
+            metadata=self.metadata,
+            sections=self.sections,
+        )
+        self._dtos: Dict[EvidenceKey, EvidenceDTO] = {}
+        self._last_end: Dict[Tuple[int, int], int] = {}
+        self._end_anchored: List[EvidenceKey] = []
+
+        # Opening move: sort positional sequences by how they can be updated
+        self._patterns: Dict[int, CompiledPattern] = {}
+        self._tail_index: Dict[str, Dict[Any, List[_Entry]]] = {}
+        self._tail_open: Dict[str, List[_Entry]] = {}
+        self._free: List[_Entry] = []  # overlapping matches allowed
+        self._greedy: List[_Entry] = []  # greedy non-overlapping matches
+        self._anchored: List[_Entry] = []  # pinned to the start or end
+        self._rescanned: List[CompiledPattern] = []
+        for pattern in engine.compiled_patterns:
+            if not pattern.applies_to(SCOPE_HARMONIC):
+                continue
+            self._patterns[pattern.index] = pattern
+            if any(s.kind not in POSITIONAL_MATCHERS for s in pattern.sequences):
+                self._rescanned.append(pattern)
+                continue
+            for sequence in pattern.sequences:
+                if not sequence.in_window or not sequence.tokens:
+                    continue
+                entry = (pattern, SEQUENCE_MATCHERS.index(sequence.kind), sequence)
+                if pattern.anchor:
+                    self._anchored.append(entry)
+                elif not pattern.overlap_ok:
+                    self._greedy.append(entry)
+                else:
+                    self._free.append(entry)
+
+                # Appends look sequences up by their last token
+                last = sequence.tokens[-1]
+                if last.kind == LITERAL:
+                    self._tail_index.setdefault(sequence.kind, {}).setdefault(
+                        last.key, []
+                    ).append(entry)
+                else:
+                    self._tail_open.setdefault(sequence.kind, []).append(entry)
+        self._rescanned_indices = {pattern.index for pattern in self._rescanned}
+
+    def __len__(self) -> int:
+        """Number of chords in the progression."""
+        return len(self._chords)
+
+    @property
+    def chords(self) -> List[str]:
+        """Chord symbols of the progression."""
+        return list(self._chords)
+
+    @property
+    def roman_numerals(self) -> List[str]:
+        """Roman numerals of the progression."""
+        return list(self._romans)
+
+    @property
+    def evidence_count(self) -> int:
+        """Number of pattern matches currently held."""
+        return len(self._state)
+
+    def context(self) -> AnalysisContext:
+        """Snapshot of the current analysis context."""
+        return AnalysisContext(
+            key=self.key,
+            chords=list(self._chords),
+            roman_numerals=list(self._romans),
+            melody=[],
+            scales=[],
+            metadata=dict(self.metadata),
+            sections=list(self.sections),
+        )
+
+    def append(self, chord: str, roman: Optional[str] = None) -> AnalysisEnvelope:
+        """
+        Append a chord and return the updated analysis.
+
+        Args:
+            chord: Chord symbol (e.g., "G7")
+            roman: Roman numeral for the chord (romanized in the session key
+                when omitted)
+
+        Returns:
+            AnalysisEnvelope for the whole progression so far
+        """
+        start_time = time.time()
+        self._append(chord, roman)
+        self._rescan_patterns(self._live)
+        return self._envelope(start_time)
+
+    def extend(self, chords: List[str]) -> AnalysisEnvelope:
+        """
+        Append several chords, building the envelope only once at the end.
+
+        Args:
+            chords: Chord symbols to append in order
+
+        Returns:
+            AnalysisEnvelope for the whole progression so far
+        """
+        start_time = time.time()
+        for chord in chords:
+            self._append(chord, None)
+        self._rescan_patterns(self._live)
+        return self._envelope(start_time)
+
+    def edit(
+        self,
+        index: int,
+        old: Optional[str],
+        new: Optional[str],
+        roman: Optional[str] = None,
+    ) -> Tuple[AnalysisEnvelope, EvidenceDiff]:
+        """
+        Change, insert or delete one chord and re-analyze around it.
+
+        Only evidence whose span touches the edited position is recomputed;
+        evidence after an insertion or deletion is shifted, not re-matched.
+
+        Args:
+            index: Chord position of the edit
+            old: Chord currently at index (None to insert before index)
+            new: Replacement chord (None to delete the chord at index)
+            roman: Roman numeral for the new chord (romanized when omitted)
+
+        Returns:
+            Tuple of (updated AnalysisEnvelope, EvidenceDiff for the edit)
+
+        Raises:
+            ValueError: If the edit is empty, out of range, or old does not
+                match the chord at index
+        """
+        start_time = time.time()
+        length = len(self._chords)
+        if old is None and new is None:
+            raise ValueError("Edit needs an old chord, a new chord, or both")
+        if old is None:
+            if not 0 <= index <= length:
+                raise ValueError(f"Insert position {index} out of range")
+        elif not 0 <= index < length or self._chords[index] != old:
+            raise ValueError(f"Chord at {index} is not {old!r}; analysis is stale")
+
+        removed_end = index + (old is not None)
+        added_end = index + (new is not None)
+        shift = added_end - removed_end
+        before = dict(self._dtos)
+
+        # Opening move: drop what the edit invalidates, shift what follows
+        blocked = self._invalidate(index, removed_end, shift)
+
+        # Main play: apply the edit, then match windows over the new chords
+        values = [self._chords, self._romans, *self._keys.values()]
+        if new is None:
+            for items in values:
+                del items[index]
+        else:
+            roman = roman if roman is not None else self._romanize(new)
+            row = [new, roman, parse_roman(roman).match_key, new]
+            for items, value in zip(values, row):
+                if old is None:
+                    items.insert(index, value)
+                else:
+                    items[index] = value
+
+        context = self._live
+        context.clear_derived()
+        self._match_edited_windows(context, index, added_end)
+        self._match_anchored(context)
+        self._resync_greedy(context, index, added_end, blocked)
+        self._rescan_patterns(context)
+        self._rebuild_bookkeeping()
+
+        # Victory lap: report the evidence that really changed
+        diff = self._diff(before, index, removed_end, shift)
+        return self._envelope(start_time), diff
+
+    def snapshot(self) -> AnalysisEnvelope:
+        """Envelope for the current progression without changing it."""
+        return self._envelope(time.time())
+
+    # --------------- Internals ---------------
+
+    def _romanize(self, chord: str) -> str:
+        """Romanize a chord in the session key (flats spelled with ♭)."""
+        return romanize_chord(chord, self.key, self.profile).replace("b", "♭")
+
+    def _append(self, chord: str, roman: Optional[str]) -> None:
+        """Append one chord and match the windows ending at it."""
+        if roman is None:
+            roman = self._romanize(chord)
+        self._chords.append(chord)
+        self._romans.append(roman)
+        self._keys["roman_seq"].append(parse_roman(roman).match_key)
+        self._keys["chord_seq"].append(chord)
+        self._live.clear_derived()
+
+        # Matches pinned to the old end stop matching once it moves
+        for key in self._end_anchored:
+            self._remove(key)
+        self._end_anchored = []
+        self._match_new_windows(self._live)
+
+    def _add(
+        self,
+        key: EvidenceKey,
+        context: AnalysisContext,
+        span: Tuple[int, int],
+        pattern: CompiledPattern,
+    ) -> None:
+        """Evaluate a match and record its evidence."""
+        evidence = self.engine._evaluate_pattern(pattern, context, span)
+        if evidence:
+            self._state.add(key, evidence)
+            self._dtos[key] = self.engine._convert_evidence([evidence])[0]
+
+    def _remove(self, key: EvidenceKey) -> None:
+        """Forget recorded evidence."""
+        if key in self._state:
+            self._state.remove(key)
+            del self._dtos[key]
+
+    def _valid_window(
+        self,
+        pattern: CompiledPattern,
+        sequence: CompiledSequence,
+        start: int,
+        context: AnalysisContext,
+    ) -> bool:
+        """Check a sequence's tokens and the pattern constraints at start."""
+        end = start + len(sequence)
+        length = len(self._chords)
+        if start < 0 or end > length:
+            return False
+
+        keys = self._keys[sequence.kind]
+        raw = self._romans if sequence.kind == "roman_seq" else self._chords
+        if not all(
+            token.matches(keys[start + offset], raw[start + offset])
+            for offset, token in enumerate(sequence.tokens)
+        ):
+            return False
+        return all(
+            check(self.engine, context, start, end, length)
+            for check in pattern.constraints
+        )
+
+    def _match_new_windows(self, context: AnalysisContext) -> None:
+        """Check every positional sequence window ending at the last chord."""
+        end = len(self._chords)
+        candidates: List[_Entry] = []
+        for kind in POSITIONAL_MATCHERS:
+            candidates.extend(
+                self._tail_index.get(kind, {}).get(self._keys[kind][-1], [])
+            )
+            candidates.extend(self._tail_open.get(kind, []))
+
+        for pattern, kind_index, sequence in candidates:
+            start = end - len(sequence)
+            if not self._valid_window(pattern, sequence, start, context):
+                continue
+
+            evidence_key = (pattern.index, kind_index, start)
+            if pattern.anchor == "end":
+                self._end_anchored.append(evidence_key)
+            elif not pattern.overlap_ok:
+                # Greedy non-overlap keeps the first of any overlapping matches
+                chain = (pattern.index, kind_index)
+                if start < self._last_end.get(chain, -1):
+                    continue
+                self._last_end[chain] = end
+
+            self._add(evidence_key, context, (start, end), pattern)
+
+    def _invalidate(
+        self, start: int, end: int, shift: int
+    ) -> Dict[Tuple[int, int], int]:
+        """
+        Remove evidence touching the edited chords and shift what follows.
+
+        Anchored and fully rescanned patterns are always removed; they are
+        recomputed once the edit is applied.
+
+        Args:
+            start: First edited chord (pre-edit index)
+            end: End of the replaced/deleted chords (start for insertions)
+            shift: Change in progression length
+
+        Returns:
+            Per greedy chain, the furthest post-edit end of removed matches
+        """
+        moves: Dict[Any, Tuple[Any, Evidence]] = {}
+        blocked: Dict[Tuple[int, int], int] = {}
+        for key in self._state.keys():
+            pattern_index, kind_index, span_start = key
+            pattern = self._patterns[pattern_index]
+            evidence = self._state.get(key)
+            assert evidence is not None
+            span_end = evidence.span[1]
+            if span_start < end and span_end > start:
+                if not pattern.overlap_ok:
+                    chain = (pattern_index, kind_index)
+                    moved_end = span_end + shift if span_end >= end else span_end
+                    blocked[chain] = max(blocked.get(chain, 0), moved_end)
+                self._remove(key)
+            elif pattern.anchor or pattern_index in self._rescanned_indices:
+                self._remove(key)
+            elif shift and span_start >= end:
+                new_key = (pattern_index, kind_index, span_start + shift)
+                moves[key] = (new_key, self._shifted(evidence, shift))
+                self._dtos[new_key] = self._shifted_dto(self._dtos.pop(key), shift)
+
+        self._state.relocate(moves)
+        return blocked
+
+    def _match_edited_windows(
+        self, context: AnalysisContext, start: int, end: int
+    ) -> None:
+        """Match overlap-tolerant sequences on windows touching [start, end)."""
+        length = len(self._chords)
+        for pattern, kind_index, sequence in self._free:
+            size = len(sequence)
+            for window_start in range(
+                max(0, start - size + 1), min(end, length - size + 1)
+            ):
+                if self._valid_window(pattern, sequence, window_start, context):
+                    self._add(
+                        (pattern.index, kind_index, window_start),
+                        context,
+                        (window_start, window_start + size),
+                        pattern,
+                    )
+
+    def _match_anchored(self, context: AnalysisContext) -> None:
+        """Check the single window of each start- or end-anchored sequence."""
+        length = len(self._chords)
+        for pattern, kind_index, sequence in self._anchored:
+            start = 0 if pattern.anchor == "start" else length - len(sequence)
+            if self._valid_window(pattern, sequence, start, context):
+                self._add(
+                    (pattern.index, kind_index, start),
+                    context,
+                    (start, start + len(sequence)),
+                    pattern,
+                )
+
+    def _resync_greedy(
+        self,
+        context: AnalysisContext,
+        start: int,
+        end: int,
+        blocked: Dict[Tuple[int, int], int],
+    ) -> None:
+        """
+        Re-run greedy non-overlap selection from the edit onwards.
+
+        Selection before the edit is unchanged. Past the edit the walk stops
+        once neither the previous nor the new selection blocks the current
+        position, since from there both see the same windows.
+
+        Args:
+            context: Post-edit analysis context
+            start: First edited chord (post-edit index)
+            end: End of the inserted/replaced chords (start for deletions)
+            blocked: Furthest end of removed matches per chain (see _invalidate)
+        """
+        length = len(self._chords)
+        chains: Dict[Tuple[int, int], List[int]] = {}
+        for pattern_index, kind_index, span_start in self._state.keys():
+            if not self._patterns[pattern_index].overlap_ok:
+                chains.setdefault((pattern_index, kind_index), []).append(span_start)
+
+        for pattern, kind_index, sequence in self._greedy:
+            chain = (pattern.index, kind_index)
+            size = len(sequence)
+            selected = set(chains.get(chain, []))
+            last_end = max((s + size for s in selected if s + size <= start), default=0)
+            previous_end = max(last_end, blocked.get(chain, 0))
+
+            first = max(last_end, start - size + 1)
+            for window_start in range(first, length - size + 1):
+                if window_start >= end and max(last_end, previous_end) <= window_start:
+                    break  # back in step with the previous selection
+                key = (pattern.index, kind_index, window_start)
+                if window_start in selected:
+                    previous_end = window_start + size
+                    if window_start < last_end:
+                        self._remove(key)  # now blocked by an earlier match
+                    else:
+                        last_end = window_start + size
+                elif window_start >= last_end and self._valid_window(
+                    pattern, sequence, window_start, context
+                ):
+                    self._add(
+                        key, context, (window_start, window_start + size), pattern
+                    )
+                    last_end = window_start + size
+
+    def _rescan_patterns(self, context: AnalysisContext) -> None:
+        """Fully recompute patterns that cannot be matched incrementally."""
+        if not self._rescanned:
+            return
+
+        for key in self._state.keys():
+            if key[0] in self._rescanned_indices:
+                self._remove(key)
+
+        engine = self.engine
+        sequences = engine._build_context_sequences(
+            context, engine._sequence_kinds(self._rescanned)
+        )
+        for pattern in self._rescanned:
+            if pattern.required_mode and not engine._check_mode_constraint(
+                context, pattern.required_mode
+            ):
+                continue
+            for sequence in pattern.sequences:
+                if not sequence.in_window:
+                    continue
+                keys, raw = sequences[sequence.kind]
+                spans = engine._check_compiled_starts(
+                    pattern,
+                    find_sequence_starts(sequence.tokens, keys, raw),
+                    len(sequence),
+                    len(keys),
+                    context,
+                )
+                kind_index = SEQUENCE_MATCHERS.index(sequence.kind)
+                for span in spans:
+                    self._add(
+                        (pattern.index, kind_index, span[0]), context, span, pattern
+                    )
+
+    def _rebuild_bookkeeping(self) -> None:
+        """Recompute append bookkeeping (end anchors, greedy chain ends)."""
+        self._end_anchored = []
+        self._last_end = {}
+        for key in self._state.keys():
+            pattern = self._patterns[key[0]]
+            if pattern.anchor == "end":
+                self._end_anchored.append(key)
+            elif not pattern.overlap_ok:
+                evidence = self._state.get(key)
+                assert evidence is not None
+                self._last_end[(key[0], key[1])] = evidence.span[1]
+
+    def _diff(
+        self,
+        before: Dict[EvidenceKey, EvidenceDTO],
+        start: int,
+        end: int,
+        shift: int,
+    ) -> EvidenceDiff:
+        """
+        Compare evidence before and after an edit.
+
+        Args:
+            before: Evidence DTOs by key before the edit
+            start: First edited chord (pre-edit index)
+            end: End of the replaced/deleted chords (start for insertions)
+            shift: Change in progression length
+
+        Returns:
+            EvidenceDiff of added and removed evidence
+        """
+        # Carry old evidence into post-edit positions for comparison
+        carried: Dict[EvidenceKey, EvidenceDTO] = {}
+        removed: List[EvidenceDTO] = []
+        for key, dto in before.items():
+            pattern_index, kind_index, span_start = key
+            if span_start >= end and shift:
+                key = (pattern_index, kind_index, span_start + shift)
+                carried[key] = self._shifted_dto(dto, shift)
+            elif span_start < start or not shift:
+                carried[key] = dto
+            else:
+                removed.append(dto)  # started on a deleted chord
+                continue
+            if self._dtos.get(key) != carried[key]:
+                removed.append(dto)
+
+        added = [
+            self._dtos[key]
+            for key in self._state.keys()
+            if carried.get(key) != self._dtos[key]
+        ]
+        return EvidenceDiff(added=added, removed=removed)
+
+    @staticmethod
+    def _shifted(evidence: Evidence, shift: int) -> Evidence:
+        """Evidence moved by shift chords."""
+        start, end = evidence.span
+        return replace(evidence, span=(start + shift, end + shift))
+
+    @staticmethod
+    def _shifted_dto(dto: EvidenceDTO, shift: int) -> EvidenceDTO:
+        """Evidence DTO moved by shift chords."""
+        start, end = dto.details["span"]
+        return EvidenceDTO(
+            reason=dto.reason,
+            details={**dto.details, "span": [start + shift, end + shift]},
+        )
+
+    def _envelope(self, start_time: float) -> AnalysisEnvelope:
+        """Build the envelope from the running state."""
+        keys = self._state.keys()
+        return self.engine._build_envelope(
+            self.context(),
+            self._state.evidences,
+            self._state.result(),
+            start_time,
+            evidence_dtos=[self._dtos[key] for key in keys],
+        )
@@ -35,6 +35,29 @@ def _strip_maj7_markers(s: str) -> str:
     return s.replace("7", "")
 
 
+@lru_cache(maxsize=1024)
+def _roman_root(roman: str) -> str:
+    """Root roman numeral keeping inversion figures (cached per spelling)."""
+    # Keep inversion figures – they affect function
+    if roman.endswith(("6", "65", "64", "43", "42")):
+        return roman
+    # Strip maj7 markers first, then plain 7
+    return _strip_maj7_markers(roman)
+
+
+@lru_cache(maxsize=1024)
+def _roman_base(roman: str) -> str:
+    """Base roman numeral without inversions or sevenths (cached per spelling)."""
+    # Remove common inversion/figure indicators
+    for suf in ("65", "64", "43", "42", "6"):
+        if roman.endswith(suf):
+            roman = roman[: -len(suf)]
+            break
+
+    # Strip maj7 markers first, then plain 7
+    return _strip_maj7_markers(roman)
+
+
 # Type definitions for improved type safety
 class StepEvidence(TypedDict):
     step_index: int
@@ -68,28 +91,11 @@ class Token:
 
     def roman_root(self) -> str:
         """Extract root roman numeral, keep inversions but remove extensions."""
-        r = self.roman
-        # Keep inversion figures – they affect function
-        if r.endswith(("6", "65", "64", "43", "42")):
-            return r
-        # Strip maj7 markers first, then plain 7
-        r = _strip_maj7_markers(r)
-        return r
+        return _roman_root(self.roman)
 
     def roman_base(self) -> str:
         """Extract base roman numeral with inversions and sevenths removed."""
-        r = self.roman
-
-        # Remove common inversion/figure indicators
-        for suf in ("65", "64", "43", "42", "6"):
-            if r.endswith(suf):
-                r = r[: -len(suf)]
-                break
-
-        # Strip maj7 markers first, then plain 7
-        r = _strip_maj7_markers(r)
-
-        return r
+        return _roman_base(self.roman)
 
 
 @dataclass
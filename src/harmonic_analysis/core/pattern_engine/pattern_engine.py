@@ -8,9 +8,26 @@ that unifies functional and modal analysis through a single pipeline.
 import logging
 import re
 import time
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
 from harmonic_analysis.analysis_types import EvidenceType
 from harmonic_analysis.dto import (
@@ -24,13 +41,34 @@ from harmonic_analysis.dto import (
 
 from .aggregator import Aggregator
 from .calibration import CalibrationMapping, Calibrator
+from .compiled_pattern import (
+    CompiledPattern,
+    CompiledPatternSet,
+    PrefilterStats,
+    compile_pattern,
+    context_scope_mask,
+)
 from .evidence import Evidence
 from .glossary import enrich_features, get_summary_terms, load_default_glossary
 from .glossary_provider import GlossaryProvider
 from .pattern_loader import PatternLoader
+from .pattern_registry import get_pattern_registry
 from .plugin_registry import PluginRegistry
+from .roman_numeral import normalize_roman_for_matching, parse_roman
+from .sequence_scanner import SEQUENCE_MATCHERS, find_sequence_starts
 from .target_builder_unified import UnifiedTargetBuilder as TargetBuilder
 
+# Long-form analysis: progressions longer than this are matched in chunks of
+# LONG_FORM_CHUNK_WINDOWS times the widest pattern window
+LONG_FORM_THRESHOLD = 2048
+LONG_FORM_CHUNK_WINDOWS = 64
+
+# Matcher kinds whose context sequence is aligned to the chords (chunkable)
+CHUNKED_MATCHERS = ("roman_seq", "chord_seq")
+
+# Aggregated confidences, in the order they are calibrated and reported
+CONFIDENCE_KEYS = ("functional_conf", "modal_conf", "chromatic_conf", "combined_conf")
+
 
 @dataclass
 class ModalEvidenceRecord:
@@ -76,6 +114,11 @@ class AnalysisContext:
     sections: List[SectionDTO] = field(default_factory=list)
     """Annotated sections provided by the caller (optional)."""
 
+    _derived: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Lazily computed features shared by every pattern in one analysis."""
+
     def __post_init__(self) -> None:
         """Validate key-context requirements after initialization."""
         from ..validation_errors import validate_key_for_romans
@@ -84,6 +127,27 @@ class AnalysisContext:
         if self.roman_numerals and not self.key:
             validate_key_for_romans(self.roman_numerals, self.key)
 
+    def derived(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a derived feature, computing it on first use.
+
+        Args:
+            name: Feature name (e.g., "melodic_intervals")
+            compute: Zero-argument callable that builds the feature
+
+        Returns:
+            The cached feature value
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = compute()
+            return value
+
+    def clear_derived(self) -> None:
+        """Drop cached derived features after the inputs were mutated."""
+        self._derived.clear()
+
 
 class PatternEngine:
     """
@@ -92,6 +156,10 @@ class PatternEngine:
     Processes chord progressions through pattern matching,
     evidence aggregation, and calibration to produce
     functional and modal analysis results.
+
+    analyze() and analyze_batch() may run on many threads at once: all
+    per-call state lives in the AnalysisContext and local objects, and the
+    compiled patterns are immutable.
     """
 
     def __init__(
@@ -118,10 +186,14 @@ class PatternEngine:
         self.calibrator = calibrator or Calibrator()
         self.target_builder = target_builder or TargetBuilder()
 
-        self._patterns: Dict[str, Any] = {}
+        self._patterns: Mapping[str, Any] = {}
         self._calibration_mapping: Optional[CalibrationMapping] = None
-        self._glossary: Dict[str, Any] = {}
+        self._glossary: Mapping[str, Any] = {}
         self._glossary_provider: Optional[GlossaryProvider] = None
+        self._compiled_cache: Optional[
+            Tuple[Sequence[Mapping[str, Any]], int, int, CompiledPatternSet]
+        ] = None
+        self.prefilter_stats = PrefilterStats()
         self.logger = logging.getLogger(__name__)
 
         # Load glossary on initialization with graceful fallback
@@ -131,8 +203,9 @@ class PatternEngine:
             provider = None
 
         if provider is not None:
+            # The default glossary is shared read-only, so no per-engine copy
             self._glossary_provider = provider
-            self._glossary = dict(provider.glossary)
+            self._glossary = provider.glossary
         else:
             try:
                 self._glossary = load_default_glossary()
@@ -144,30 +217,79 @@ class PatternEngine:
         """
         Load pattern definitions from JSON file.
 
+        The file is validated and compiled once per process; engines loading
+        the same contents share its frozen data and compiled patterns through
+        the pattern registry.
+
         Args:
             path: Path to patterns.json file
         """
-        self._patterns = self.loader.load(path)
+        entry = get_pattern_registry().load(path, self.loader)
+        patterns = entry.data.get("patterns", ())
+        compiled = entry.compiled_for(self.plugins) or self.loader.compile(
+            entry.data, self.plugins
+        )
+        self._patterns = entry.data
+        self._compiled_cache = (
+            patterns,
+            len(patterns),
+            self.plugins.generation,
+            compiled,
+        )
+
+    def set_patterns(self, data: Mapping[str, Any]) -> None:
+        """
+        Install validated pattern data and compile it.
+
+        Args:
+            data: Pattern data with a "patterns" list (as returned by the loader)
+        """
+        self._patterns = data
+        patterns = data.get("patterns", [])
+        self._compiled_cache = (
+            patterns,
+            len(patterns),
+            self.plugins.generation,
+            self.loader.compile(data, self.plugins),
+        )
+
+    @property
+    def compiled_patterns(self) -> CompiledPatternSet:
+        """
+        Compiled form of the installed patterns.
+
+        Recompiled when a different pattern list is installed (older callers
+        assign ``_patterns`` directly, so list identity is the signal) or when
+        new evaluator plugins are registered.
+        """
+        patterns = self._patterns.get("patterns", [])
+        generation = self.plugins.generation
+        cached = self._compiled_cache
+        if (
+            cached is not None
+            and cached[0] is patterns
+            and cached[1] == len(patterns)
+            and cached[2] == generation
+        ):
+            return cached[3]
+
+        compiled = self.loader.compile(self._patterns, self.plugins)
+        self._compiled_cache = (patterns, len(patterns), generation, compiled)
+        return compiled
 
     def load_calibration(self, path: Path) -> None:
         """
         Load pre-computed calibration mapping.
 
         Args:
-            path: Path to calibration file
-        """
-        # This would load a serialized CalibrationMapping
-        # For now, we'll use identity mapping
-        from .calibration import CalibrationMetrics
-
-        self._calibration_mapping = CalibrationMapping(
-            mapping_type="identity",
-            params={},
-            metrics=CalibrationMetrics(
-                ece=0.0, brier=0.0, correlation=1.0, variance=1.0, sample_count=1000
-            ),
-            passed_gates=True,
-        )
+            path: Path to a calibration artifact written by
+                CalibrationMapping.save()
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a supported calibration artifact
+        """
+        self._calibration_mapping = CalibrationMapping.load(path)
 
     def analyze(self, context: AnalysisContext) -> AnalysisEnvelope:
         """
@@ -181,17 +303,124 @@ class PatternEngine:
         """
         start_time = time.time()
 
-        # Match patterns against context
-        evidences = self._match_patterns(context)
+        # Match patterns against context (chunked for long-form input)
+        evidences = self._match_context(context)
 
         # Aggregate evidence into scores
         aggregated = self.aggregator.aggregate(evidences)
 
+        return self._build_envelope(context, evidences, aggregated, start_time)
+
+    def analyze_batch(
+        self, contexts: Sequence[AnalysisContext]
+    ) -> List[AnalysisEnvelope]:
+        """
+        Analyze many contexts, sharing setup and vectorizing the scoring.
+
+        Every context is matched against the same compiled pattern set; the
+        evidence of the whole batch is then aggregated and calibrated in
+        array operations. Each envelope equals analyze() for its context and
+        reports its own matching and envelope-building time.
+
+        Args:
+            contexts: Normalized analysis contexts
+
+        Returns:
+            AnalysisEnvelopes in input order
+        """
+        # Opening move: match every context, timing each one
+        evidence_lists: List[List[Evidence]] = []
+        match_seconds: List[float] = []
+        for context in contexts:
+            started = time.time()
+            evidence_lists.append(self._match_context(context))
+            match_seconds.append(time.time() - started)
+
+        # Main play: aggregate and calibrate the whole batch at once
+        aggregated = self.aggregator.aggregate_batch(evidence_lists)
+        raw = np.array(
+            [[item[name] for name in CONFIDENCE_KEYS] for item in aggregated],
+            dtype=float,
+        ).reshape(len(aggregated), len(CONFIDENCE_KEYS))
+        calibrated = self._calibrate_batch(raw).tolist()
+
+        # Victory lap: build envelopes in input order
+        envelopes = []
+        for context, evidences, item, confidences, seconds in zip(
+            contexts, evidence_lists, aggregated, calibrated, match_seconds
+        ):
+            envelopes.append(
+                self._build_envelope(
+                    context,
+                    evidences,
+                    item,
+                    time.time() - seconds,
+                    calibrated=tuple(confidences),
+                )
+            )
+        return envelopes
+
+    def _match_context(self, context: AnalysisContext) -> List[Evidence]:
+        """Match patterns, switching to chunked matching for long input."""
+        if max(len(context.chords), len(context.roman_numerals)) > (
+            LONG_FORM_THRESHOLD
+        ):
+            return self._match_patterns_chunked(context)
+        return self._match_patterns(context)
+
+    def analyze_long(
+        self, context: AnalysisContext, chunk_size: Optional[int] = None
+    ) -> AnalysisEnvelope:
+        """
+        Analyze a long progression (full movements) in overlapping chunks.
+
+        Produces the same envelope as analyze(); matching works on one chunk
+        of chords at a time so its working set stays bounded. analyze()
+        switches to this mode by itself above LONG_FORM_THRESHOLD chords.
+
+        Args:
+            context: Normalized analysis context
+            chunk_size: Window starts per chunk (sized from the widest
+                pattern window when omitted)
+
+        Returns:
+            AnalysisEnvelope with primary and alternative interpretations
+        """
+        start_time = time.time()
+        evidences = self._match_patterns_chunked(context, chunk_size)
+        aggregated = self.aggregator.aggregate(evidences)
+        return self._build_envelope(context, evidences, aggregated, start_time)
+
+    def _build_envelope(
+        self,
+        context: AnalysisContext,
+        evidences: List[Evidence],
+        aggregated: Dict[str, Any],
+        start_time: float,
+        evidence_dtos: Optional[List[EvidenceDTO]] = None,
+        calibrated: Optional[Tuple[float, ...]] = None,
+    ) -> AnalysisEnvelope:
+        """
+        Build the analysis envelope from matched and aggregated evidence.
+
+        Args:
+            context: Analysis context the evidence was matched against
+            evidences: Evidence in match order
+            aggregated: Aggregator output for the evidence
+            start_time: time.time() when the analysis started
+            evidence_dtos: Pre-converted evidence DTOs (converted here if None)
+            calibrated: Already calibrated confidences in CONFIDENCE_KEYS
+                order (calibrated here if None)
+
+        Returns:
+            AnalysisEnvelope with primary and alternative interpretations
+        """
         # Apply calibration if available
-        functional_conf = self._calibrate(aggregated["functional_conf"])
-        modal_conf = self._calibrate(aggregated["modal_conf"])
-        chromatic_conf = self._calibrate(aggregated["chromatic_conf"])
-        combined_conf = self._calibrate(aggregated["combined_conf"])
+        if calibrated is None:
+            calibrated = tuple(
+                self._calibrate(aggregated[name]) for name in CONFIDENCE_KEYS
+            )
+        functional_conf, modal_conf, chromatic_conf, combined_conf = calibrated
 
         # Round confidence values to avoid floating-point precision issues
         functional_conf = round(float(functional_conf), 3)
@@ -216,7 +445,8 @@ class PatternEngine:
         )
 
         # Convert internal evidence to public DTOs
-        evidence_dtos = self._convert_evidence(evidences)
+        if evidence_dtos is None:
+            evidence_dtos = self._convert_evidence(evidences)
 
         # Calculate timing
         analysis_time_ms = (time.time() - start_time) * 1000
@@ -234,24 +464,54 @@ class PatternEngine:
         """
         Match all patterns against the analysis context.
 
+        Patterns are first pruned by scope and by the token-set prefilter
+        (a pattern whose required tokens are not all present cannot match).
+        The survivors' sequences are scanned in a single pass per sequence
+        kind through the compiled multi-pattern scanner; constraints and
+        windows are then checked only on the candidate spans it reports.
+
         Args:
             context: Analysis context
 
         Returns:
             List of evidence from matched patterns
         """
-        evidences = []
+        evidences: List[Evidence] = []
 
-        # Get patterns from loaded data
-        patterns = self._patterns.get("patterns", [])
+        # Get compiled patterns from loaded data
+        compiled = self.compiled_patterns
+        if not compiled:
+            return evidences
 
-        for pattern in patterns:
-            # Check if pattern applies to this context
-            if not self._pattern_applies(pattern, context):
-                continue
+        # Opening move: prune by scope, then by the tokens the context contains
+        context_mask = context_scope_mask(context)
+        in_scope = [pattern for pattern in compiled if pattern.applies_to(context_mask)]
 
-            # Find matches for this pattern
-            matches = self._find_pattern_matches(pattern, context)
+        sequences = self._build_context_sequences(
+            context, self._sequence_kinds(in_scope)
+        )
+        token_mask = compiled.context_token_mask(sequences)
+        candidates = [pattern for pattern in in_scope if pattern.admits(token_mask)]
+        self.prefilter_stats.record(
+            len(compiled),
+            len(compiled) - len(in_scope),
+            len(in_scope) - len(candidates),
+        )
+        if not candidates:
+            return evidences
+
+        # Main play: one automaton pass per sequence kind the survivors need
+        needed = self._sequence_kinds(candidates)
+        hits = compiled.scanner.scan(
+            {kind: sequences[kind] for kind in sequences if kind in needed}
+        )
+
+        lengths = self._sequence_lengths(sequences)
+        for pattern in candidates:
+            # Find matches for this pattern among the scanner's candidates
+            matches = self._collect_pattern_matches(
+                pattern, context, hits.get(pattern.index, {}), lengths
+            )
 
             for match_span in matches:
                 # Evaluate pattern at this location
@@ -261,36 +521,191 @@ class PatternEngine:
 
         return evidences
 
+    def _match_patterns_chunked(
+        self, context: AnalysisContext, chunk_size: Optional[int] = None
+    ) -> List[Evidence]:
+        """
+        Match all patterns against a long context chunk by chunk.
+
+        Chord-aligned sequences (romans, chord symbols) are tokenized and
+        scanned in chunks that overlap by the widest pattern window, keeping
+        only windows that start inside each chunk, so no match is lost or
+        reported twice. Constraints and greedy non-overlap then run on the
+        stitched start lists exactly as in _match_patterns(), which this
+        reproduces evidence for evidence.
+
+        Args:
+            context: Analysis context
+            chunk_size: Window starts per chunk (sized from the widest
+                pattern window when omitted)
+
+        Returns:
+            List of evidence from matched patterns
+        """
+        evidences: List[Evidence] = []
+        compiled = self.compiled_patterns
+        if not compiled:
+            return evidences
+
+        context_mask = context_scope_mask(context)
+        in_scope = [pattern for pattern in compiled if pattern.applies_to(context_mask)]
+
+        kinds = self._sequence_kinds(in_scope)
+        chunked = [kind for kind in kinds if kind in CHUNKED_MATCHERS]
+
+        # Opening move: sequences not aligned to chords are matched whole
+        whole = self._build_context_sequences(
+            context, [kind for kind in kinds if kind not in CHUNKED_MATCHERS]
+        )
+        token_mask = compiled.context_token_mask(whole)
+        hits: Dict[int, Dict[str, List[int]]] = {}
+        for pattern_index, by_kind in compiled.scanner.scan(whole).items():
+            hits.setdefault(pattern_index, {}).update(by_kind)
+        lengths = self._sequence_lengths(whole)
+        lengths.update(
+            roman_seq=len(context.roman_numerals), chord_seq=len(context.chords)
+        )
+
+        # Main play: scan chord-aligned sequences one overlapping chunk at a time
+        total = max(len(context.roman_numerals), len(context.chords))
+        overlap = max(compiled.max_window - 1, 0)
+        step = max(chunk_size or compiled.max_window * LONG_FORM_CHUNK_WINDOWS, 1)
+        chunk_starts = range(0, total, step) if chunked else range(0)
+        for chunk_start in chunk_starts:
+            chunk_end = min(chunk_start + step, total)
+            sequences = self._build_context_sequences(
+                context, chunked, (chunk_start, min(chunk_end + overlap, total))
+            )
+            token_mask |= compiled.context_token_mask(sequences)
+            for pattern_index, by_kind in compiled.scanner.scan(sequences).items():
+                pattern_hits = hits.setdefault(pattern_index, {})
+                for kind, starts in by_kind.items():
+                    # Windows starting in the overlap belong to the next chunk
+                    pattern_hits.setdefault(kind, []).extend(
+                        chunk_start + start
+                        for start in starts
+                        if chunk_start + start < chunk_end
+                    )
+
+        candidates = [pattern for pattern in in_scope if pattern.admits(token_mask)]
+        self.prefilter_stats.record(
+            len(compiled),
+            len(compiled) - len(in_scope),
+            len(in_scope) - len(candidates),
+        )
+
+        # Victory lap: validate stitched starts and evaluate in library order
+        for pattern in candidates:
+            matches = self._collect_pattern_matches(
+                pattern, context, hits.get(pattern.index, {}), lengths
+            )
+            for match_span in matches:
+                evidence = self._evaluate_pattern(pattern, context, match_span)
+                if evidence:
+                    evidences.append(evidence)
+
+        return evidences
+
+    @staticmethod
+    def _sequence_lengths(
+        sequences: Mapping[str, Tuple[Sequence[Hashable], Sequence[str]]],
+    ) -> Dict[str, int]:
+        """Length of each context sequence."""
+        return {kind: len(keys) for kind, (keys, _raw) in sequences.items()}
+
+    @staticmethod
+    def _sequence_kinds(patterns: Iterable[CompiledPattern]) -> List[str]:
+        """Sequence matcher kinds used by any of the given patterns."""
+        kinds = {
+            sequence.kind for pattern in patterns for sequence in pattern.sequences
+        }
+        return [kind for kind in SEQUENCE_MATCHERS if kind in kinds]
+
+    def _compile_pattern(
+        self, pattern: Union[Dict[str, Any], CompiledPattern]
+    ) -> CompiledPattern:
+        """Compile a raw pattern definition on the fly (no-op if compiled)."""
+        if isinstance(pattern, CompiledPattern):
+            return pattern
+        return compile_pattern(pattern, 0, self.plugins)
+
+    def _build_context_sequences(
+        self,
+        context: AnalysisContext,
+        kinds: Iterable[str],
+        bounds: Optional[Tuple[int, int]] = None,
+    ) -> Dict[str, Tuple[Sequence[Hashable], Sequence[str]]]:
+        """
+        Build the (key, raw) context sequence for each matcher kind.
+
+        Args:
+            context: Analysis context
+            kinds: Sequence matcher kinds that need a context sequence
+            bounds: Optional (start, end) chord range for the chord-aligned
+                kinds (roman_seq, chord_seq)
+
+        Returns:
+            Mapping of matcher kind to (keys, raw) item lists
+        """
+        sequences: Dict[str, Tuple[Sequence[Hashable], Sequence[str]]] = {}
+        for kind in kinds:
+            if kind == "roman_seq":
+                raw = context.roman_numerals
+                if bounds is not None:
+                    raw = raw[bounds[0] : bounds[1]]
+                # Parse each token once; matching compares integer keys
+                keys = [parse_roman(r).match_key for r in raw]
+                sequences[kind] = (keys, raw)
+            elif kind == "chord_seq":
+                chords = context.chords
+                if bounds is not None:
+                    chords = chords[bounds[0] : bounds[1]]
+                sequences[kind] = (chords, chords)
+            elif kind == "interval_seq":
+                intervals = context.derived(
+                    "interval_seq",
+                    lambda: [str(i) for i in self._melodic_intervals(context)],
+                )
+                sequences[kind] = (intervals, intervals)
+            elif kind == "scale_degrees":
+                degrees = context.derived(
+                    "scale_degrees",
+                    lambda: [str(d) for d in self._scale_degrees(context)],
+                )
+                sequences[kind] = (degrees, degrees)
+        return sequences
+
+    def _melodic_intervals(self, context: AnalysisContext) -> List[int]:
+        """Melodic intervals of the context, extracted once per context."""
+        return context.derived(
+            "melodic_intervals",
+            lambda: self._extract_melodic_intervals(context.melody),
+        )
+
+    def _scale_degrees(self, context: AnalysisContext) -> List[int]:
+        """Scale degrees of the context, extracted once per context."""
+        return context.derived(
+            "scale_degree_values", lambda: self._extract_scale_degrees(context)
+        )
+
     def _pattern_applies(
-        self, pattern: Dict[str, Any], context: AnalysisContext
+        self, pattern: Union[Dict[str, Any], CompiledPattern], context: AnalysisContext
     ) -> bool:
         """
         Check if pattern is applicable to the context.
 
         Args:
-            pattern: Pattern definition
+            pattern: Pattern definition (raw or compiled)
             context: Analysis context
 
         Returns:
             True if pattern should be evaluated
         """
-        # Check scope requirements - pattern applies if ALL scopes satisfied
-        scope = pattern.get("scope", ["harmonic"])
-
-        # Main play: check each required scope
-        for required_scope in scope:
-            if required_scope == "harmonic" and not context.chords:
-                return False
-            elif required_scope == "melodic" and not context.melody:
-                return False
-            elif required_scope == "scale" and not context.scales:
-                return False
-
-        # Victory lap: pattern applies if ALL required scopes are satisfied
-        return True
+        # Pattern applies if ALL of its scope bits are satisfied by the context
+        return self._compile_pattern(pattern).applies_to(context_scope_mask(context))
 
     def _find_pattern_matches(
-        self, pattern: Dict[str, Any], context: AnalysisContext
+        self, pattern: Union[Dict[str, Any], CompiledPattern], context: AnalysisContext
     ) -> List[Tuple[int, int]]:
         """
         Find all locations where pattern matches.
@@ -299,96 +714,121 @@ class PatternEngine:
         enforcing window and constraint logic without external dependencies.
 
         Args:
-            pattern: Pattern definition from JSON
+            pattern: Pattern definition from JSON (or already compiled)
             context: Analysis context
 
         Returns:
             List of (start, end) spans where pattern matches
         """
-        matches = []
-        matchers = pattern.get("matchers", {})
-
-        # Opening move: handle different matcher types from the JSON schema
-        # Main play: check each sequence type and collect matches
+        compiled = self._compile_pattern(pattern)
+        sequences = self._build_context_sequences(
+            context, [sequence.kind for sequence in compiled.sequences]
+        )
 
-        if "roman_seq" in matchers:
-            seq = matchers["roman_seq"]
-            window = matchers.get("window", {})
-            constraints = matchers.get("constraints", {})
-            matches.extend(
-                self._find_sequence_matches(
-                    seq,
-                    context.roman_numerals,
-                    window,
-                    constraints,
-                    context,
-                    is_roman=True,
-                )
+        # Single pattern: slide each compiled sequence directly
+        starts_by_kind = {
+            sequence.kind: find_sequence_starts(
+                sequence.tokens, *sequences[sequence.kind]
             )
+            for sequence in compiled.sequences
+        }
+        return self._collect_pattern_matches(
+            compiled, context, starts_by_kind, self._sequence_lengths(sequences)
+        )
 
-        if "chord_seq" in matchers:
-            seq = matchers["chord_seq"]
-            window = matchers.get("window", {})
-            constraints = matchers.get("constraints", {})
-            matches.extend(
-                self._find_sequence_matches(
-                    seq,
-                    context.chords,
-                    window,
-                    constraints,
-                    context,
-                    is_roman=False,
-                )
-            )
+    def _collect_pattern_matches(
+        self,
+        pattern: CompiledPattern,
+        context: AnalysisContext,
+        starts_by_kind: Mapping[str, List[int]],
+        context_lengths: Mapping[str, int],
+    ) -> List[Tuple[int, int]]:
+        """
+        Turn candidate start positions into validated match spans.
+
+        Args:
+            pattern: Compiled pattern
+            context: Analysis context
+            starts_by_kind: Candidate starts per sequence matcher kind
+            context_lengths: Length of the context sequence per matcher kind
 
-        if "interval_seq" in matchers:
-            # Big play: restore melodic interval matching for
-            # Iteration 2 multi-scope support
-            interval_seq = matchers["interval_seq"]
-            window = matchers.get("window", {})
-            constraints = matchers.get("constraints", {})
-            # Convert melody to intervals for matching
-            melody_intervals = self._extract_melodic_intervals(context.melody)
+        Returns:
+            List of (start, end) spans where pattern matches
+        """
+        # Big play: check mode matcher field for scale patterns
+        if pattern.required_mode and not self._check_mode_constraint(
+            context, pattern.required_mode
+        ):
+            # Skip this pattern if mode doesn't match - return empty matches
+            return []
+
+        matches: List[Tuple[int, int]] = []
+        for sequence in pattern.sequences:
+            if not sequence.in_window:
+                continue
             matches.extend(
-                self._find_sequence_matches(
-                    [str(i) for i in interval_seq],
-                    [str(i) for i in melody_intervals],
-                    window,
-                    constraints,
+                self._check_compiled_starts(
+                    pattern,
+                    starts_by_kind.get(sequence.kind, []),
+                    len(sequence),
+                    context_lengths[sequence.kind],
                     context,
-                    is_roman=False,
                 )
             )
 
-        if "scale_degrees" in matchers:
-            # Victory lap: restore scale degree matching for modal patterns
-            scale_degrees = matchers["scale_degrees"]
-            window = matchers.get("window", {})
-            constraints = matchers.get("constraints", {})
+        return matches
 
-            # Big play: check mode matcher field for scale patterns
-            required_mode = matchers.get("mode")
-            if required_mode and not self._check_mode_constraint(
-                context, required_mode
-            ):
-                # Skip this pattern if mode doesn't match - return empty matches
-                return []
+    def _check_compiled_starts(
+        self,
+        pattern: CompiledPattern,
+        starts: List[int],
+        pattern_len: int,
+        context_len: int,
+        context: AnalysisContext,
+    ) -> List[Tuple[int, int]]:
+        """
+        Run a compiled pattern's constraint checkers over candidate starts.
 
-            # Extract scale degrees from melody and context
-            context_scale_degrees = self._extract_scale_degrees(context)
-            matches.extend(
-                self._find_sequence_matches(
-                    [str(d) for d in scale_degrees],
-                    [str(d) for d in context_scale_degrees],
-                    window,
-                    constraints,
-                    context,
-                    is_roman=False,
-                )
+        Args:
+            pattern: Compiled pattern (constraints and overlap policy)
+            starts: Ascending start positions where the sequence tokens match
+            pattern_len: Length of the pattern sequence
+            context_len: Length of the context sequence searched
+            context: Full analysis context for constraint checking
+
+        Returns:
+            List of (start, end) indices where pattern matches
+        """
+        if pattern_len == 0 or pattern_len > context_len:
+            return []
+
+        constraints = pattern.constraints
+        matches = [
+            (i, i + pattern_len)
+            for i in starts
+            if all(
+                check(self, context, i, i + pattern_len, context_len)
+                for check in constraints
             )
+        ]
+
+        # Handle overlap constraints
+        if not pattern.overlap_ok and len(matches) > 1:
+            matches = self._drop_overlapping(matches)
 
         return matches
 
+    @staticmethod
+    def _drop_overlapping(matches: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Remove overlapping matches, keeping first occurrences."""
+        non_overlapping = []
+        last_end = -1
+        for start, end in matches:
+            if start >= last_end:
+                non_overlapping.append((start, end))
+                last_end = end
+        return non_overlapping
+
     def _extract_melodic_intervals(self, melody: List[Any]) -> List[int]:
         """
         Extract semitone intervals from melody.
@@ -635,150 +1075,6 @@ class PatternEngine:
         # and verify qualities like "smooth", "contrary", "parallel", etc.
         return True
 
-    def _find_sequence_matches(
-        self,
-        pattern_seq: List[str],
-        context_seq: List[str],
-        window: Dict[str, Any],
-        constraints: Dict[str, Any],
-        context: AnalysisContext,
-        is_roman: bool = False,
-    ) -> List[Tuple[int, int]]:
-        """
-        Find all occurrences of a sequence pattern with window/constraint enforcement.
-
-        Args:
-            pattern_seq: Pattern sequence to find
-            context_seq: Sequence to search in
-            window: Window constraints (min/max length, overlap)
-            constraints: Additional constraints (position, key_context, etc.)
-            context: Full analysis context for constraint checking
-
-        Returns:
-            List of (start, end) indices where pattern matches
-        """
-        matches: List[Tuple[int, int]] = []
-        pattern_len = len(pattern_seq)
-        context_len = len(context_seq)
-
-        # Check window length constraints
-        min_len = window.get("min", pattern_len)
-        max_len = window.get("max", pattern_len)
-
-        if pattern_len < min_len or pattern_len > max_len:
-            return matches
-
-        if pattern_len == 0 or pattern_len > context_len:
-            return matches
-
-        # Main search: find pattern occurrences
-        for i in range(context_len - pattern_len + 1):
-            # Check if pattern matches at position i
-            pattern_matches = True
-
-            for j, pattern_item in enumerate(pattern_seq):
-                context_item = context_seq[i + j]
-
-                # Handle wildcards and special patterns
-                if pattern_item == "*" or pattern_item == ".*":
-                    continue  # Wildcard matches anything
-
-                # Check if pattern_item is a regex pattern
-                is_regex = any(
-                    char in pattern_item
-                    for char in ["*", "+", "?", "[", "]", "(", ")", "|", "^", "$"]
-                )
-
-                if is_regex:
-                    try:
-                        # Try regex matching (case-insensitive)
-                        if re.match(pattern_item, context_item, re.IGNORECASE):
-                            continue  # Regex match found
-                        else:
-                            pattern_matches = False
-                            break
-                    except re.error:
-                        # Invalid regex, fall back to exact matching
-                        pass
-
-                # Normalize for comparison (handle unicode flat symbols
-                # and strip extensions)
-                if is_roman:
-                    pattern_normalized = self._normalize_roman_for_matching(
-                        pattern_item
-                    )
-                    context_normalized = self._normalize_roman_for_matching(
-                        context_item
-                    )
-                else:
-                    pattern_normalized = pattern_item
-                    context_normalized = context_item
-
-                if pattern_normalized != context_normalized:
-                    pattern_matches = False
-                    break
-
-            if pattern_matches:
-                # Check position constraints
-                if "position" in constraints:
-                    position = constraints["position"]
-                    if position == "start" and i != 0:
-                        continue
-                    elif position == "end" and i + pattern_len != context_len:
-                        continue
-
-                # Check key context constraints
-                if "key_context" in constraints:
-                    key_context = constraints["key_context"]
-                    if key_context == "diatonic" and context.key:
-                        # Time to tackle the tricky bit: verify all chords
-                        # are diatonic to key
-                        if not self._verify_diatonic_context(
-                            context, i, i + pattern_len
-                        ):
-                            continue
-
-                # Big play: restore missing high-value constraints for pattern precision
-                if "soprano_degree" in constraints:
-                    # Check soprano scale degree at cadence resolution
-                    expected_degrees = constraints["soprano_degree"]
-                    if not self._check_soprano_degree(
-                        context, i + pattern_len - 1, expected_degrees
-                    ):
-                        continue
-
-                if "bass_motion" in constraints:
-                    # Check bass line motion pattern
-                    expected_motion = constraints["bass_motion"]
-                    if not self._check_bass_motion(
-                        context, i, i + pattern_len, expected_motion
-                    ):
-                        continue
-
-                if "voice_leading" in constraints:
-                    # Check voice leading quality
-                    expected_quality = constraints["voice_leading"]
-                    if not self._check_voice_leading(
-                        context, i, i + pattern_len, expected_quality
-                    ):
-                        continue
-
-                # Victory lap: add valid match
-                matches.append((i, i + pattern_len))
-
-        # Handle overlap constraints
-        if not window.get("overlap_ok", True) and len(matches) > 1:
-            # Remove overlapping matches, keeping first occurrences
-            non_overlapping = []
-            last_end = -1
-            for start, end in matches:
-                if start >= last_end:
-                    non_overlapping.append((start, end))
-                    last_end = end
-            matches = non_overlapping
-
-        return matches
-
     def _normalize_roman_for_matching(self, roman: str) -> str:
         """
         Normalize a roman numeral for pattern matching.
@@ -792,28 +1088,7 @@ class PatternEngine:
         Returns:
             Base roman numeral (e.g., "V", "V", "vi°")
         """
-        # Opening move: handle unicode flats
-        normalized = roman.replace("b", "♭")
-
-        # Main play: strip common extensions
-        # Remove 7th indicators (7, 9, 11, 13, maj7, etc.)
-        normalized = re.sub(r"\d+", "", normalized)
-        normalized = re.sub(r"maj", "", normalized, flags=re.IGNORECASE)
-        normalized = re.sub(r"min", "", normalized, flags=re.IGNORECASE)
-        normalized = re.sub(r"add", "", normalized, flags=re.IGNORECASE)
-        normalized = re.sub(r"sus", "", normalized, flags=re.IGNORECASE)
-
-        # Remove inversion figures (64, 6, 43, etc.) - but preserve quality
-        # markers like °, ø, +
-        # Careful: don't remove degree numbers like vi, VII, etc.
-        if "/" in normalized:
-            # Handle secondary dominants: V/vi -> V, vii°/V -> vii°
-            normalized = normalized.split("/")[0]
-
-        # Victory lap: clean up any trailing spaces or punctuation
-        normalized = normalized.strip()
-
-        return normalized
+        return normalize_roman_for_matching(roman)
 
     def _find_pattern_by_id(self, pattern_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -825,14 +1100,11 @@ class PatternEngine:
         Returns:
             Pattern definition dictionary or None if not found
         """
-        patterns = self._patterns.get("patterns", [])
-        for pattern in patterns:
-            if pattern.get("id") == pattern_id:
-                return dict(pattern)  # Ensure Dict[str, Any] type
-        return None
+        pattern = self.compiled_patterns.get(pattern_id)
+        return dict(pattern.source) if pattern else None
 
     def _get_pattern_display_name(
-        self, pattern_def: Optional[Dict[str, Any]], pattern_id: str
+        self, pattern_def: Optional[Mapping[str, Any]], pattern_id: str
     ) -> str:
         """
         Get the best display name for a pattern, preferring aliases for
@@ -867,28 +1139,34 @@ class PatternEngine:
         return pattern_id.replace(".", " ").title()
 
     def _evaluate_pattern(
-        self, pattern: Dict[str, Any], context: AnalysisContext, span: Tuple[int, int]
+        self,
+        pattern: Union[Dict[str, Any], CompiledPattern],
+        context: AnalysisContext,
+        span: Tuple[int, int],
     ) -> Optional[Evidence]:
         """
         Evaluate a pattern match to produce evidence.
 
         Args:
-            pattern: Pattern definition
+            pattern: Pattern definition (raw or compiled)
             context: Analysis context
             span: Match location (start, end)
 
         Returns:
             Evidence object or None if evaluation fails
         """
-        evidence_config = pattern.get("evidence", {})
-        confidence_fn = evidence_config.get("confidence_fn", "identity")
-
-        # Get evaluator function
-        try:
-            evaluator = self.plugins.get(confidence_fn)
-        except KeyError:
-            # Unknown evaluator - use identity
-            evaluator = self.plugins.get("identity")
+        # Get evaluator function (resolved once at compile time)
+        if isinstance(pattern, CompiledPattern) and pattern.evaluator is not None:
+            evaluator = pattern.evaluator
+            definition: Mapping[str, Any] = pattern.source
+        else:
+            definition = (
+                pattern.source if isinstance(pattern, CompiledPattern) else pattern
+            )
+            confidence_fn = definition.get("evidence", {}).get(
+                "confidence_fn", "identity"
+            )
+            evaluator = self.plugins.resolve(confidence_fn)
 
         # Prepare evaluation context - time for the comprehensive context setup
         eval_context = {
@@ -901,7 +1179,7 @@ class PatternEngine:
         }
 
         # Evaluate and return evidence
-        return evaluator(pattern, eval_context)
+        return evaluator(definition, eval_context)  # type: ignore[arg-type]
 
     def _calibrate(self, raw_score: float) -> float:
         """
@@ -917,6 +1195,20 @@ class PatternEngine:
             return self._calibration_mapping.apply(raw_score)
         return raw_score
 
+    def _calibrate_batch(self, raw_scores: np.ndarray) -> np.ndarray:
+        """
+        Apply calibration to an array of raw confidence scores.
+
+        Args:
+            raw_scores: Uncalibrated confidences (any shape)
+
+        Returns:
+            Calibrated confidences with the same shape
+        """
+        if self._calibration_mapping:
+            return self._calibration_mapping.apply_batch(raw_scores)
+        return raw_scores
+
     def _lookup_pattern_glossary(
         self, pattern_name: str, family: str
     ) -> Optional[Dict[str, Any]]:
@@ -1094,14 +1386,15 @@ class PatternEngine:
 
         # Convert evidence to pattern matches
         pattern_matches: List[PatternMatchDTO] = []
-        pattern_entries: List[Tuple[PatternMatchDTO, Optional[Dict[str, Any]]]] = []
+        pattern_entries: List[Tuple[PatternMatchDTO, Optional[CompiledPattern]]] = []
+        compiled_patterns = self.compiled_patterns
         for evidence in evidences:
             # Only include patterns that contribute to the primary type
             if analysis_type.value.lower() in evidence.track_weights:
                 # Opening move: look up pattern definition for better naming
-                pattern_def = self._find_pattern_by_id(evidence.pattern_id)
+                pattern_def = compiled_patterns.get(evidence.pattern_id)
                 pattern_name = self._get_pattern_display_name(
-                    pattern_def, evidence.pattern_id
+                    pattern_def.source if pattern_def else None, evidence.pattern_id
                 )
 
                 # Extract family from pattern ID using track-based schema
@@ -1136,13 +1429,13 @@ class PatternEngine:
 
         roman_sequence = context.roman_numerals if context.roman_numerals else []
         sections_list = list(context.sections) if context.sections else []
+        locate_section = self._section_locator(sections_list)
         total_len = len(context.chords) if context.chords else len(roman_sequence)
         terminal_cadences: List[PatternMatchDTO] = []
         final_cadence: Optional[PatternMatchDTO] = None
 
         for pattern_match, pattern_def in pattern_entries:
-            metadata = pattern_def.get("metadata", {}) if pattern_def else {}
-            tags = {str(tag).lower() for tag in metadata.get("tags", [])}
+            tags = set(pattern_def.tags) if pattern_def else set()
 
             base_role = self._classify_cadence_role(pattern_match.pattern_id, tags)
             if base_role and not pattern_match.cadence_role:
@@ -1155,12 +1448,9 @@ class PatternEngine:
             )
             landing_index = max(landing_index, 0)
 
-            section_obj: Optional[SectionDTO] = None
-            for sec in sections_list:
-                if sec.start <= landing_index < sec.end:
-                    section_obj = sec
-                    pattern_match.section = sec.id
-                    break
+            section_obj = locate_section(landing_index)
+            if section_obj is not None:
+                pattern_match.section = section_obj.id
 
             closes_section = bool(section_obj and pattern_match.end >= section_obj.end)
             closes_progression = total_len > 0 and pattern_match.end >= total_len
@@ -1417,6 +1707,44 @@ class PatternEngine:
             ),  # Iteration 9B: Include modal characteristics
         )
 
+    @staticmethod
+    def _section_locator(
+        sections: List[SectionDTO],
+    ) -> Callable[[int], Optional[SectionDTO]]:
+        """
+        Build a chord-index -> section lookup.
+
+        Disjoint sections (the normal case) are found by bisecting their
+        sorted starts; overlapping sections fall back to a scan so the first
+        listed section containing the index still wins.
+
+        Args:
+            sections: Annotated sections in caller order
+
+        Returns:
+            Function returning the section containing an index (or None)
+        """
+        ordered = sorted(sections, key=lambda section: section.start)
+        if any(a.end > b.start for a, b in zip(ordered, ordered[1:])):
+
+            def scan(index: int) -> Optional[SectionDTO]:
+                for section in sections:
+                    if section.start <= index < section.end:
+                        return section
+                return None
+
+            return scan
+
+        starts = [section.start for section in ordered]
+
+        def locate(index: int) -> Optional[SectionDTO]:
+            position = bisect_right(starts, index) - 1
+            if position >= 0 and index < ordered[position].end:
+                return ordered[position]
+            return None
+
+        return locate
+
     def _build_alternatives(
         self,
         context: AnalysisContext,
@@ -1523,15 +1851,30 @@ class PatternEngine:
         Returns:
             True if context matches the required mode
         """
+        detected_mode = context.derived(
+            "mode", lambda: self._detect_context_mode(context)
+        )
+        # Fallback: no mode information available
+        return detected_mode is not None and detected_mode == required_mode.lower()
+
+    def _detect_context_mode(self, context: AnalysisContext) -> Optional[str]:
+        """
+        Normalize the mode of the context from its scales or key.
+
+        Args:
+            context: Analysis context containing scale and key information
+
+        Returns:
+            Lower-case mode name, or None when no mode information is available
+        """
         # Opening move: extract mode from scale data if available
         if context.scales:
             for scale_entry in context.scales:
                 if isinstance(scale_entry, dict) and "mode" in scale_entry:
                     mode_value = scale_entry["mode"]
                     if isinstance(mode_value, str):
-                        detected_mode = mode_value.lower()
                         # Victory lap: normalize mode names for comparison
-                        return detected_mode == required_mode.lower()
+                        return mode_value.lower()
 
         # Big play: extract mode from key signature
         if context.key:
@@ -1550,11 +1893,9 @@ class PatternEngine:
                     "aeolian": "aeolian",
                     "locrian": "locrian",
                 }
-                detected_mode = mode_mappings.get(key_mode, key_mode)
-                return detected_mode == required_mode.lower()
+                return mode_mappings.get(key_mode, key_mode)
 
-        # Fallback: no mode information available
-        return False
+        return None
 
     def _add_scale_melody_reasoning(
         self,
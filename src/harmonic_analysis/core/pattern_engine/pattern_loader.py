@@ -7,9 +7,14 @@ ensuring they conform to the expected schema.
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
-import jsonschema
+from ...resources.bundle import bundled_json
+from ...resources.validation import content_digest, is_prevalidated
+from .compiled_pattern import CompiledPatternSet, compile_pattern_set
+
+if TYPE_CHECKING:
+    from .plugin_registry import PluginRegistry
 
 
 class PatternLoader:
@@ -140,6 +145,10 @@ class PatternLoader:
         """
         Load and validate a patterns JSON file.
 
+        Bundled pattern files come from the binary resource bundle when it is
+        fresh and, being stamped at build time, skip schema validation; any
+        other file is read and validated in full.
+
         Args:
             path: Path to patterns.json file
 
@@ -154,11 +163,30 @@ class PatternLoader:
         if not path.exists():
             raise FileNotFoundError(f"Pattern file not found: {path}")
 
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        bundled = bundled_json(path)
+        if bundled is not None:
+            digest, data = bundled
+        else:
+            raw = path.read_bytes()
+            digest, data = content_digest(raw), json.loads(raw)
+        self.validate_file(path, data, digest)
+        return data  # type: ignore[no-any-return]
+
+    def validate_file(self, path: Path, data: Dict[str, Any], digest: str) -> None:
+        """
+        Validate pattern data read from a file, unless stamped at build time.
+
+        Args:
+            path: Path the data was read from
+            data: Parsed pattern data
+            digest: SHA-256 of the file contents (checked against the stamp)
 
+        Raises:
+            ValueError: If validation fails (with helpful error message)
+        """
+        if is_prevalidated(path, digest, self.schema):
+            return
         self.validate(data)
-        return data  # type: ignore[no-any-return]
 
     def validate(self, data: Dict[str, Any]) -> None:
         """
@@ -170,6 +198,8 @@ class PatternLoader:
         Raises:
             ValueError: If validation fails (with helpful error message)
         """
+        import jsonschema  # deferred: only needed when loading pattern files
+
         try:
             jsonschema.validate(data, self.schema)
         except jsonschema.ValidationError as e:
@@ -209,6 +239,42 @@ class PatternLoader:
         data = self.load(path)
         return data.get("patterns", [])  # type: ignore[no-any-return]
 
+    def compile(
+        self, data: Mapping[str, Any], plugins: Optional["PluginRegistry"] = None
+    ) -> CompiledPatternSet:
+        """
+        Compile validated pattern data into its runtime representation.
+
+        Sequence tokens are normalized, regexes compiled, constraints and
+        confidence functions resolved exactly once here rather than on every
+        comparison during analysis.
+
+        Args:
+            data: Validated pattern data (as returned by load())
+            plugins: Registry used to resolve confidence functions
+
+        Returns:
+            CompiledPatternSet
+        """
+        return compile_pattern_set(
+            data.get("patterns", []), plugins, version=data.get("version", 1)
+        )
+
+    def load_compiled(
+        self, path: Path, plugins: Optional["PluginRegistry"] = None
+    ) -> CompiledPatternSet:
+        """
+        Load, validate and compile a patterns JSON file.
+
+        Args:
+            path: Path to patterns.json file
+            plugins: Registry used to resolve confidence functions
+
+        Returns:
+            CompiledPatternSet
+        """
+        return self.compile(self.load(path), plugins)
+
     def merge_patterns(self, *paths: Path) -> Dict[str, Any]:
         """
         Merge patterns from multiple files.
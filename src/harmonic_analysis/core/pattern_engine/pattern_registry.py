@@ -0,0 +1,192 @@
+"""
+Process-wide registry of loaded pattern libraries and the glossary.
+
+Pattern files are read, schema-validated, frozen and compiled once per process;
+every PatternEngine that loads the same file shares the result. Entries are
+keyed by resolved path and content hash, so an edited file is picked up on the
+next load while unchanged files cost one read and hash (bundled files take
+their data and hash from the binary resource bundle instead). The validating
+schema is part of the key too, so a loader with a different schema never
+gets an entry it did not validate.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ...resources import load_glossary
+from ...resources.bundle import bundled_json
+from ...resources.validation import schema_digest
+from .compiled_pattern import CompiledPatternSet
+from .pattern_loader import PatternLoader
+from .plugin_registry import PluginRegistry
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a read-only copy of JSON data.
+
+    Args:
+        value: Parsed JSON (dicts, lists and scalars)
+
+    Returns:
+        The same data with dicts as MappingProxyType and lists as tuples
+    """
+    # Exact type checks first: parsed JSON only holds dicts and lists, and
+    # isinstance() against the typing ABCs dominates freezing time
+    kind = type(value)
+    if kind is dict:
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if kind is list:
+        return tuple([freeze(item) for item in value])
+    if kind in _SCALARS:
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class PatternRegistryEntry:
+    """A validated pattern library shared by every engine that loads it."""
+
+    path: Path
+    digest: str
+    schema_digest: str
+    """Digest of the schema the data was validated against."""
+
+    data: Mapping[str, Any]
+    """Frozen pattern data (see freeze())."""
+
+    compiled: CompiledPatternSet
+    """Patterns compiled against the built-in evaluator plugins."""
+
+    plugin_generation: int
+
+    def compiled_for(self, plugins: PluginRegistry) -> Optional[CompiledPatternSet]:
+        """
+        Shared compiled patterns, if valid for a plugin registry.
+
+        Args:
+            plugins: Registry of the engine installing these patterns
+
+        Returns:
+            The shared CompiledPatternSet when the registry only holds the
+            built-in evaluators, otherwise None (the caller compiles its own)
+        """
+        if type(plugins) is PluginRegistry and (
+            plugins.generation == self.plugin_generation
+        ):
+            return self.compiled
+        return None
+
+
+class PatternRegistry:
+    """Thread-safe cache of pattern libraries and the default glossary."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Path, str, str], PatternRegistryEntry] = {}
+        self._glossary: Optional[Mapping[str, Any]] = None
+        self._default_loader: Optional[PatternLoader] = None
+
+    def load(
+        self, path: Path, loader: Optional[PatternLoader] = None
+    ) -> PatternRegistryEntry:
+        """
+        Get the shared entry for a pattern file, loading it on first use.
+
+        Args:
+            path: Path to a patterns JSON file
+            loader: Loader whose schema validates the file on a cache miss
+                (bundled files stamped at build time skip validation, and are
+                read from the binary resource bundle when it is fresh);
+                entries are only shared between loaders with the same schema
+
+        Returns:
+            PatternRegistryEntry for the file's current contents
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file fails schema validation
+        """
+        path = Path(path).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"Pattern file not found: {path}")
+        bundled = bundled_json(path)
+        if bundled is not None:
+            digest, data = bundled
+        else:
+            raw = path.read_bytes()
+            digest, data = hashlib.sha256(raw).hexdigest(), None
+
+        with self._lock:
+            if loader is None:
+                if self._default_loader is None:
+                    self._default_loader = PatternLoader()
+                loader = self._default_loader
+            key = (path, digest, schema_digest(loader.schema))
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry
+
+            # Main play: validate, freeze and compile exactly once per schema
+            if data is None:
+                data = json.loads(raw)
+            loader.validate_file(path, data, digest)
+            frozen = freeze(data)
+            plugins = PluginRegistry()
+            entry = PatternRegistryEntry(
+                path=path,
+                digest=digest,
+                schema_digest=key[2],
+                data=frozen,
+                compiled=loader.compile(frozen, plugins),
+                plugin_generation=plugins.generation,
+            )
+            # Only the latest contents of a file are worth keeping
+            for stale in [k for k in self._entries if k[0] == path and k[1] != digest]:
+                del self._entries[stale]
+            self._entries[key] = entry
+            return entry
+
+    def glossary(self) -> Mapping[str, Any]:
+        """
+        The packaged glossary, loaded once and frozen.
+
+        Returns:
+            Read-only glossary mapping
+
+        Raises:
+            FileNotFoundError: If the glossary resource is missing
+        """
+        glossary = self._glossary
+        if glossary is None:
+            with self._lock:
+                if self._glossary is None:
+                    self._glossary = freeze(load_glossary())
+                glossary = self._glossary
+        return glossary
+
+    def clear(self) -> None:
+        """Drop every cached entry (mainly for tests)."""
+        with self._lock:
+            self._entries.clear()
+            self._glossary = None
+            self._default_loader = None
+
+
+_REGISTRY = PatternRegistry()
+
+
+def get_pattern_registry() -> PatternRegistry:
+    """Return the process-wide pattern registry."""
+    return _REGISTRY
@@ -34,6 +34,7 @@ class PluginRegistry:
     def __init__(self) -> None:
         """Initialize empty plugin registry."""
         self._evaluators: Dict[str, PatternEvaluator] = {}
+        self._generation = 0
         self._register_builtin_evaluators()
 
     def _register_builtin_evaluators(self) -> None:
@@ -57,6 +58,12 @@ class PluginRegistry:
         if name in self._evaluators:
             raise ValueError(f"Plugin already registered: {name}")
         self._evaluators[name] = evaluator
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every registration (invalidates compiled patterns)."""
+        return self._generation
 
     def get(self, name: str) -> PatternEvaluator:
         """
@@ -76,6 +83,22 @@ class PluginRegistry:
         except KeyError as e:
             raise KeyError(f"Unknown plugin evaluator: {name}") from e
 
+    def resolve(self, name: str) -> PatternEvaluator:
+        """
+        Get an evaluator by name, falling back to the identity evaluator.
+
+        Args:
+            name: Name of the evaluator
+
+        Returns:
+            The evaluator function (identity when name is unknown)
+        """
+        evaluator = self._evaluators.get(name)
+        if evaluator is None:
+            # Unknown evaluator - use identity
+            return self._evaluators["identity"]
+        return evaluator
+
     def list_evaluators(self) -> list[str]:
         """Get list of all registered evaluator names."""
         return sorted(self._evaluators.keys())
@@ -13,6 +13,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ...resources.bundle import bundled_json
+
 
 @dataclass(frozen=True)
 class Profile:
@@ -123,11 +125,15 @@ class ProfileManager:
         if not self.profiles_path.exists():
             raise FileNotFoundError(f"Profiles file not found: {self.profiles_path}")
 
-        try:
-            with open(self.profiles_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in profiles file: {e}") from e
+        bundled = bundled_json(self.profiles_path)
+        if bundled is not None:
+            data = bundled[1]
+        else:
+            try:
+                with open(self.profiles_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in profiles file: {e}") from e
 
         # Validate top-level structure
         if not isinstance(data, dict):
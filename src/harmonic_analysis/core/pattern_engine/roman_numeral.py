@@ -0,0 +1,314 @@
+"""
+Structured roman numeral tokens for the unified pattern engine.
+
+Roman numeral strings are parsed once into an immutable RomanNumeral with
+integer fields (degree, accidental, quality, extensions, inversion) and a
+secondary target. Pattern matching compares each token's ``match_key``
+instead of re-normalizing strings for every pattern and start position.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+# Chord qualities
+QUALITY_UNKNOWN = 0
+QUALITY_MAJOR = 1
+QUALITY_MINOR = 2
+QUALITY_DIMINISHED = 3
+QUALITY_HALF_DIMINISHED = 4
+QUALITY_AUGMENTED = 5
+
+# Extension bits
+EXT_SEVENTH = 1
+EXT_MAJOR_SEVENTH = 2
+EXT_NINTH = 4
+EXT_ELEVENTH = 8
+EXT_THIRTEENTH = 16
+EXT_ADD = 32
+EXT_SUS = 64
+
+_NUMERALS = ("VII", "VI", "IV", "V", "III", "II", "I")
+_DEGREES = {"I": 1, "II": 2, "III": 3, "IV": 4, "V": 5, "VI": 6, "VII": 7}
+_QUALITY_MARKERS = {
+    "°": QUALITY_DIMINISHED,
+    "o": QUALITY_DIMINISHED,
+    "dim": QUALITY_DIMINISHED,
+    "ø": QUALITY_HALF_DIMINISHED,
+    "+": QUALITY_AUGMENTED,
+    "aug": QUALITY_AUGMENTED,
+}
+
+# Figured-bass suffixes: figure -> (inversion, extension bits)
+_FIGURES = {
+    "6": (1, 0),
+    "64": (2, 0),
+    "7": (0, EXT_SEVENTH),
+    "65": (1, EXT_SEVENTH),
+    "43": (2, EXT_SEVENTH),
+    "42": (3, EXT_SEVENTH),
+    "2": (3, EXT_SEVENTH),
+    "9": (0, EXT_NINTH),
+    "11": (0, EXT_ELEVENTH),
+    "13": (0, EXT_THIRTEENTH),
+}
+
+_NUMERAL_ALTERNATIVES = "|".join(_NUMERALS + tuple(n.lower() for n in _NUMERALS))
+_ROMAN_RE = re.compile(
+    r"(?P<accidental>[b♭]{1,2}|[#♯]{1,2})?"
+    rf"(?P<numeral>{_NUMERAL_ALTERNATIVES})"
+    r"(?P<quality>°|ø|\+|dim|aug|o(?![a-z]))?"
+    r"(?P<rest>[^/]*)"
+    r"(?:/(?P<target>.+))?"
+)
+_FIGURE_RE = re.compile(r"add\d*|sus\d*|maj7?|ma7|M7|[Δ∆]7?|\d+")
+
+# Canonical spelling of a matching key (see normalize_roman_for_matching)
+_MATCH_FORM_RE = re.compile(
+    rf"(?P<flats>♭{{0,2}})(?P<sharps>#{{0,2}})(?P<numeral>{_NUMERAL_ALTERNATIVES})"
+    r"(?P<marker>[°ø+]?)"
+)
+_MARKER_CODES = {"": 0, "°": 1, "ø": 2, "+": 3}
+
+_DIGITS = re.compile(r"\d+")
+_EXTENSION_WORDS = tuple(
+    re.compile(word, re.IGNORECASE) for word in ("maj", "min", "add", "sus")
+)
+
+MatchKey = Union[int, str]
+
+
+def normalize_roman_for_matching(roman: str) -> str:
+    """
+    Normalize a roman numeral for pattern matching.
+
+    Strips extensions like 7ths, inversions, and secondary targets
+    so that V7, V64, V/vi all match pattern "V".
+
+    Args:
+        roman: Roman numeral to normalize (e.g., "V7", "V/vi", "vi°7")
+
+    Returns:
+        Base roman numeral (e.g., "V", "V", "vi°")
+    """
+    # Opening move: handle unicode flats
+    normalized = roman.replace("b", "♭")
+
+    # Main play: strip extension digits and maj/min/add/sus markers
+    normalized = _DIGITS.sub("", normalized)
+    for word in _EXTENSION_WORDS:
+        normalized = word.sub("", normalized)
+
+    # Secondary dominants: V/vi -> V, vii°/V -> vii°
+    if "/" in normalized:
+        normalized = normalized.split("/")[0]
+
+    # Victory lap: clean up any trailing spaces or punctuation
+    return normalized.strip()
+
+
+def _encode_match_key(normalized: str) -> MatchKey:
+    """
+    Pack a normalized roman numeral into an integer when possible.
+
+    Only canonical spellings are packed, so two keys are equal exactly when
+    their normalized strings are equal. Anything unusual (e.g. "N", "♯IV",
+    "Ger+") keeps its normalized string as the key.
+    """
+    m = _MATCH_FORM_RE.fullmatch(normalized)
+    if m is None or (m.group("flats") and m.group("sharps")):
+        return normalized
+
+    numeral = m.group("numeral")
+    accidental = len(m.group("sharps")) - len(m.group("flats"))
+    return (
+        (accidental + 2) << 8
+        | _DEGREES[numeral.upper()] << 4
+        | (numeral.isupper()) << 3
+        | _MARKER_CODES[m.group("marker")]
+    )
+
+
+@lru_cache(maxsize=4096)
+def roman_match_key(roman: str) -> MatchKey:
+    """
+    Matching key for a roman numeral string.
+
+    Args:
+        roman: Roman numeral as written in a pattern or context
+
+    Returns:
+        Integer key (or normalized string for non-canonical spellings)
+    """
+    return _encode_match_key(normalize_roman_for_matching(roman))
+
+
+class RomanNumeral:
+    """Parsed, immutable roman numeral token."""
+
+    __slots__ = (
+        "text",
+        "degree",
+        "accidental",
+        "quality",
+        "extensions",
+        "inversion",
+        "secondary",
+        "match_key",
+    )
+
+    text: str
+    degree: int
+    accidental: int
+    quality: int
+    extensions: int
+    inversion: int
+    secondary: Optional["RomanNumeral"]
+    match_key: MatchKey
+
+    def __init__(
+        self,
+        text: str,
+        degree: int = 0,
+        accidental: int = 0,
+        quality: int = QUALITY_UNKNOWN,
+        extensions: int = 0,
+        inversion: int = 0,
+        secondary: Optional["RomanNumeral"] = None,
+    ) -> None:
+        """
+        Create a roman numeral token.
+
+        Args:
+            text: Original spelling
+            degree: Scale degree 1-7 (0 when the numeral is not recognised)
+            accidental: Chromatic alteration (-2..2, negative for flats)
+            quality: One of the QUALITY_* constants
+            extensions: Bitmask of EXT_* constants
+            inversion: 0 (root position) to 3 (third inversion)
+            secondary: Target of a secondary function (V/vi -> vi)
+        """
+        setter = object.__setattr__
+        setter(self, "text", text)
+        setter(self, "degree", degree)
+        setter(self, "accidental", accidental)
+        setter(self, "quality", quality)
+        setter(self, "extensions", extensions)
+        setter(self, "inversion", inversion)
+        setter(self, "secondary", secondary)
+        setter(self, "match_key", roman_match_key(text))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Roman numerals are immutable."""
+        raise AttributeError(f"RomanNumeral is immutable (cannot set {name!r})")
+
+    def _fields(self) -> Tuple[object, ...]:
+        return (
+            self.text,
+            self.degree,
+            self.accidental,
+            self.quality,
+            self.extensions,
+            self.inversion,
+            self.secondary,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Tokens are equal when spelled and parsed identically."""
+        if not isinstance(other, RomanNumeral):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        """Hash on the parsed fields."""
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        """Debug representation showing the original spelling."""
+        return f"RomanNumeral({self.text!r})"
+
+    def __reduce__(self) -> Tuple[object, Tuple[str]]:
+        """Pickle by spelling; parsing is deterministic."""
+        return (parse_roman, (self.text,))
+
+    @property
+    def is_secondary(self) -> bool:
+        """Whether the numeral has a secondary target (V/V, vii°/ii, ...)."""
+        return self.secondary is not None
+
+    def has_extension(self, bits: int) -> bool:
+        """Check whether any of the given EXT_* bits are set."""
+        return bool(self.extensions & bits)
+
+    def matches(self, other: "RomanNumeral") -> bool:
+        """Pattern-matching equivalence (ignores extensions, inversions, targets)."""
+        return self.match_key == other.match_key
+
+
+def _parse_figures(rest: str) -> Tuple[int, int]:
+    """Parse extension/figure suffixes into (extensions, inversion)."""
+    extensions = 0
+    inversion = 0
+    for figure in _FIGURE_RE.findall(rest):
+        if figure.startswith("add"):
+            extensions |= EXT_ADD
+        elif figure.startswith("sus"):
+            extensions |= EXT_SUS
+        elif figure[0] in "mMΔ∆":
+            extensions |= EXT_MAJOR_SEVENTH
+        else:
+            figure_inversion, bits = _FIGURES.get(figure, (0, 0))
+            inversion = inversion or figure_inversion
+            if bits == EXT_SEVENTH and extensions & EXT_MAJOR_SEVENTH:
+                continue
+            extensions |= bits
+    return extensions, inversion
+
+
+@lru_cache(maxsize=4096)
+def parse_roman(text: str) -> RomanNumeral:
+    """
+    Parse a roman numeral string.
+
+    Unrecognised spellings (e.g. "N6", "Ger+6") still produce a token with
+    degree 0 and a valid match_key, so matching never depends on parsing
+    succeeding.
+
+    Args:
+        text: Roman numeral such as "V7", "♭VII", "vii°7/V" or "I64"
+
+    Returns:
+        Cached RomanNumeral for the spelling
+    """
+    m = _ROMAN_RE.fullmatch(text.strip())
+    if m is None:
+        return RomanNumeral(text)
+
+    accidental_text = m.group("accidental") or ""
+    accidental = len(accidental_text)
+    if accidental_text[:1] in ("b", "♭"):
+        accidental = -accidental
+
+    numeral = m.group("numeral")
+    marker = m.group("quality")
+    if marker:
+        quality = _QUALITY_MARKERS[marker]
+    else:
+        quality = QUALITY_MAJOR if numeral.isupper() else QUALITY_MINOR
+
+    extensions, inversion = _parse_figures(m.group("rest"))
+    if "ø" in m.group("rest"):
+        quality = QUALITY_HALF_DIMINISHED
+    elif "°" in m.group("rest"):
+        quality = QUALITY_DIMINISHED
+
+    target = m.group("target")
+    return RomanNumeral(
+        text,
+        degree=_DEGREES[numeral.upper()],
+        accidental=accidental,
+        quality=quality,
+        extensions=extensions,
+        inversion=inversion,
+        secondary=parse_roman(target) if target else None,
+    )
@@ -0,0 +1,361 @@
+"""
+Multi-pattern sequence scanner for the unified pattern engine.
+
+This module compiles every sequence matcher in the pattern library
+(``roman_seq``, ``chord_seq``, ``interval_seq`` and ``scale_degrees``) into
+an Aho-Corasick automaton per sequence kind. A single left-to-right pass over
+the context then yields every candidate start position for every pattern,
+instead of sliding each pattern over every position on its own.
+
+Wildcards (``*`` / ``.*``) and regex items cannot live in the trie. Each
+sequence is anchored on its longest run of literal tokens; the remaining
+positions are verified only when the anchor hits. Sequences without any
+literal token fall back to a direct sliding-window check.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
+
+# Sequence matcher kinds in the order the engine evaluates them
+SEQUENCE_MATCHERS: Tuple[str, ...] = (
+    "roman_seq",
+    "chord_seq",
+    "interval_seq",
+    "scale_degrees",
+)
+
+WILDCARD_ITEMS = frozenset({"*", ".*"})
+REGEX_METACHARACTERS = frozenset("*+?[]()|^$")
+
+LITERAL = "literal"
+WILDCARD = "wildcard"
+REGEX = "regex"
+
+
+@dataclass(frozen=True)
+class SequenceToken:
+    """A single compiled item of a pattern sequence."""
+
+    kind: str
+    """One of "literal", "wildcard" or "regex"."""
+
+    text: str
+    """Normalized text for literals, source text otherwise."""
+
+    regex: Optional[Pattern[str]] = None
+    """Precompiled case-insensitive regex for regex tokens."""
+
+    key: Hashable = None
+    """Comparison key for literals (defaults to text)."""
+
+    def __post_init__(self) -> None:
+        """Default the comparison key to the token text."""
+        if self.key is None:
+            object.__setattr__(self, "key", self.text)
+
+    def matches(self, key: Hashable, raw: str) -> bool:
+        """
+        Check a context item against this token.
+
+        Args:
+            key: Context item key (used for literal comparison)
+            raw: Original context item (used for regex matching)
+
+        Returns:
+            True if the context item satisfies the token
+        """
+        if self.kind == WILDCARD:
+            return True
+        if self.regex is not None:
+            return self.regex.match(raw) is not None
+        return self.key == key
+
+
+def compile_sequence_token(
+    item: str, normalize: Optional[Callable[[str], Hashable]] = None
+) -> SequenceToken:
+    """
+    Classify and compile a pattern sequence item.
+
+    Mirrors the engine's historical matching rules: ``*`` and ``.*`` are
+    wildcards, items containing regex metacharacters are matched with
+    ``re.match`` (case-insensitive) against the raw context item, and
+    anything else (including regexes that fail to compile) is compared
+    literally after normalization.
+
+    Args:
+        item: Pattern sequence item
+        normalize: Optional normalizer producing the key of literal items
+
+    Returns:
+        Compiled SequenceToken
+    """
+    if item in WILDCARD_ITEMS:
+        return SequenceToken(kind=WILDCARD, text=item)
+
+    if any(char in REGEX_METACHARACTERS for char in item):
+        try:
+            return SequenceToken(
+                kind=REGEX, text=item, regex=re.compile(item, re.IGNORECASE)
+            )
+        except re.error:
+            # Invalid regex, fall back to exact matching
+            pass
+
+    key = normalize(item) if normalize else item
+    text = key if isinstance(key, str) else item
+    return SequenceToken(kind=LITERAL, text=text, key=key)
+
+
+def find_sequence_starts(
+    tokens: Sequence[SequenceToken],
+    keys: Sequence[Hashable],
+    raw: Sequence[str],
+) -> List[int]:
+    """
+    Slide a single compiled sequence over a context sequence.
+
+    Args:
+        tokens: Compiled pattern sequence
+        keys: Context item keys
+        raw: Original context items (same length as keys)
+
+    Returns:
+        Ascending list of start positions where every token matches
+    """
+    pattern_len = len(tokens)
+    context_len = len(keys)
+    if pattern_len == 0 or pattern_len > context_len:
+        return []
+
+    starts = []
+    for i in range(context_len - pattern_len + 1):
+        for j, token in enumerate(tokens):
+            if not token.matches(keys[i + j], raw[i + j]):
+                break
+        else:
+            starts.append(i)
+    return starts
+
+
+@dataclass(frozen=True)
+class _ScanEntry:
+    """A sequence registered with a scanner, anchored on a literal run."""
+
+    entry_id: int
+    tokens: Tuple[SequenceToken, ...]
+    anchor_offset: int
+    anchor_len: int
+
+
+class SequenceScanner:
+    """
+    Aho-Corasick automaton over token sequences of a single matcher kind.
+
+    Literal runs are stored in a trie keyed by normalized tokens. Scanning a
+    context is one pass over its items; every anchor hit is then verified
+    against the sequence's wildcard/regex positions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty automaton (root node only)."""
+        self._goto: List[Dict[Hashable, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[_ScanEntry]] = [[]]
+        self._unanchored: List[_ScanEntry] = []
+        self._entry_ids: List[int] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        """Number of sequences registered with the scanner."""
+        return len(self._entry_ids)
+
+    def add(self, entry_id: int, tokens: Sequence[SequenceToken]) -> None:
+        """
+        Register a compiled sequence.
+
+        Args:
+            entry_id: Caller-defined identifier reported back by scan()
+            tokens: Compiled sequence tokens
+        """
+        if self._built:
+            raise RuntimeError("Cannot add sequences after the scanner is built")
+
+        tokens = tuple(tokens)
+        self._entry_ids.append(entry_id)
+        if not tokens:
+            return
+
+        # Opening move: pick the longest literal run as the trie anchor
+        best_offset, best_len = 0, 0
+        run_start, run_len = 0, 0
+        for position, token in enumerate(tokens):
+            if token.kind == LITERAL:
+                if run_len == 0:
+                    run_start = position
+                run_len += 1
+                if run_len > best_len:
+                    best_offset, best_len = run_start, run_len
+            else:
+                run_len = 0
+
+        entry = _ScanEntry(entry_id, tokens, best_offset, best_len)
+        if best_len == 0:
+            self._unanchored.append(entry)
+            return
+
+        node = 0
+        for token in tokens[best_offset : best_offset + best_len]:
+            next_node = self._goto[node].get(token.key)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][token.key] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(entry)
+
+    def build(self) -> None:
+        """Compute failure links (breadth-first) and merge output sets."""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for symbol, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and symbol not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(symbol, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[target]
+        self._built = True
+
+    def scan(
+        self, keys: Sequence[Hashable], raw: Sequence[str]
+    ) -> Dict[int, List[int]]:
+        """
+        Find every start position of every registered sequence.
+
+        Args:
+            keys: Context item keys
+            raw: Original context items (same length as keys)
+
+        Returns:
+            Mapping of entry_id to ascending start positions
+        """
+        if not self._built:
+            self.build()
+
+        hits: Dict[int, List[int]] = {}
+        context_len = len(keys)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        # Main play: one left-to-right pass through the automaton
+        node = 0
+        for position, symbol in enumerate(keys):
+            while node and symbol not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(symbol, 0)
+            for entry in output[node]:
+                start = position - entry.anchor_len + 1 - entry.anchor_offset
+                end = start + len(entry.tokens)
+                if start < 0 or end > context_len:
+                    continue
+                if self._verify(entry, keys, raw, start):
+                    hits.setdefault(entry.entry_id, []).append(start)
+
+        # Wildcard/regex-only sequences have no anchor: check every window
+        for entry in self._unanchored:
+            starts = find_sequence_starts(entry.tokens, keys, raw)
+            if starts:
+                hits[entry.entry_id] = starts
+
+        return hits
+
+    @staticmethod
+    def _verify(
+        entry: _ScanEntry, keys: Sequence[Hashable], raw: Sequence[str], start: int
+    ) -> bool:
+        """Check the non-anchor tokens of an entry at a candidate start."""
+        anchor_end = entry.anchor_offset + entry.anchor_len
+        for j, token in enumerate(entry.tokens):
+            if entry.anchor_offset <= j < anchor_end:
+                continue
+            if not token.matches(keys[start + j], raw[start + j]):
+                return False
+        return True
+
+
+class MultiPatternScanner:
+    """
+    Scanner for a whole pattern library, one automaton per matcher kind.
+
+    Sequences are registered as ``(pattern_index, kind, tokens)`` triples;
+    scan() reports candidate starts grouped by pattern index and kind.
+    """
+
+    def __init__(
+        self, sequences: Iterable[Tuple[int, str, Sequence[SequenceToken]]]
+    ) -> None:
+        """
+        Build automata for the given sequences.
+
+        Args:
+            sequences: (pattern_index, matcher_kind, tokens) triples
+        """
+        self._scanners: Dict[str, SequenceScanner] = {}
+        self._entries: List[Tuple[int, str]] = []
+
+        for pattern_index, kind, tokens in sequences:
+            scanner = self._scanners.get(kind)
+            if scanner is None:
+                scanner = self._scanners[kind] = SequenceScanner()
+            scanner.add(len(self._entries), tokens)
+            self._entries.append((pattern_index, kind))
+
+        for scanner in self._scanners.values():
+            scanner.build()
+
+    @property
+    def kinds(self) -> Tuple[str, ...]:
+        """Matcher kinds with at least one registered sequence."""
+        return tuple(kind for kind in SEQUENCE_MATCHERS if kind in self._scanners)
+
+    def scan(
+        self, sequences: Mapping[str, Tuple[Sequence[Hashable], Sequence[str]]]
+    ) -> Dict[int, Dict[str, List[int]]]:
+        """
+        Scan context sequences with every automaton.
+
+        Args:
+            sequences: Mapping of matcher kind to (keys, raw) context items
+
+        Returns:
+            Mapping of pattern index to {matcher kind: ascending starts}
+        """
+        results: Dict[int, Dict[str, List[int]]] = {}
+        for kind, scanner in self._scanners.items():
+            if kind not in sequences:
+                continue
+            keys, raw = sequences[kind]
+            for entry_id, starts in scanner.scan(keys, raw).items():
+                pattern_index, entry_kind = self._entries[entry_id]
+                results.setdefault(pattern_index, {})[entry_kind] = starts
+        return results
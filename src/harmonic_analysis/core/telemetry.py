@@ -3,17 +3,27 @@ Telemetry and monitoring hooks for harmonic analysis.
 
 Provides logging and metrics collection for scale/melody evidence,
 pattern detection, and analysis performance.
+
+The collector is shared process-wide and safe to use from many threads at
+once: every update to the accumulated metrics happens under one lock. Reports
+come from running totals, and only the most recent sessions are kept, so
+memory stays flat over millions of analyses.
 """
 
+import itertools
 import logging
+import threading
 import time
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Per-session metrics kept for inspection (aggregates cover every session)
+MAX_SESSION_HISTORY = 1000
+
 
 class MetricType(Enum):
     """Types of metrics collected."""
@@ -65,20 +75,52 @@ class AnalysisMetrics:
     scale_count: int = 0
 
 
+@dataclass
+class SessionTotals:
+    """Running totals over every completed session."""
+
+    sessions: int = 0
+    analysis_time_ms: float = 0.0
+    scale_summaries: int = 0
+    melody_summaries: int = 0
+    confidence_sum: float = 0.0
+    confidence_samples: int = 0
+    evidence_count: int = 0
+
+    def add(self, metrics: AnalysisMetrics) -> None:
+        """Fold one session's metrics into the totals."""
+        self.sessions += 1
+        self.analysis_time_ms += metrics.analysis_time_ms
+        self.scale_summaries += metrics.scale_summaries_generated
+        self.melody_summaries += metrics.melody_summaries_generated
+        for confidences in metrics.confidence_distribution.values():
+            self.confidence_sum += sum(confidences)
+            self.confidence_samples += len(confidences)
+        self.evidence_count += metrics.evidence_count
+
+
 class TelemetryCollector:
-    """Collects and aggregates telemetry data."""
+    """Collects and aggregates telemetry data (thread-safe)."""
 
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, max_sessions: int = MAX_SESSION_HISTORY):
         self.enabled = enabled
-        self.session_metrics: List[AnalysisMetrics] = []
+        self.session_metrics: Deque[AnalysisMetrics] = deque(maxlen=max_sessions)
+        self._max_sessions = max_sessions
         self.aggregated_metrics: AnalysisMetrics = AnalysisMetrics()
+        self.totals = SessionTotals()
+        # Guards session metrics, totals and aggregated_metrics across threads
+        self._lock = threading.Lock()
+        self._session_counter = itertools.count(1)
 
     def log_analysis_start(self, context: Any) -> Optional[str]:
         """Log the start of an analysis and return a session ID."""
         if not self.enabled:
             return None
 
-        session_id = f"analysis_{int(time.time() * 1000)}"
+        # The counter keeps IDs unique when threads start in the same ms
+        with self._lock:
+            sequence = next(self._session_counter)
+        session_id = f"analysis_{int(time.time() * 1000)}_{sequence}"
 
         # Log input characteristics
         input_types = []
@@ -148,9 +190,10 @@ class TelemetryCollector:
         logger.info(f"🎵 Scale: {session_id}, {mode}, {characteristics}")
 
         # Aggregate metrics
-        self.aggregated_metrics.scale_summaries_generated += 1
-        if mode != "unknown":
-            self.aggregated_metrics.scale_modes_detected[mode] += 1
+        with self._lock:
+            self.aggregated_metrics.scale_summaries_generated += 1
+            if mode != "unknown":
+                self.aggregated_metrics.scale_modes_detected[mode] += 1
 
     def log_melody_summary_generation(
         self, session_id: Optional[str], melody_summary: Any
@@ -169,9 +212,10 @@ class TelemetryCollector:
         )
 
         # Aggregate metrics
-        self.aggregated_metrics.melody_summaries_generated += 1
-        if contour != "unknown":
-            self.aggregated_metrics.melody_contours_detected[contour] += 1
+        with self._lock:
+            self.aggregated_metrics.melody_summaries_generated += 1
+            if contour != "unknown":
+                self.aggregated_metrics.melody_contours_detected[contour] += 1
 
     def log_confidence_scores(
         self, session_id: Optional[str], analysis_summary: Any
@@ -192,10 +236,12 @@ class TelemetryCollector:
             f"confidence={confidence:.3f}"
         )
 
-        # Aggregate metrics
-        self.aggregated_metrics.confidence_distribution[analysis_type].append(
-            confidence
-        )
+        # Aggregate metrics (recent samples only, like session_metrics)
+        with self._lock:
+            samples = self.aggregated_metrics.confidence_distribution[analysis_type]
+            samples.append(confidence)
+            if len(samples) > self._max_sessions:
+                del samples[0]
 
     def log_arbitration_outcome(
         self,
@@ -214,7 +260,8 @@ class TelemetryCollector:
         )
 
         # Aggregate metrics
-        self.aggregated_metrics.arbitration_outcomes[chosen_type] += 1
+        with self._lock:
+            self.aggregated_metrics.arbitration_outcomes[chosen_type] += 1
 
     def log_analysis_complete(
         self, session_id: Optional[str], analysis_time_ms: float, result: Any
@@ -264,65 +311,49 @@ class TelemetryCollector:
         if result and hasattr(result, "evidence") and result.evidence:
             session_metrics.evidence_count = len(result.evidence)
 
-        self.session_metrics.append(session_metrics)
+        # Session metrics are built locally; only the fold-in is shared
+        with self._lock:
+            self.session_metrics.append(session_metrics)
+            self.totals.add(session_metrics)
 
     def get_aggregated_metrics(self) -> Dict[str, Any]:
         """Get aggregated metrics across all sessions."""
         if not self.enabled:
             return {"telemetry_disabled": True}
 
-        # Compute summary statistics
-        total_sessions = len(self.session_metrics)
+        # Compute summary statistics from a snapshot (sessions keep arriving)
+        with self._lock:
+            totals = SessionTotals(**vars(self.totals))
+        total_sessions = totals.sessions
 
         if total_sessions == 0:
             return {"no_sessions": True}
 
-        # Timing statistics
-        analysis_times = [m.analysis_time_ms for m in self.session_metrics]
-        avg_analysis_time = sum(analysis_times) / len(analysis_times)
-
-        # Scale/melody usage
-        total_scale_summaries = sum(
-            m.scale_summaries_generated for m in self.session_metrics
-        )
-        total_melody_summaries = sum(
-            m.melody_summaries_generated for m in self.session_metrics
-        )
-
-        # Confidence distributions
-        all_confidences = []
-        for m in self.session_metrics:
-            for conf_list in m.confidence_distribution.values():
-                all_confidences.extend(conf_list)
-
         avg_confidence = (
-            sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
+            totals.confidence_sum / totals.confidence_samples
+            if totals.confidence_samples
+            else 0.0
         )
 
         return {
             "session_count": total_sessions,
             "performance": {
-                "avg_analysis_time_ms": avg_analysis_time,
-                "total_analysis_time_ms": sum(analysis_times),
+                "avg_analysis_time_ms": totals.analysis_time_ms / total_sessions,
+                "total_analysis_time_ms": totals.analysis_time_ms,
             },
             "scale_melody_usage": {
-                "scale_summaries_generated": total_scale_summaries,
-                "melody_summaries_generated": total_melody_summaries,
-                "scale_usage_rate": total_scale_summaries / total_sessions,
-                "melody_usage_rate": total_melody_summaries / total_sessions,
+                "scale_summaries_generated": totals.scale_summaries,
+                "melody_summaries_generated": totals.melody_summaries,
+                "scale_usage_rate": totals.scale_summaries / total_sessions,
+                "melody_usage_rate": totals.melody_summaries / total_sessions,
             },
             "confidence_metrics": {
                 "average_confidence": avg_confidence,
-                "confidence_samples": len(all_confidences),
+                "confidence_samples": totals.confidence_samples,
             },
             "pattern_detection": {
-                "total_evidence_generated": sum(
-                    m.evidence_count for m in self.session_metrics
-                ),
-                "avg_evidence_per_session": sum(
-                    m.evidence_count for m in self.session_metrics
-                )
-                / total_sessions,
+                "total_evidence_generated": totals.evidence_count,
+                "avg_evidence_per_session": totals.evidence_count / total_sessions,
             },
         }
 
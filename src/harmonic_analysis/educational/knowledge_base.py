@@ -16,6 +16,8 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+from ..resources.bundle import bundled_json
+from ..resources.validation import content_digest, is_prevalidated
 from .types import LearningLevel  # TODO: remove LearningLevel -- not needed
 from .types import (
     EducationalContext,
@@ -59,7 +61,7 @@ class KnowledgeBase:
         self.data: Dict[str, Any] = self._load_knowledge_base(kb_path)
 
         if HAS_JSONSCHEMA and schema_path and schema_path.exists():
-            self._validate_against_schema(schema_path)
+            self._validate_against_schema(schema_path, kb_path)
 
     def _get_default_kb_path(self) -> Path:
         """Get default path to knowledge base JSON."""
@@ -90,18 +92,35 @@ class KnowledgeBase:
         if not path.exists():
             raise FileNotFoundError(f"Knowledge base not found at {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data: Dict[str, Any] = json.load(f)
-            return data
+        # Content hash is kept for the validation-stamp check
+        self._digest: str
+        data: Dict[str, Any]
+        bundled = bundled_json(path)
+        if bundled is not None:
+            self._digest, data = bundled
+        else:
+            raw = path.read_bytes()
+            self._digest, data = content_digest(raw), json.loads(raw)
+        return data
+
+    def _validate_against_schema(
+        self, schema_path: Path, kb_path: Optional[Path] = None
+    ) -> None:
+        """
+        Validate loaded data against JSON schema.
 
-    def _validate_against_schema(self, schema_path: Path) -> None:
-        """Validate loaded data against JSON schema."""
+        The bundled knowledge base is skipped when its build-time validation
+        stamp still matches the file and schema.
+        """
         if not HAS_JSONSCHEMA:
             return
 
         with open(schema_path, "r", encoding="utf-8") as f:
             schema = json.load(f)
 
+        if kb_path is not None and is_prevalidated(kb_path, self._digest, schema):
+            return
+
         try:
             jsonschema.validate(self.data, schema)
         except jsonschema.ValidationError as e:
@@ -0,0 +1,222 @@
+"""
+Binary cold-start bundle for the bundled JSON resources.
+
+Parsing the pattern library, glossary, profiles and knowledge base from JSON
+text is one of the larger fixed costs of a fresh worker. This module keeps all
+of them in a single marshal-encoded file, read once per process, much like
+Python's own ``__pycache__``:
+
+- The bundle is tagged with the library version, the Python version and the
+  size, mtime and SHA-256 of every source file.
+- A missing, corrupt or stale bundle is rebuilt from the JSON sources on first
+  use (the runtime fallback); if the cache directory is not writable the
+  rebuilt bundle is still kept in memory for the rest of the process.
+- scripts/build_resource_bundle.py builds it ahead of time, e.g. while baking
+  a container image.
+
+The bundle lives in ``$HARMONIC_ANALYSIS_CACHE_DIR`` (default
+``$XDG_CACHE_HOME/harmonic_analysis`` or ``~/.cache/harmonic_analysis``).
+Set ``HARMONIC_ANALYSIS_NO_BUNDLE=1`` to always read the JSON sources.
+
+Compiled patterns hold closures (constraint checkers, evaluator plugins), so
+they are rebuilt from the bundled data rather than serialized themselves.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+BUNDLE_FORMAT = "harmonic_analysis.resource_bundle"
+BUNDLE_VERSION = 1
+
+RESOURCES_DIR = Path(__file__).parent
+
+# Resources parsed at every cold start
+BUNDLED_RESOURCES: Tuple[str, ...] = (
+    "patterns/patterns_unified.json",
+    "glossary.json",
+    "patterns/profiles.json",
+    "educational/knowledge_base.json",
+)
+
+_lock = threading.Lock()
+_bundle: Optional[Dict[str, Any]] = None
+_unavailable = False
+
+
+def _library_version() -> str:
+    from .. import __version__
+
+    return __version__
+
+
+def default_bundle_path() -> Path:
+    """Return where the resource bundle is cached for this library/Python."""
+    cache_dir = os.environ.get("HARMONIC_ANALYSIS_CACHE_DIR")
+    if cache_dir:
+        root = Path(cache_dir)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        root = (Path(xdg) if xdg else Path.home() / ".cache") / "harmonic_analysis"
+    tag = sys.implementation.cache_tag or "py"
+    return root / f"resources-{_library_version()}.{tag}.bundle"
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def build_resource_bundle(
+    path: Optional[Path] = None, strict: bool = True
+) -> Dict[str, Any]:
+    """
+    Build the resource bundle from the JSON sources and write it.
+
+    Args:
+        path: Where to write the bundle (default: default_bundle_path())
+        strict: Raise when the bundle cannot be written; otherwise writing
+            is best-effort and the bundle is returned either way
+
+    Returns:
+        The bundle contents
+
+    Raises:
+        OSError: If a source cannot be read, or (when strict) the bundle
+            cannot be written
+        json.JSONDecodeError: If a source file is not valid JSON
+    """
+    path = path or default_bundle_path()
+    sources: Dict[str, Any] = {}
+    for name in BUNDLED_RESOURCES:
+        source = RESOURCES_DIR / name
+        raw = source.read_bytes()
+        sources[name] = {
+            "stat": _stat_key(source),
+            "sha256": hashlib.sha256(raw).hexdigest(),
+            # Marshalled per resource so each lookup decodes a fresh copy
+            "data": marshal.dumps(json.loads(raw)),
+        }
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "library_version": _library_version(),
+        "resources": sources,
+    }
+
+    # Write-then-rename so concurrent workers never read a partial bundle
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(marshal.dumps(bundle))
+        os.replace(tmp, path)
+    except OSError:
+        if strict:
+            raise
+        # Read-only image or home dir: the in-memory bundle still serves
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return bundle
+
+
+def _read_bundle(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        bundle = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (
+        not isinstance(bundle, dict)
+        or bundle.get("format") != BUNDLE_FORMAT
+        or bundle.get("version") != BUNDLE_VERSION
+        or bundle.get("library_version") != _library_version()
+    ):
+        return None
+    return bundle
+
+
+def _is_fresh(bundle: Dict[str, Any]) -> bool:
+    resources = bundle.get("resources", {})
+    try:
+        return all(
+            name in resources
+            and resources[name]["stat"] == _stat_key(RESOURCES_DIR / name)
+            for name in BUNDLED_RESOURCES
+        )
+    except OSError:
+        return False
+
+
+def load_resource_bundle() -> Optional[Dict[str, Any]]:
+    """
+    Get the resource bundle, rebuilding it when missing or stale.
+
+    Built at most once per process: when the cache directory is not writable
+    the rebuilt bundle is kept in memory, and when the sources cannot be
+    bundled at all that failure is remembered too.
+
+    Returns:
+        Bundle contents, or None when bundling is disabled or unavailable
+    """
+    global _bundle, _unavailable
+    if os.environ.get("HARMONIC_ANALYSIS_NO_BUNDLE"):
+        return None
+    with _lock:
+        if _bundle is not None or _unavailable:
+            return _bundle
+        path = default_bundle_path()
+        bundle = _read_bundle(path)
+        if bundle is None or not _is_fresh(bundle):
+            try:
+                bundle = build_resource_bundle(path, strict=False)
+            except (OSError, ValueError):
+                # Unreadable or invalid sources: don't retry on every lookup
+                _unavailable = True
+                return None
+        _bundle = bundle
+        return bundle
+
+
+def bundled_json(path: Path) -> Optional[Tuple[str, Any]]:
+    """
+    Look up a resource file in the bundle.
+
+    Args:
+        path: Path of a JSON resource file
+
+    Returns:
+        (SHA-256 of the source, freshly decoded data), or None when the file
+        is not bundled, has changed since the bundle was built, or bundling
+        is unavailable (callers then read the file themselves)
+    """
+    try:
+        name = Path(path).resolve().relative_to(RESOURCES_DIR.resolve()).as_posix()
+    except ValueError:
+        return None
+    if name not in BUNDLED_RESOURCES:
+        return None
+
+    bundle = load_resource_bundle()
+    if bundle is None:
+        return None
+    entry = bundle["resources"].get(name)
+    try:
+        if entry is None or entry["stat"] != _stat_key(RESOURCES_DIR / name):
+            return None
+    except OSError:
+        return None
+    return entry["sha256"], marshal.loads(entry["data"])
+
+
+def clear_bundle_cache() -> None:
+    """Forget the bundle loaded by this process (mainly for tests)."""
+    global _bundle, _unavailable
+    with _lock:
+        _bundle = None
+        _unavailable = False
@@ -10,6 +10,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
+from .bundle import RESOURCES_DIR, bundled_json
+
 try:
     # Python 3.9+
     from importlib import resources as resources_module
@@ -22,6 +24,9 @@ def load_json(name: str) -> Dict[str, Any]:
     """
     Load a JSON resource file from the resources package.
 
+    Resources in the binary cold-start bundle are decoded from it instead of
+    being parsed from JSON text.
+
     Args:
         name: Name of the JSON file (e.g., "patterns.json", "glossary.json")
 
@@ -32,6 +37,11 @@ def load_json(name: str) -> Dict[str, Any]:
         FileNotFoundError: If the resource file doesn't exist
         json.JSONDecodeError: If the file isn't valid JSON
     """
+    bundled = bundled_json(RESOURCES_DIR / name)
+    if bundled is not None:
+        data: Dict[str, Any] = bundled[1]
+        return data
+
     try:
         with (
             resources_module.files("harmonic_analysis.resources")
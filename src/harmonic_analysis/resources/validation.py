@@ -0,0 +1,131 @@
+"""
+Build-time validation stamps for bundled JSON resources.
+
+Bundled pattern libraries and the knowledge base are schema-validated once,
+offline, by scripts/stamp_resources.py. The stamp file records the SHA-256 of
+each resource and of the schema it passed, so loaders can skip jsonschema for
+a packaged file whose bytes and schema still match. Files outside this package
+(user-supplied pattern libraries) are never stamped and are always validated
+in full.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+VALIDATION_STAMPS_RESOURCE = "validation_stamps.json"
+VALIDATION_STAMPS_FORMAT = "harmonic_analysis.validation_stamps"
+VALIDATION_STAMPS_VERSION = 1
+
+RESOURCES_DIR = Path(__file__).parent
+
+# Bundled resources and the schema each one is validated against
+STAMPED_RESOURCES: Dict[str, str] = {
+    "patterns/patterns_unified.json": "patterns/schemas/patterns.schema.json",
+    "educational/knowledge_base.json": "educational/knowledge_base_schema.json",
+}
+
+
+def content_digest(raw: bytes) -> str:
+    """Return the SHA-256 hex digest of raw file contents."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+def schema_digest(schema: Mapping[str, Any]) -> str:
+    """
+    Return a digest of a parsed schema.
+
+    Hashes canonical JSON, so the same schema loaded from disk or defined in
+    code gets the same digest regardless of formatting.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return content_digest(canonical.encode("utf-8"))
+
+
+def _resource_name(path: Path) -> Optional[str]:
+    """Name of a bundled resource relative to this package, or None."""
+    try:
+        return Path(path).resolve().relative_to(RESOURCES_DIR.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def load_validation_stamps() -> Mapping[str, Mapping[str, str]]:
+    """
+    Load the packaged validation stamps (once per process).
+
+    Returns:
+        Mapping of resource name to its "sha256" and "schema_sha256", or an
+        empty mapping when the stamp file is missing or unsupported
+    """
+    try:
+        with (RESOURCES_DIR / VALIDATION_STAMPS_RESOURCE).open(
+            "r", encoding="utf-8"
+        ) as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if (
+        data.get("format") != VALIDATION_STAMPS_FORMAT
+        or data.get("version") != VALIDATION_STAMPS_VERSION
+    ):
+        return {}
+    stamps: Mapping[str, Mapping[str, str]] = data.get("resources", {})
+    return stamps
+
+
+def is_prevalidated(path: Path, digest: str, schema: Mapping[str, Any]) -> bool:
+    """
+    Check whether a file is a bundled resource already validated at build time.
+
+    Args:
+        path: Path the contents were read from
+        digest: SHA-256 of the file contents (see content_digest())
+        schema: Schema the caller would validate against
+
+    Returns:
+        True only for a packaged resource whose contents and schema both match
+        its stamp; callers must validate in full otherwise
+    """
+    name = _resource_name(path)
+    if name is None:
+        return False
+    stamp = load_validation_stamps().get(name)
+    if stamp is None:
+        return False
+    return stamp.get("sha256") == digest and stamp.get(
+        "schema_sha256"
+    ) == schema_digest(schema)
+
+
+def build_validation_stamps() -> Dict[str, Any]:
+    """
+    Validate every stamped resource in full and build the stamp file contents.
+
+    Returns:
+        Stamp file data ready to be written as JSON
+
+    Raises:
+        jsonschema.ValidationError: If a bundled resource fails validation
+    """
+    import jsonschema  # deferred: only needed when building stamps
+
+    resources: Dict[str, Dict[str, str]] = {}
+    for name, schema_name in sorted(STAMPED_RESOURCES.items()):
+        raw = (RESOURCES_DIR / name).read_bytes()
+        with (RESOURCES_DIR / schema_name).open("r", encoding="utf-8") as f:
+            schema = json.load(f)
+        jsonschema.validate(json.loads(raw), schema)
+        resources[name] = {
+            "sha256": content_digest(raw),
+            "schema_sha256": schema_digest(schema),
+        }
+
+    return {
+        "format": VALIDATION_STAMPS_FORMAT,
+        "version": VALIDATION_STAMPS_VERSION,
+        "resources": resources,
+    }
@@ -0,0 +1,256 @@
+"""
+Bounded executor for running CPU-bound analyses off the event loop.
+
+The async service API offloads each analysis to a thread or process pool so a
+server's event loop stays responsive. Admission is bounded: at most
+``max_in_flight`` analyses run or wait in the pool at once, further callers
+wait for a slot, and with ``max_waiting`` set, callers beyond that queue depth
+are rejected immediately with AnalysisQueueFullError. The limits hold per
+executor, across every event loop and thread that uses it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("thread", "process", "inline")
+
+
+class AnalysisQueueFullError(RuntimeError):
+    """Raised when an analysis is rejected because the wait queue is full."""
+
+
+@dataclass(frozen=True)
+class AnalysisExecutorConfig:
+    """How async analyses are offloaded and admitted."""
+
+    kind: str = "thread"
+    """"thread", "process" or "inline" (run on the event loop, no pool)."""
+
+    max_workers: Optional[int] = None
+    """Pool size (default: CPU count, at most 8)."""
+
+    max_in_flight: Optional[int] = None
+    """Analyses admitted to the pool at once (default: max_workers)."""
+
+    max_waiting: Optional[int] = None
+    """Callers allowed to wait for a slot; beyond that they are rejected
+    (None waits without limit, 0 rejects whenever every slot is busy)."""
+
+    def __post_init__(self) -> None:
+        if self.kind not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unknown executor kind {self.kind!r} (expected one of "
+                f"{', '.join(EXECUTOR_KINDS)})"
+            )
+        for name in ("max_workers", "max_in_flight"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1")
+        if self.max_waiting is not None and self.max_waiting < 0:
+            raise ValueError("max_waiting must not be negative")
+
+    @property
+    def workers(self) -> int:
+        """Resolved pool size."""
+        return self.max_workers or min(8, os.cpu_count() or 1)
+
+    @property
+    def in_flight_limit(self) -> int:
+        """Resolved admission limit."""
+        return self.max_in_flight or self.workers
+
+
+@dataclass
+class ExecutorStats:
+    """Counters for admission, queueing and rejection.
+
+    Updated only under the owning executor's lock, since callers on several
+    threads (each with its own event loop) may share one executor.
+    """
+
+    in_flight: int = 0
+    """Analyses currently admitted (running or queued in the pool)."""
+
+    waiting: int = 0
+    """Callers currently waiting for a slot (queue depth)."""
+
+    max_waiting_seen: int = 0
+    """Deepest queue observed."""
+
+    completed: int = 0
+    """Analyses finished (successfully or with an error)."""
+
+    rejected: int = 0
+    """Callers turned away because the queue was full."""
+
+    total_wait_ms: float = 0.0
+    """Time admitted callers spent waiting for a slot, summed."""
+
+    max_wait_ms: float = 0.0
+    """Longest wait for a slot."""
+
+    @property
+    def mean_wait_ms(self) -> float:
+        """Average wait for a slot per admitted analysis."""
+        admitted = self.completed + self.in_flight
+        return self.total_wait_ms / admitted if admitted else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export counters (including the derived mean)."""
+        data = {stat.name: getattr(self, stat.name) for stat in fields(self)}
+        data["mean_wait_ms"] = self.mean_wait_ms
+        return data
+
+
+def _grant(waiter: asyncio.Future) -> None:
+    # Runs on the waiter's loop; a cancelled waiter hands its slot on itself
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AnalysisExecutor:
+    """Runs synchronous analysis callables on a bounded pool from async code."""
+
+    def __init__(
+        self,
+        config: Optional[AnalysisExecutorConfig] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = (),
+    ) -> None:
+        """
+        Initialize the executor (the pool itself starts on first use).
+
+        Args:
+            config: Pool kind and admission limits
+            initializer: Run once in each worker process (process pools only)
+            initargs: Arguments for initializer
+        """
+        self.config = config or AnalysisExecutorConfig()
+        self.stats = ExecutorStats()
+        self._initializer = initializer
+        self._initargs = initargs
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # Callers waiting for a slot, oldest first. Each parks on a future of
+        # its own loop, so one executor can admit callers from many loops.
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    @property
+    def is_process(self) -> bool:
+        """Whether callables run in worker processes (and must be picklable)."""
+        return self.config.kind == "process"
+
+    def _get_pool(self) -> Optional[Executor]:
+        if self.config.kind == "inline":
+            return None
+        with self._lock:
+            if self._pool is None:
+                if self.is_process:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.config.workers,
+                        initializer=self._initializer,
+                        initargs=self._initargs,
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.config.workers,
+                        thread_name_prefix="harmonic-analysis",
+                    )
+            return self._pool
+
+    def _release_slot(self) -> None:
+        """Hand a slot to the oldest waiter, or free it (lock held)."""
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            self.stats.waiting -= 1
+            try:
+                loop.call_soon_threadsafe(_grant, waiter)
+            except RuntimeError:
+                continue  # Its loop has closed; nobody is left to wake
+            return  # The slot (and its in_flight count) passes to the waiter
+        self.stats.in_flight -= 1
+
+    async def _acquire_slot(self, loop: asyncio.AbstractEventLoop) -> None:
+        stats = self.stats
+        with self._lock:
+            if stats.in_flight < self.config.in_flight_limit:
+                stats.in_flight += 1
+                return
+
+            # Opening move: reject early rather than queue without bound
+            max_waiting = self.config.max_waiting
+            if max_waiting is not None and stats.waiting >= max_waiting:
+                stats.rejected += 1
+                raise AnalysisQueueFullError(
+                    f"Analysis queue full ({stats.in_flight} in flight, "
+                    f"{stats.waiting} waiting)"
+                )
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+            stats.waiting += 1
+            stats.max_waiting_seen = max(stats.max_waiting_seen, stats.waiting)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                    stats.waiting -= 1
+                except ValueError:
+                    # Granted a slot just as we were cancelled; pass it on
+                    self._release_slot()
+            raise
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``fn(*args)`` on the pool once a slot is free.
+
+        Args:
+            fn: Synchronous callable (module-level for process pools)
+            *args: Positional arguments for fn
+
+        Returns:
+            fn's return value
+
+        Raises:
+            AnalysisQueueFullError: If every slot is busy and max_waiting
+                callers are already waiting
+        """
+        loop = asyncio.get_running_loop()
+        stats = self.stats
+
+        queued_at = time.perf_counter()
+        await self._acquire_slot(loop)
+
+        wait_ms = (time.perf_counter() - queued_at) * 1000
+        with self._lock:
+            stats.total_wait_ms += wait_ms
+            stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+        try:
+            # Main play: the CPU-bound work happens off the event loop
+            pool = self._get_pool()
+            if pool is None:
+                return fn(*args)
+            return await loop.run_in_executor(pool, fn, *args)
+        finally:
+            with self._lock:
+                stats.completed += 1
+                self._release_slot()
+
+    def shutdown(self) -> None:
+        """Shut down the pool (a later run() starts a new one)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
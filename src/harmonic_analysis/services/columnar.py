@@ -0,0 +1,350 @@
+"""
+Columnar results for large offline batch runs.
+
+Corpus jobs usually need only a handful of fields per analysis. Keeping every
+AnalysisEnvelope (or its to_dict() tree) alive costs far more memory than the
+fields themselves, so batch analysis can instead reduce each envelope to
+NumPy columns as soon as it is built:
+
+- ``rows``: one entry per input - primary type, confidences, key, mode,
+  number of alternatives and the error message for failed inputs.
+- ``patterns`` / ``evidence``: flat tables of the primary's pattern matches
+  and the envelope's evidence. ``pattern_offsets[i]:pattern_offsets[i + 1]``
+  indexes the entries of row i; each table also carries a ``row`` column.
+
+Every table is a dict of equal-length arrays, so ``pandas.DataFrame(table)``
+takes it as is. Batches are produced one chunk at a time (see
+PatternAnalysisService.analyze_columnar()) and can be written as ``.npz``
+files or JSON Lines while the run goes on, keeping peak memory flat.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from ..dto import AnalysisEnvelope
+
+# (column, dtype) for per-row fields; str columns use "" for missing values
+# and float columns use NaN
+ROW_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("primary_type", "str"),
+    ("confidence", "float64"),
+    ("functional_confidence", "float64"),
+    ("modal_confidence", "float64"),
+    ("chromatic_confidence", "float64"),
+    ("key_signature", "str"),
+    ("mode", "str"),
+    ("alternatives", "int32"),
+    ("error", "str"),
+)
+
+PATTERN_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("row", "int64"),
+    ("pattern_id", "str"),
+    ("family", "str"),
+    ("start", "int32"),
+    ("end", "int32"),
+    ("score", "float64"),
+)
+
+EVIDENCE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("row", "int64"),
+    ("reason", "str"),
+    ("start", "int32"),
+    ("end", "int32"),
+    ("raw_score", "float64"),
+)
+
+_TABLES = (
+    ("rows", ROW_COLUMNS),
+    ("patterns", PATTERN_COLUMNS),
+    ("evidence", EVIDENCE_COLUMNS),
+)
+
+
+def _column(values: List[Any], dtype: str) -> np.ndarray:
+    if dtype == "str":
+        # Fixed-width unicode keeps .npz files free of pickled objects
+        return np.array(values, dtype=str) if values else np.array([], dtype="<U1")
+    return np.array(values, dtype=dtype)
+
+
+def _float(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+@dataclass
+class ColumnarBatch:
+    """Columnar results for a run of analyses."""
+
+    rows: Dict[str, np.ndarray]
+    """Per-input columns (see ROW_COLUMNS)."""
+
+    patterns: Dict[str, np.ndarray]
+    """Primary pattern matches of all rows (see PATTERN_COLUMNS)."""
+
+    evidence: Dict[str, np.ndarray]
+    """Envelope evidence of all rows (see EVIDENCE_COLUMNS)."""
+
+    def __len__(self) -> int:
+        return len(self.rows["confidence"])
+
+    @property
+    def pattern_offsets(self) -> np.ndarray:
+        """Row i's patterns are ``pattern_offsets[i]:pattern_offsets[i + 1]``."""
+        return self._offsets(self.patterns["row"])
+
+    @property
+    def evidence_offsets(self) -> np.ndarray:
+        """Row i's evidence is ``evidence_offsets[i]:evidence_offsets[i + 1]``."""
+        return self._offsets(self.evidence["row"])
+
+    def _offsets(self, rows: np.ndarray) -> np.ndarray:
+        # Tables are written in row order, so offsets are a sorted search
+        return np.searchsorted(rows, np.arange(len(self) + 1)).astype(np.int64)
+
+    @classmethod
+    def concat(cls, batches: Iterable["ColumnarBatch"]) -> "ColumnarBatch":
+        """
+        Join batches into one, renumbering rows.
+
+        Args:
+            batches: Batches in row order
+
+        Returns:
+            A single batch holding every row
+        """
+        batches = list(batches)
+        tables: Dict[str, Dict[str, np.ndarray]] = {}
+        for table, columns in _TABLES:
+            parts: Dict[str, List[np.ndarray]] = {name: [] for name, _ in columns}
+            first_row = 0
+            for batch in batches:
+                data = getattr(batch, table)
+                for name, _ in columns:
+                    values = data[name]
+                    if table != "rows" and name == "row":
+                        values = values + first_row
+                    parts[name].append(values)
+                first_row += len(batch)
+            tables[table] = {
+                name: (
+                    np.concatenate(parts[name]) if parts[name] else _column([], dtype)
+                )
+                for name, dtype in columns
+            }
+        return cls(**tables)
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield each row as a plain dict with its patterns and evidence nested.
+
+        Missing strings and confidences come out as None.
+        """
+        pattern_offsets = self.pattern_offsets.tolist()
+        evidence_offsets = self.evidence_offsets.tolist()
+        rows = {name: self.rows[name].tolist() for name, _ in ROW_COLUMNS}
+        patterns = {name: self.patterns[name].tolist() for name, _ in PATTERN_COLUMNS}
+        evidence = {name: self.evidence[name].tolist() for name, _ in EVIDENCE_COLUMNS}
+
+        def nested(
+            table: Dict[str, List[Any]],
+            columns: Tuple[Tuple[str, str], ...],
+            start: int,
+            end: int,
+        ) -> List[Dict[str, Any]]:
+            return [
+                {name: table[name][i] for name, _ in columns if name != "row"}
+                for i in range(start, end)
+            ]
+
+        for i in range(len(self)):
+            row: Dict[str, Any] = {}
+            for name, dtype in ROW_COLUMNS:
+                value = rows[name][i]
+                if (dtype == "str" and value == "") or (
+                    dtype == "float64" and math.isnan(value)
+                ):
+                    value = None
+                row[name] = value
+            row["patterns"] = nested(
+                patterns, PATTERN_COLUMNS, pattern_offsets[i], pattern_offsets[i + 1]
+            )
+            row["evidence"] = nested(
+                evidence, EVIDENCE_COLUMNS, evidence_offsets[i], evidence_offsets[i + 1]
+            )
+            yield row
+
+    def save_npz(self, path: Union[str, Path], compressed: bool = True) -> None:
+        """
+        Write the batch as an ``.npz`` archive (one array per column).
+
+        Args:
+            path: Destination file
+            compressed: Use np.savez_compressed (default) instead of np.savez
+        """
+        arrays = {
+            f"{table}.{name}": getattr(self, table)[name]
+            for table, columns in _TABLES
+            for name, _ in columns
+        }
+        save = np.savez_compressed if compressed else np.savez
+        save(path, **arrays)
+
+    @classmethod
+    def load_npz(cls, path: Union[str, Path]) -> "ColumnarBatch":
+        """
+        Read a batch written by save_npz().
+
+        Args:
+            path: ``.npz`` file
+
+        Returns:
+            The batch
+
+        Raises:
+            KeyError: If the archive lacks a column
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            return cls(
+                **{
+                    table: {name: archive[f"{table}.{name}"] for name, _ in columns}
+                    for table, columns in _TABLES
+                }
+            )
+
+
+class ColumnarBuilder:
+    """Reduces envelopes to column values one at a time."""
+
+    def __init__(self) -> None:
+        self._tables: Dict[str, Dict[str, List[Any]]] = {
+            table: {name: [] for name, _ in columns} for table, columns in _TABLES
+        }
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, envelope: AnalysisEnvelope) -> None:
+        """
+        Append one analysis (the envelope can be dropped afterwards).
+
+        Every value is read before any column is touched, so an envelope
+        that fails to reduce (e.g. a malformed evidence span) leaves the
+        builder unchanged and the caller can add_error() in its place.
+
+        Args:
+            envelope: Analysis result
+        """
+        row = self._count
+        primary = envelope.primary
+
+        # Opening move: reduce the envelope to records, in column order
+        row_record = (
+            getattr(primary.type, "value", primary.type),
+            _float(primary.confidence),
+            _float(primary.functional_confidence),
+            _float(primary.modal_confidence),
+            _float(primary.chromatic_confidence),
+            primary.key_signature or "",
+            primary.mode or "",
+            len(envelope.alternatives),
+            "",
+        )
+        pattern_records = [
+            (
+                row,
+                match.pattern_id,
+                match.family or "",
+                match.start,
+                match.end,
+                _float(match.score),
+            )
+            for match in primary.patterns
+        ]
+        evidence_records = []
+        for item in envelope.evidence:
+            span = item.details.get("span") or (-1, -1)
+            evidence_records.append(
+                (
+                    row,
+                    item.reason,
+                    span[0],
+                    span[1],
+                    _float(item.details.get("raw_score")),
+                )
+            )
+
+        # Victory lap: nothing below can raise, so rows stay aligned
+        self._extend("rows", ROW_COLUMNS, [row_record])
+        self._extend("patterns", PATTERN_COLUMNS, pattern_records)
+        self._extend("evidence", EVIDENCE_COLUMNS, evidence_records)
+        self._count += 1
+
+    def _extend(
+        self,
+        table: str,
+        columns: Tuple[Tuple[str, str], ...],
+        records: List[Tuple[Any, ...]],
+    ) -> None:
+        values = self._tables[table]
+        for index, (name, _) in enumerate(columns):
+            values[name].extend(record[index] for record in records)
+
+    def add_error(self, error: BaseException) -> None:
+        """
+        Append a row for an input that failed to analyze.
+
+        Args:
+            error: The exception raised for that input
+        """
+        rows = self._tables["rows"]
+        for name, dtype in ROW_COLUMNS:
+            if name == "error":
+                rows[name].append(f"{type(error).__name__}: {error}")
+            elif dtype == "str":
+                rows[name].append("")
+            elif dtype == "float64":
+                rows[name].append(math.nan)
+            else:
+                rows[name].append(0)
+        self._count += 1
+
+    def build(self) -> ColumnarBatch:
+        """Convert the accumulated values to a ColumnarBatch."""
+        return ColumnarBatch(
+            **{
+                table: {
+                    name: _column(self._tables[table][name], dtype)
+                    for name, dtype in columns
+                }
+                for table, columns in _TABLES
+            }
+        )
+
+
+def write_jsonl(batches: Iterable[ColumnarBatch], stream: IO[str]) -> int:
+    """
+    Stream batches to JSON Lines, one object per analysis.
+
+    Args:
+        batches: Batches in row order (consumed lazily)
+        stream: Text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    for batch in batches:
+        for row in batch.iter_rows():
+            stream.write(json.dumps(row, ensure_ascii=False))
+            stream.write("\n")
+            count += 1
+    return count
@@ -9,7 +9,23 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, List, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from harmonic_analysis.dto import (
     AnalysisEnvelope,
@@ -19,10 +35,72 @@ from harmonic_analysis.dto import (
 )
 
 from .analysis_arbitration_service import AnalysisArbitrationService
+from .analysis_executor import AnalysisExecutor, AnalysisExecutorConfig
+from .columnar import ColumnarBatch, ColumnarBuilder
 from .unified_pattern_service import UnifiedPatternService
 
 logger = logging.getLogger(__name__)
 
+# Service built once per analyze_many() worker process by _init_worker()
+_WORKER_SERVICE: Optional["PatternAnalysisService"] = None
+
+T = TypeVar("T")
+
+ManyResult = Union[Dict[str, Any], Exception]
+"""analyze_many() item: a serialized envelope, or the error for that input."""
+
+
+def _init_worker(auto_calibrate: bool, arbitration_policy: Optional[Any]) -> None:
+    """Process-pool initializer: build the worker's service exactly once."""
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = PatternAnalysisService(
+        arbitration_policy=arbitration_policy,
+        auto_calibrate=auto_calibrate,
+        # Already in a dedicated process: analyze on the calling thread
+        executor_config=AnalysisExecutorConfig(kind="inline"),
+    )
+
+
+def _analyze_chunk(
+    chunk: List[Mapping[str, Any]],
+    service: Optional["PatternAnalysisService"] = None,
+) -> List[ManyResult]:
+    """
+    Analyze a chunk of analyze_with_patterns() keyword mappings.
+
+    Envelopes are serialized here so the work happens in the worker, and each
+    input's error is returned in its place instead of failing the chunk.
+    """
+    service = service or _WORKER_SERVICE
+    if service is None:
+        raise RuntimeError("analyze_many worker was not initialized")
+
+    results: List[ManyResult] = []
+    for item in chunk:
+        try:
+            results.append(service.analyze_with_patterns(**item).to_dict())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _analyze_chunk_columnar(
+    chunk: List[Mapping[str, Any]],
+    service: Optional["PatternAnalysisService"] = None,
+) -> ColumnarBatch:
+    """Analyze a chunk, reducing each envelope to columns right away."""
+    service = service or _WORKER_SERVICE
+    if service is None:
+        raise RuntimeError("analyze_many worker was not initialized")
+
+    builder = ColumnarBuilder()
+    for item in chunk:
+        try:
+            builder.add(service.analyze_with_patterns(**item))
+        except Exception as e:
+            builder.add_error(e)
+    return builder.build()
+
 
 class PatternAnalysisService:
     """
@@ -30,6 +108,8 @@ class PatternAnalysisService:
 
     This is now a thin facade over UnifiedPatternService, providing the same
     API surface while delegating all actual analysis to the unified engine.
+    It shares that service's thread-safety contract; arbitration is
+    stateless per call.
     """
 
     def __init__(
@@ -41,6 +121,7 @@ class PatternAnalysisService:
         arbitration_policy: Optional[Any] = None,  # Used for arbitration service
         calibration_service: Optional[Any] = None,  # Ignored - compatibility only
         auto_calibrate: bool = True,
+        executor_config: Optional[AnalysisExecutorConfig] = None,
     ) -> None:
         """
         Initialize PatternAnalysisService as a facade over UnifiedPatternService.
@@ -50,10 +131,22 @@ class PatternAnalysisService:
 
         Args:
             auto_calibrate: Whether to enable quality-gated calibration
+            executor_config: Bounded executor for async analyses (see
+                UnifiedPatternService)
             **kwargs: Legacy parameters (ignored)
         """
         # Opening move: delegate everything to the unified pattern service
-        self._unified_service = UnifiedPatternService(auto_calibrate=auto_calibrate)
+        self._auto_calibrate = auto_calibrate
+        self._arbitration_policy = arbitration_policy
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        # Streams running on each pool; a replaced pool is shut down only
+        # once its last stream finishes
+        self._pool_users: Dict[ProcessPoolExecutor, int] = {}
+        self._pool_lock = threading.Lock()
+        self._unified_service = UnifiedPatternService(
+            auto_calibrate=auto_calibrate, executor_config=executor_config
+        )
 
         # Store arbitration policy for iteration 9 arbitration support
         self._arbitration_service = None
@@ -104,6 +197,70 @@ class PatternAnalysisService:
             ValueError: If multiple input types are provided, or if
                        romans/notes/melody are provided without key_hint
         """
+        self._validate_inputs(chord_symbols, key_hint, romans, notes, melody)
+
+        # Big play: the unified service runs the core off the event loop
+        envelope = await self._unified_service.analyze_with_patterns_async(
+            chords=chord_symbols,
+            romans=romans,
+            notes=notes,
+            melody=melody,
+            key_hint=key_hint,
+            profile=profile,
+            options={
+                "best_cover": best_cover,
+                "sections": sections,
+            },  # Pass through for compatibility
+        )
+        return self._apply_arbitration(envelope, chord_symbols)
+
+    def analyze_with_patterns(
+        self,
+        chord_symbols: Optional[List[str]] = None,
+        profile: str = "classical",
+        best_cover: bool = True,  # Ignored - compatibility only
+        key_hint: Optional[str] = None,
+        sections: Optional[List[SectionDTO]] = None,  # Ignored - compatibility only
+        romans: Optional[List[str]] = None,  # NEW: Roman numeral input support
+        notes: Optional[List[str]] = None,  # NEW: Scale notes input support
+        melody: Optional[List[str]] = None,  # NEW: Melody input support
+    ) -> AnalysisEnvelope:
+        """
+        Analyze synchronously - same contract as analyze_with_patterns_async.
+
+        Runs the analysis directly on the calling thread; no event loop or
+        thread pool is created.
+        """
+        self._validate_inputs(chord_symbols, key_hint, romans, notes, melody)
+        envelope = self._unified_service.analyze_with_patterns(
+            chords=chord_symbols,
+            romans=romans,
+            notes=notes,
+            melody=melody,
+            key_hint=key_hint,
+            profile=profile,
+            options={"best_cover": best_cover, "sections": sections},
+        )
+        envelope = self._apply_arbitration(envelope, chord_symbols)
+
+        primary = envelope.primary
+        if primary and getattr(primary, "chromatic_elements", None):
+            summary_str = ", ".join(str(el) for el in primary.chromatic_elements)
+            logger.info("Chromatic: %s", summary_str)
+        elif primary:
+            logger.debug("Chromatic: No chromatic elements detected")
+
+        return envelope
+
+    @staticmethod
+    def _validate_inputs(
+        chord_symbols: Optional[List[str]],
+        key_hint: Optional[str],
+        romans: Optional[List[str]],
+        notes: Optional[List[str]],
+        melody: Optional[List[str]],
+    ) -> None:
+        """Check input exclusivity and key requirements (raises ValueError)."""
         # Opening move: validate input exclusivity and requirements
         input_count = sum(
             1 for x in [chord_symbols, romans, notes, melody] if x is not None
@@ -126,20 +283,10 @@ class PatternAnalysisService:
             )
             raise ValueError(f"{analysis_type} analysis requires key_hint parameter")
 
-        # Big play: delegate to unified service with parameter mapping
-        envelope = await self._unified_service.analyze_with_patterns_async(
-            chords=chord_symbols,
-            romans=romans,
-            notes=notes,
-            melody=melody,
-            key_hint=key_hint,
-            profile=profile,
-            options={
-                "best_cover": best_cover,
-                "sections": sections,
-            },  # Pass through for compatibility
-        )
-
+    def _apply_arbitration(
+        self, envelope: AnalysisEnvelope, chord_symbols: Optional[List[str]]
+    ) -> AnalysisEnvelope:
+        """Apply functional/modal arbitration when a policy is configured."""
         # Iteration 9: Apply arbitration if arbitration service is configured
         if self._arbitration_service and envelope.primary:
             try:
@@ -217,66 +364,175 @@ class PatternAnalysisService:
 
         return envelope
 
-    def analyze_with_patterns(
+    def analyze_many(
         self,
-        chord_symbols: Optional[List[str]] = None,
-        profile: str = "classical",
-        best_cover: bool = True,  # Ignored - compatibility only
-        key_hint: Optional[str] = None,
-        sections: Optional[List[SectionDTO]] = None,  # Ignored - compatibility only
-        romans: Optional[List[str]] = None,  # NEW: Roman numeral input support
-        notes: Optional[List[str]] = None,  # NEW: Scale notes input support
-        melody: Optional[List[str]] = None,  # NEW: Melody input support
-    ) -> AnalysisEnvelope:
+        inputs: Iterable[Mapping[str, Any]],
+        workers: Optional[int] = None,
+        chunksize: int = 16,
+    ) -> Iterator[ManyResult]:
         """
-        Synchronous wrapper for analyze_with_patterns_async.
+        Analyze many inputs in parallel on a warm process pool.
 
-        This looks odd, but it saves us from async complexity in sync contexts.
+        Each worker process builds its own service once (patterns, glossary and
+        the packaged calibration), then analyzes chunks of inputs. The pool is
+        kept alive for later calls with the same worker count; a call with a
+        different count starts a new pool, and the old one is shut down once
+        streams still running on it finish. Call close() to shut it down.
+        Results stream back in input order while at most two chunks per
+        worker are in flight, so ``inputs`` may be a lazy iterable.
+
+        Args:
+            inputs: analyze_with_patterns() keyword mappings (chord_symbols,
+                key_hint, profile, romans, notes, melody), one per analysis
+            workers: Number of worker processes (default: CPU count). With 1,
+                inputs are analyzed in this process without a pool.
+            chunksize: Inputs sent to a worker per task
+
+        Yields:
+            For each input, in order, the envelope as a dict
+            (AnalysisEnvelope.to_dict()), or the exception raised for that
+            input; one bad input never fails the batch
+
+        Raises:
+            ValueError: If workers or chunksize is less than 1
         """
-        import asyncio
+        for chunk in self._stream_chunks(inputs, workers, chunksize, _analyze_chunk):
+            yield from chunk
 
+    def analyze_columnar(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+    ) -> Iterator[ColumnarBatch]:
+        """
+        Analyze many inputs like analyze_many(), returning columnar results.
+
+        Each envelope is reduced to a few NumPy columns in the worker as soon
+        as it is built (see services.columnar), so neither envelopes nor their
+        dicts accumulate. One batch is yielded per chunk; write each to disk
+        (ColumnarBatch.save_npz(), columnar.write_jsonl()) as it arrives to
+        keep memory flat, or join them with ColumnarBatch.concat().
+
+        Args:
+            inputs: analyze_with_patterns() keyword mappings, one per analysis
+            workers: Number of worker processes (default: CPU count; 1 runs
+                in this process)
+            chunksize: Inputs per batch
+
+        Yields:
+            ColumnarBatch per chunk, in input order; inputs that fail to
+            analyze get a row with only the ``error`` column set
+
+        Raises:
+            ValueError: If workers or chunksize is less than 1
+        """
+        yield from self._stream_chunks(
+            inputs, workers, chunksize, _analyze_chunk_columnar
+        )
+
+    def _stream_chunks(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        workers: Optional[int],
+        chunksize: int,
+        analyze_chunk: Callable[..., T],
+    ) -> Iterator[T]:
+        """Run analyze_chunk over chunks of inputs, yielding results in order."""
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+
+        items = iter(inputs)
+        chunks = iter(lambda: list(islice(items, chunksize)), [])
+        if workers == 1:
+            for chunk in chunks:
+                yield analyze_chunk(chunk, self)
+            return
+
+        pool = self._acquire_pool(workers)
+        pending: Deque[Future[T]] = deque()
         try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            envelope = asyncio.run(
-                self.analyze_with_patterns_async(
-                    chord_symbols=chord_symbols,
-                    romans=romans,
-                    notes=notes,
-                    melody=melody,
-                    key_hint=key_hint,
-                    profile=profile,
-                    best_cover=best_cover,
-                    sections=sections,
-                )
-            )
-        else:
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    self.analyze_with_patterns_async(
-                        chord_symbols=chord_symbols,
-                        romans=romans,
-                        notes=notes,
-                        melody=melody,
-                        key_hint=key_hint,
-                        profile=profile,
-                        best_cover=best_cover,
-                        sections=sections,
-                    ),
+            # Main play: keep every worker busy, yield chunks as they complete
+            for chunk in chunks:
+                pending.append(pool.submit(analyze_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Abandoned early: drop the chunks nobody will read
+            for future in pending:
+                future.cancel()
+            self._release_pool(pool)
+
+    def _acquire_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Return the warm worker pool for a size, registering a stream on it.
+
+        Every call must be paired with _release_pool(). A pool of another
+        size is retired, not shut down, while other streams still use it.
+        """
+        retired = None
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers != workers:
+                retired = self._retire_pool()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(self._auto_calibrate, self._arbitration_policy),
                 )
-                envelope = future.result()
+                self._pool_workers = workers
+            pool = self._pool
+            self._pool_users[pool] = self._pool_users.get(pool, 0) + 1
+        if retired is not None:
+            retired.shutdown(cancel_futures=True)
+        return pool
+
+    def _release_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Unregister a stream; shut its pool down if retired and now idle."""
+        with self._pool_lock:
+            self._pool_users[pool] -= 1
+            if self._pool_users[pool]:
+                return
+            del self._pool_users[pool]
+            if pool is self._pool:
+                return  # Still the warm pool; keep it for the next call
+        pool.shutdown(cancel_futures=True)
+
+    def _retire_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Detach the warm pool (caller holds _pool_lock).
 
-        primary = envelope.primary
-        if primary and getattr(primary, "chromatic_elements", None):
-            summary_str = ", ".join(str(el) for el in primary.chromatic_elements)
-            logger.info("Chromatic: %s", summary_str)
-        elif primary:
-            logger.debug("Chromatic: No chromatic elements detected")
+        Returns:
+            The pool if no stream uses it (the caller shuts it down outside
+            the lock), otherwise None; _release_pool() shuts it down later
+        """
+        pool, self._pool = self._pool, None
+        self._pool_workers = 0
+        if pool is None or pool in self._pool_users:
+            return None
+        return pool
 
-        return envelope
+    def close(self) -> None:
+        """
+        Shut down the analyze_many() and async executor pools.
+
+        A worker pool with streams still running is shut down as soon as
+        those streams finish (or are closed).
+        """
+        self._unified_service.close()
+        with self._pool_lock:
+            pool = self._retire_pool()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    @property
+    def executor(self) -> AnalysisExecutor:
+        """Bounded executor running analyze_with_patterns_async() calls."""
+        return self._unified_service.executor
 
     def get_analysis_summary(self, envelope: AnalysisEnvelope) -> AnalysisSummary:
         """Generate analysis summary from envelope (compatibility method)."""
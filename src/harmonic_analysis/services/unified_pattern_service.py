@@ -7,28 +7,77 @@ the new unified pattern engine while maintaining complete API compatibility.
 
 from __future__ import annotations
 
+import functools
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from harmonic_analysis.dto import AnalysisEnvelope, AnalysisSummary, AnalysisType
 
 from ..core.pattern_engine.aggregator import Aggregator
-from ..core.pattern_engine.calibration import CalibrationMapping, Calibrator
+from ..core.pattern_engine.calibration import (
+    CalibrationMapping,
+    Calibrator,
+    load_default_calibration,
+    synthetic_calibration_data,
+)
+from ..core.pattern_engine.incremental_session import IncrementalAnalysisSession
 from ..core.pattern_engine.pattern_engine import AnalysisContext, PatternEngine
 from ..core.pattern_engine.pattern_loader import PatternLoader
 from ..core.pattern_engine.plugin_registry import PluginRegistry
 from ..core.pattern_engine.token_converter import romanize_chord
 from ..core.telemetry import get_telemetry_collector
 from ..core.utils.music_theory_constants import canonicalize_key_signature
+from .analysis_executor import AnalysisExecutor, AnalysisExecutorConfig
 
 logger = logging.getLogger(__name__)
 
+# Service built once per process-pool worker by _init_analysis_worker()
+_WORKER_SERVICE: Optional["UnifiedPatternService"] = None
+
+
+def _init_analysis_worker(auto_calibrate: bool) -> None:
+    """Process-pool initializer: build the worker's service exactly once."""
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = UnifiedPatternService(
+        auto_calibrate=auto_calibrate,
+        executor_config=AnalysisExecutorConfig(kind="inline"),
+    )
+
+
+def _analyze_in_worker(kwargs: Dict[str, Any]) -> AnalysisEnvelope:
+    """Run one analysis on the worker process's service."""
+    if _WORKER_SERVICE is None:
+        raise RuntimeError("analysis worker was not initialized")
+    return _WORKER_SERVICE._analyze(**kwargs)
+
+
+@dataclass
+class _PreparedAnalysis:
+    """Normalized service inputs for one analysis."""
+
+    context: AnalysisContext
+    chords: Optional[List[str]]
+    key_hint: Optional[str]
+    profile: str
+    mode_label: Optional[str]
+    scale_analysis_data: Optional[Dict[str, Any]]
+    melody_analysis_data: Optional[Dict[str, Any]]
+
 
 class UnifiedPatternService:
     """Unified pattern service using the new pattern engine architecture.
 
     Drop-in replacement for PatternAnalysisService with identical API.
+
+    Thread safety: one instance may serve analyses from many threads at once.
+    After construction the engine, compiled patterns, glossary and
+    calibration mapping are only read; every analysis builds its own context,
+    evidence and envelope; and the shared counters (telemetry, prefilter
+    stats) are lock-protected. Registering plugins or loading patterns is
+    setup work and must not overlap with running analyses.
     """
 
     def __init__(
@@ -40,14 +89,25 @@ class UnifiedPatternService:
         arbitration_policy: Optional[Any] = None,  # Ignored for compatibility
         calibration_service: Optional[Any] = None,
         auto_calibrate: bool = True,
+        executor_config: Optional[AnalysisExecutorConfig] = None,
     ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            auto_calibrate: Whether to apply the quality-gated calibration
+            executor_config: Where analyze_with_patterns_async() runs the
+                CPU-bound analysis and how many may be in flight (default: a
+                bounded thread pool)
+            Other arguments are accepted for compatibility and ignored.
+        """
         # Main play: initialize the unified pattern engine
         loader = PatternLoader()
         aggregator = Aggregator()
         plugin_registry = PluginRegistry()
         self.engine = PatternEngine(loader, aggregator, plugin_registry)
 
-        # Load unified patterns using the correct method
+        # Load unified patterns (validated and compiled once per process)
         try:
             patterns_path = (
                 Path(__file__).parent.parent
@@ -55,13 +115,11 @@ class UnifiedPatternService:
                 / "patterns"
                 / "patterns_unified.json"
             )
-            # Big play: load full structure but provide patterns as expected by engine
-            full_data = loader.load(patterns_path)
-            patterns_list = full_data.get("patterns", [])
-            self.engine._patterns = {"patterns": patterns_list}
+            self.engine.load_patterns(patterns_path)
 
             logger.info(
-                f"✅ Loaded {len(patterns_list)} unified patterns from {patterns_path}"
+                f"✅ Loaded {len(self.engine.compiled_patterns)} unified patterns "
+                f"from {patterns_path}"
             )
         except Exception as e:
             logger.error(f"❌ Failed to load unified patterns: {e}")
@@ -81,73 +139,58 @@ class UnifiedPatternService:
         if self.calibrator:
             self._initialize_calibration()
 
+        # Async analyses are offloaded so they never block the event loop
+        self.executor = AnalysisExecutor(
+            executor_config,
+            initializer=_init_analysis_worker,
+            initargs=(auto_calibrate,),
+        )
+
     def _initialize_calibration(self) -> None:
-        """Initialize calibration mapping using synthetic training data."""
+        """Load the packaged calibration mapping (fit synthetic data if absent)."""
+        try:
+            # Big play: the pre-fitted artifact loads without touching sklearn
+            self.calibration_mapping = load_default_calibration()
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning(
+                f"⚠️ Calibration artifact unavailable ({e}) - fitting synthetic data"
+            )
+            self.calibration_mapping = self._fit_calibration()
+
+        if self.calibration_mapping and self.calibration_mapping.passed_gates:
+            logger.info(
+                "✅ Quality-gated calibration initialized: "
+                f"{self.calibration_mapping.mapping_type}"
+            )
+        elif self.calibration_mapping:
+            logger.info("⚠️ Calibration quality gates failed - using identity mapping")
+
+    def _fit_calibration(self) -> Optional[CalibrationMapping]:
+        """Fit a calibration mapping on the synthetic training data."""
         try:
-            # Big play: collect synthetic calibration data for quality-gated calibration
             raw_scores, targets = self._collect_calibration_data()
 
             if len(raw_scores) > 0 and self.calibrator is not None:
                 # Victory lap: fit calibration mapping with quality gates
-                self.calibration_mapping = self.calibrator.fit(raw_scores, targets)
-
-                if self.calibration_mapping and self.calibration_mapping.passed_gates:
-                    mapping_type = (
-                        self.calibration_mapping.mapping_type
-                        if self.calibration_mapping
-                        else "unknown"
-                    )
-                    logger.info(
-                        f"✅ Quality-gated calibration initialized: {mapping_type}"
-                    )
-                else:
-                    logger.info(
-                        "⚠️ Calibration quality gates failed - using identity mapping"
-                    )
-            else:
-                logger.warning(
-                    "❌ No calibration data available - calibration disabled"
-                )
+                return self.calibrator.fit(raw_scores, targets)
 
+            logger.warning("❌ No calibration data available - calibration disabled")
         except Exception as e:
             logger.warning(f"⚠️ Calibration initialization failed: {e}")
-            self.calibration_mapping = None
+        return None
 
     def _collect_calibration_data(self) -> Tuple[List[float], List[float]]:
         """
         Collect synthetic calibration data for training.
 
         This method generates representative raw scores and target reliability values
-        to train the quality-gated calibration system.
+        to train the quality-gated calibration system. The data is seeded, so every
+        process fits the same mapping as the packaged artifact.
 
         Returns:
             Tuple of (raw_scores, targets) for calibration training
         """
-        import numpy as np
-
-        # Opening move: generate synthetic calibration data
-        # This simulates real analysis scenarios with known reliability
-        raw_scores: List[float] = []
-        targets: List[float] = []
-
-        # High confidence scenarios (strong patterns, clear tonality)
-        high_conf_base = np.random.uniform(0.7, 0.95, 50)
-        high_targets = np.clip(high_conf_base * 0.85 + 0.1, 0.0, 1.0)
-        raw_scores.extend(high_conf_base)
-        targets.extend(high_targets)
-
-        # Medium confidence scenarios (ambiguous patterns, multiple interpretations)
-        med_conf_base = np.random.uniform(0.4, 0.7, 80)
-        med_targets = np.clip(med_conf_base * 0.6 + 0.2, 0.0, 1.0)
-        raw_scores.extend(med_conf_base)
-        targets.extend(med_targets)
-
-        # Low confidence scenarios (weak patterns, chromatic passages)
-        low_conf_base = np.random.uniform(0.1, 0.4, 30)
-        low_targets = np.clip(low_conf_base * 0.3 + 0.05, 0.0, 1.0)
-        raw_scores.extend(low_conf_base)
-        targets.extend(low_targets)
-
+        raw_scores, targets = synthetic_calibration_data()
         logger.debug(f"🎯 Generated {len(raw_scores)} calibration samples")
         return raw_scores, targets
 
@@ -177,6 +220,41 @@ class UnifiedPatternService:
             melody: List of melodic notes (e.g., ['G4', 'A4', 'B4', 'C5'])
                    Mutually exclusive with other inputs; requires key_hint
 
+        Returns:
+            AnalysisEnvelope with primary and alternative analyses
+
+        Raises:
+            AnalysisQueueFullError: If the executor's wait queue is full
+
+        The analysis itself runs on the service's bounded executor (see
+        executor_config), so awaiting this never blocks the event loop.
+        """
+        kwargs = dict(
+            chords=chords,
+            key_hint=key_hint,
+            profile=profile,
+            options=options,
+            romans=romans,
+            notes=notes,
+            melody=melody,
+        )
+        if self.executor.is_process:
+            return await self.executor.run(_analyze_in_worker, kwargs)
+        return await self.executor.run(functools.partial(self._analyze, **kwargs))
+
+    def _analyze(
+        self,
+        chords: Optional[List[str]] = None,
+        key_hint: Optional[str] = None,
+        profile: str = "classical",
+        options: Optional[Any] = None,
+        romans: Optional[List[str]] = None,
+        notes: Optional[List[str]] = None,
+        melody: Optional[List[str]] = None,
+    ) -> AnalysisEnvelope:
+        """
+        Synchronous analysis core (see analyze_with_patterns_async()).
+
         Returns:
             AnalysisEnvelope with primary and alternative analyses
         """
@@ -184,19 +262,135 @@ class UnifiedPatternService:
 
         start_time = time.perf_counter()
 
-        # Opening move: start telemetry session
-        context_placeholder = type(
-            "obj",
-            (object,),
-            {
-                "chords": chords,
-                "melody": melody,
-                "scales": [notes] if notes else [],
-                "roman_numerals": romans,
-            },
-        )()
+        # Opening move: start telemetry session (a plain namespace - a
+        # throwaway class per call would only be freed by the cycle collector)
+        context_placeholder = SimpleNamespace(
+            chords=chords,
+            melody=melody,
+            scales=[notes] if notes else [],
+            roman_numerals=romans,
+        )
         session_id = self.telemetry.log_analysis_start(context_placeholder)
 
+        prepared = self._prepare_analysis(
+            chords, key_hint, profile, options, romans, notes, melody
+        )
+
+        # Big play: run the unified engine analysis
+        envelope = self.engine.analyze(prepared.context)
+        envelope = self._apply_modal_parent_key(prepared, envelope)
+
+        # Victory lap: apply quality-gated calibration if available
+        self._calibrate_envelopes([envelope])
+
+        # Final enhancement: populate scale/melody summaries if available
+        envelope = self._enhance_envelope(prepared, envelope)
+
+        # Victory lap: log telemetry for completed analysis
+        end_time = time.perf_counter()
+        self._log_completion(session_id, (end_time - start_time) * 1000, envelope)
+
+        return envelope
+
+    def analyze_with_patterns(
+        self,
+        chords: Optional[List[str]] = None,
+        key_hint: Optional[str] = None,
+        profile: str = "classical",
+        options: Optional[Any] = None,
+        romans: Optional[List[str]] = None,
+        notes: Optional[List[str]] = None,
+        melody: Optional[List[str]] = None,
+    ) -> AnalysisEnvelope:
+        """
+        Analyze synchronously - same contract as analyze_with_patterns_async.
+
+        Runs the analysis directly on the calling thread; no event loop or
+        thread pool is created, so it is safe (and cheap) to call from sync
+        batch jobs and from inside a running loop alike.
+        """
+        return self._analyze(chords, key_hint, profile, options, romans, notes, melody)
+
+    def close(self) -> None:
+        """Shut down the async executor's pool (it restarts on next use)."""
+        self.executor.shutdown()
+
+    def analyze_batch(
+        self, inputs: Sequence[Mapping[str, Any]]
+    ) -> List[AnalysisEnvelope]:
+        """
+        Analyze many inputs synchronously with shared engine state.
+
+        Each input holds analyze_with_patterns() keyword arguments (chords,
+        key_hint, profile, options, romans, notes, melody). All inputs are
+        normalized first, matched by PatternEngine.analyze_batch() and then
+        calibrated in one vectorized call. No event loop is involved.
+
+        Args:
+            inputs: Keyword-argument mappings, one per analysis
+
+        Returns:
+            AnalysisEnvelopes in input order
+
+        Raises:
+            ValueError: If any input is invalid (nothing is analyzed then)
+        """
+        import time
+
+        start_time = time.perf_counter()
+
+        # Opening move: normalize every input before analyzing any of them
+        prepared = [self._prepare_analysis(**item) for item in inputs]
+        session_ids = [
+            self.telemetry.log_analysis_start(item.context) for item in prepared
+        ]
+
+        # Main play: one engine pass and one calibration call for the batch
+        envelopes = self.engine.analyze_batch([item.context for item in prepared])
+        envelopes = [
+            self._apply_modal_parent_key(item, envelope)
+            for item, envelope in zip(prepared, envelopes)
+        ]
+        self._calibrate_envelopes(envelopes)
+        envelopes = [
+            self._enhance_envelope(item, envelope)
+            for item, envelope in zip(prepared, envelopes)
+        ]
+
+        # Victory lap: telemetry gets the amortized per-item time
+        per_item_ms = (time.perf_counter() - start_time) * 1000 / max(len(inputs), 1)
+        for session_id, envelope in zip(session_ids, envelopes):
+            self._log_completion(session_id, per_item_ms, envelope)
+        return envelopes
+
+    def _prepare_analysis(
+        self,
+        chords: Optional[List[str]] = None,
+        key_hint: Optional[str] = None,
+        profile: str = "classical",
+        options: Optional[Any] = None,
+        romans: Optional[List[str]] = None,
+        notes: Optional[List[str]] = None,
+        melody: Optional[List[str]] = None,
+    ) -> _PreparedAnalysis:
+        """
+        Validate and normalize service inputs into an analysis context.
+
+        Args:
+            chords: Chord symbols
+            key_hint: Optional key context (required for roman/scale/melody)
+            profile: Analysis profile
+            options: Additional analysis options ("sections")
+            romans: Roman numerals (mutually exclusive with other inputs)
+            notes: Scale notes (mutually exclusive with other inputs)
+            melody: Melodic notes (mutually exclusive with other inputs)
+
+        Returns:
+            _PreparedAnalysis holding the context and summary inputs
+
+        Raises:
+            ValueError: If the inputs are missing, mixed, or invalid
+        """
         # Opening move: validate input exclusivity
         input_count = sum(1 for x in [chords, romans, notes, melody] if x is not None)
         if input_count > 1:
@@ -407,8 +601,34 @@ class UnifiedPatternService:
             sections=sections,
         )
 
-        # Big play: run the unified engine analysis
-        envelope = self.engine.analyze(context)
+        return _PreparedAnalysis(
+            context=context,
+            chords=chords,
+            key_hint=key_hint,
+            profile=profile,
+            mode_label=mode_label,
+            scale_analysis_data=scale_analysis_data,
+            melody_analysis_data=melody_analysis_data,
+        )
+
+    def _apply_modal_parent_key(
+        self, prepared: _PreparedAnalysis, envelope: AnalysisEnvelope
+    ) -> AnalysisEnvelope:
+        """
+        Record the modal parent key and re-analyze clear modal cases in it.
+
+        Args:
+            prepared: Normalized inputs the envelope was analyzed from
+            envelope: Engine envelope for prepared.context
+
+        Returns:
+            The envelope, or the re-analysis in the modal parent key
+        """
+        context = prepared.context
+        chords = prepared.chords
+        key_hint = prepared.key_hint
+        profile = prepared.profile
+        mode_label = prepared.mode_label
 
         # Iteration 9F: Conditional modal parent key conversion (only when
         # modal > functional confidence AND no explicit key hint)
@@ -495,31 +715,53 @@ class UnifiedPatternService:
                             )
                             # Keep original analysis if re-analysis fails
 
-        # Victory lap: apply quality-gated calibration if available
-        if self.calibrator and self.calibration_mapping and envelope.primary:
-            try:
-                # Apply modern calibration with quality gates
-                calibrated_confidence = self.calibration_mapping.apply(
-                    envelope.primary.confidence
-                )
-                envelope.primary.confidence = calibrated_confidence
-                logger.debug(
-                    f"🎯 Applied quality-gated calibration: "
-                    f"{envelope.primary.confidence:.3f}"
-                )
-            except Exception as e:
-                logger.warning(f"⚠️ Quality-gated calibration failed: {e}")
+        return envelope
 
-        # Final enhancement: populate scale/melody summaries if available
+    def _calibrate_envelopes(self, envelopes: List[AnalysisEnvelope]) -> None:
+        """
+        Apply quality-gated calibration to primary confidences in place.
+
+        Args:
+            envelopes: Envelopes whose primary confidence is calibrated
+        """
+        if not (self.calibrator and self.calibration_mapping):
+            return
+
+        primaries = [envelope.primary for envelope in envelopes if envelope.primary]
+        if not primaries:
+            return
+        try:
+            # Apply modern calibration with quality gates in one array call
+            calibrated = self.calibration_mapping.apply_batch(
+                [primary.confidence for primary in primaries]
+            ).tolist()
+            for primary, confidence in zip(primaries, calibrated):
+                primary.confidence = confidence
+            logger.debug(
+                f"🎯 Applied quality-gated calibration to {len(primaries)} analyses"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Quality-gated calibration failed: {e}")
+
+    def _enhance_envelope(
+        self, prepared: _PreparedAnalysis, envelope: AnalysisEnvelope
+    ) -> AnalysisEnvelope:
+        """Populate scale/melody summaries on the primary analysis."""
         if envelope.primary:
             envelope.primary = self._enhance_summary_with_scale_melody(
-                envelope.primary, scale_analysis_data, melody_analysis_data
+                envelope.primary,
+                prepared.scale_analysis_data,
+                prepared.melody_analysis_data,
             )
+        return envelope
 
-        # Victory lap: log telemetry for completed analysis
-        end_time = time.perf_counter()
-        analysis_time_ms = (end_time - start_time) * 1000
-
+    def _log_completion(
+        self,
+        session_id: Optional[str],
+        analysis_time_ms: float,
+        envelope: AnalysisEnvelope,
+    ) -> None:
+        """Log telemetry for a completed analysis."""
         # Log scale/melody summary generation
         if envelope.primary:
             if (
@@ -547,46 +789,24 @@ class UnifiedPatternService:
         # Log completion
         self.telemetry.log_analysis_complete(session_id, analysis_time_ms, envelope)
 
-        return envelope
-
-    def analyze_with_patterns(
-        self,
-        chords: Optional[List[str]] = None,
-        key_hint: Optional[str] = None,
-        profile: str = "classical",
-        options: Optional[Any] = None,
-        romans: Optional[List[str]] = None,
-        notes: Optional[List[str]] = None,
-        melody: Optional[List[str]] = None,
-    ) -> AnalysisEnvelope:
+    def create_incremental_session(
+        self, key: str, profile: str = "classical"
+    ) -> IncrementalAnalysisSession:
         """
-        Synchronous wrapper for analyze_with_patterns_async.
+        Start an incremental analysis session for chords entered one by one.
 
-        This looks odd, but it saves us from async complexity in sync contexts.
-        """
-        import asyncio
+        The session runs the same pattern engine in a fixed key. Global
+        heuristics that need the whole progression (key inference, modal
+        labelling) are not applied.
 
-        # Opening move: check if we're already in an event loop
-        try:
-            asyncio.get_running_loop()
-            # If we're in a loop, we need to run in a thread to avoid blocking
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    self.analyze_with_patterns_async(
-                        chords, key_hint, profile, options, romans, notes, melody
-                    ),
-                )
-                return future.result()
-        except RuntimeError:
-            # No running loop, safe to use asyncio.run
-            return asyncio.run(
-                self.analyze_with_patterns_async(
-                    chords, key_hint, profile, options, romans, notes, melody
-                )
-            )
+        Args:
+            key: Key used for romanization and analysis (e.g., "C major")
+            profile: Romanization/analysis profile
+
+        Returns:
+            IncrementalAnalysisSession sharing this service's engine
+        """
+        return IncrementalAnalysisSession(self.engine, key, profile)
 
     # Additional compatibility methods can be added here as needed
     # These would delegate to the unified engine with appropriate conversions
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the REST backend tests.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def client(tmp_path):
+    """
+    Test client running the app's lifespan, with isolated caches.
+
+    The parse cache lives under tmp_path and the response cache starts
+    empty with default limits, so tests never see each other's entries
+    (or the developer's own cache directory).
+    """
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    from fastapi.testclient import TestClient
+
+    from demo.backend.rest_api import state
+    from demo.backend.rest_api.cache import ResponseCache
+    from demo.backend.rest_api.main import create_app
+    from demo.lib.parse_cache import ParseCache
+
+    with TestClient(create_app()) as client:
+        services = state.get_services()
+        services.parse_cache = ParseCache(str(tmp_path / "parse_cache"))
+        services.response_cache = ResponseCache()
+        yield client
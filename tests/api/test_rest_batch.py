@@ -0,0 +1,61 @@
+"""
+Tests for the streamed NDJSON batch analysis endpoint.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+ITEMS = [
+    {"chords": ["C", "F", "G", "C"], "key": "C major"},
+    {"romans": ["ii", "V", "I"]},  # missing key -> inline 400
+    {"chords": ["Am", "F", "C", "G"], "include_educational": False},
+    {"profile": "pop"},  # no input -> inline 400
+    {"melody": ["E4", "D4", "C4"], "key": "C major"},
+]
+STATUSES = [200, 400, 200, 400, 200]
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_streams_one_line_per_item_with_inline_errors(client):
+    response = client.post("/api/analyze/batch", json={"items": ITEMS})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = {line["index"]: line for line in _lines(response)}
+    assert sorted(lines) == list(range(len(ITEMS)))
+    assert [lines[i]["status"] for i in range(len(ITEMS))] == STATUSES
+    assert "key" in lines[1]["error"].lower()
+    assert "result" not in lines[3]
+
+
+def test_results_match_single_endpoint(client):
+    response = client.post("/api/analyze/batch", json={"items": ITEMS[:1] * 3})
+
+    single = client.post("/api/analyze", json=ITEMS[0]).json()
+    for line in _lines(response):
+        result = line["result"]
+        result["analysis"].pop("analysis_time_ms", None)
+        single["analysis"].pop("analysis_time_ms", None)
+        assert result == single
+
+
+@pytest.mark.parametrize("payload", [{"items": []}, {"items": "C F G"}, {}])
+def test_rejects_malformed_batches(client, payload):
+    assert client.post("/api/analyze/batch", json=payload).status_code == 422
+
+
+def test_batches_larger_than_the_window(client):
+    items = ITEMS * 10
+
+    response = client.post("/api/analyze/batch", json={"items": items})
+
+    lines = sorted(_lines(response), key=lambda line: line["index"])
+    assert [line["index"] for line in lines] == list(range(len(items)))
+    assert [line["status"] for line in lines] == STATUSES * 10
@@ -0,0 +1,135 @@
+"""
+Tests for streamed score uploads and the parse cache behind /api/analyze/file.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import UploadFile  # noqa: E402
+
+from demo.backend.rest_api import routes  # noqa: E402
+from demo.lib import music_file_processing  # noqa: E402
+from demo.lib.parse_cache import ParseCache  # noqa: E402
+
+SCORE = Path(__file__).parent.parent / "data" / "test_files" / "simple_folk_song.mxl"
+
+
+def _upload(client, name="score.mxl", **form):
+    with open(SCORE, "rb") as f:
+        return client.post(
+            "/api/analyze/file", files={"file": (name, f)}, data=form or None
+        )
+
+
+@pytest.mark.skipif(not SCORE.exists(), reason="Test MusicXML file not available")
+def test_reupload_skips_music21(client, monkeypatch):
+    pytest.importorskip("music21")
+    first = _upload(client, run_analysis="true")
+    assert first.status_code == 200
+
+    def fail(*args, **kwargs):
+        raise AssertionError("identical upload was re-parsed")
+
+    monkeypatch.setattr(music_file_processing, "process_score_file", fail)
+    second = _upload(client, run_analysis="true", key_mode_preference="Minor")
+
+    assert second.status_code == 200
+    first, second = first.json(), second.json()
+    assert second["chord_symbols"] == first["chord_symbols"]
+    assert second["key_hint"] == first["key_hint"]
+    assert "Reused cached parse" in second["parsing_logs"]
+    assert second["notation_url"] != first["notation_url"]
+    assert os.path.exists(second["notation_url"])
+    # Analysis options are not part of the cache key: analysis still re-runs
+    assert second["analysis_result"] is not None
+
+
+@pytest.mark.skipif(not SCORE.exists(), reason="Test MusicXML file not available")
+def test_upload_runs_on_the_app_service(client, monkeypatch):
+    pytest.importorskip("music21")
+
+    def fail():
+        raise AssertionError("analysis ran outside the app's service")
+
+    # A failure here is logged, not raised, and leaves analysis_result empty
+    monkeypatch.setattr(music_file_processing, "get_service", fail)
+    response = _upload(client, run_analysis="true")
+
+    assert response.status_code == 200
+    assert response.json()["analysis_result"] is not None
+
+
+def test_save_upload_streams_to_a_private_file():
+    contents = b"<score-partwise/>" * 100_000
+    upload = UploadFile(file=io.BytesIO(contents), filename="../../score.xml")
+
+    paths = [asyncio.run(routes._save_upload(upload)) for _ in range(2)]
+
+    try:
+        (first, digest), (second, _) = paths
+        assert first != second
+        assert os.path.basename(first) == "upload_score.xml"
+        assert digest == hashlib.sha256(contents).hexdigest()
+        with open(first, "rb") as f:
+            assert f.read() == contents
+    finally:
+        for path, _ in paths:
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+
+class TestParseCache:
+    def _processed(self, tmp_path, name):
+        urls = {}
+        for field in ("notation_url", "download_url"):
+            path = tmp_path / f"{name}_{field}.xml"
+            path.write_text(f"<{field}/>")
+            urls[field] = str(path)
+        return {"chord_symbols": ["C", "G"], "parsing_logs": ["parsed"], **urls}
+
+    def test_round_trip_copies_xml_to_fresh_paths(self, tmp_path):
+        cache = ParseCache(str(tmp_path / "cache"))
+        processed = self._processed(tmp_path, "a")
+        key = cache.key("digest", {"add_chordify": True})
+
+        assert cache.put(key, processed)
+        loaded = cache.get(key)
+
+        assert loaded["chord_symbols"] == ["C", "G"]
+        assert loaded["notation_url"] != processed["notation_url"]
+        assert Path(loaded["notation_url"]).read_text() == "<notation_url/>"
+        os.remove(loaded["notation_url"])
+        os.remove(loaded["download_url"])
+
+    def test_options_are_part_of_the_key(self, tmp_path):
+        cache = ParseCache(str(tmp_path))
+
+        assert cache.key("digest", {"auto_window": True}) != cache.key(
+            "digest", {"auto_window": False}
+        )
+        assert cache.get(cache.key("other", {})) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ParseCache(str(tmp_path / "cache"), max_entries=2)
+        for i, key in enumerate("abc"):
+            assert cache.put(key, self._processed(tmp_path, key))
+            os.utime(os.path.join(cache.directory, key), (i, i))
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+
+    def test_skips_failed_exports(self, tmp_path):
+        cache = ParseCache(str(tmp_path / "cache"))
+        processed = self._processed(tmp_path, "a")
+        os.remove(processed["download_url"])
+
+        assert not cache.put("a", processed)
+        assert len(cache) == 0
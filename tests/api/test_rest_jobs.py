@@ -0,0 +1,142 @@
+"""
+Tests for background file-analysis jobs.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from demo.backend.rest_api.jobs import JobQueue, JobQueueFullError  # noqa: E402
+
+SCORE = Path(__file__).parent.parent / "data" / "test_files" / "simple_folk_song.mxl"
+TIMEOUT = 60.0
+
+
+def _wait(get, job_id):
+    deadline = time.monotonic() + TIMEOUT
+    while time.monotonic() < deadline:
+        job = get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(max_workers=1, max_queued=1)
+    yield queue
+    queue.close()
+
+
+class TestJobQueue:
+    def test_result_and_progress(self, queue):
+        reported, proceed = threading.Event(), threading.Event()
+
+        def work(report):
+            report("halfway", 0.5)
+            reported.set()
+            proceed.wait(TIMEOUT)
+            return {"answer": 42}
+
+        job = queue.submit(work)
+        assert job.status == "queued"
+        reported.wait(TIMEOUT)
+        midway = queue.get(job.id).to_dict()
+        proceed.set()
+        done = _wait(lambda i: queue.get(i).to_dict(), job.id)
+
+        assert (midway["status"], midway["stage"]) == ("running", "halfway")
+        assert midway["progress"] == 0.5
+        assert done["status"] == "succeeded" and done["progress"] == 1.0
+        assert done["result"] == {"answer": 42}
+
+    def test_failure_is_reported(self, queue):
+        def work(report):
+            raise ValueError("bad score")
+
+        job = queue.submit(work)
+        done = _wait(lambda i: queue.get(i).to_dict(), job.id)
+
+        assert done["status"] == "failed"
+        assert done["error"] == "bad score"
+        assert "result" not in done
+
+    def test_rejects_when_queue_is_full(self, queue):
+        release = threading.Event()
+        running = queue.submit(lambda report: release.wait(TIMEOUT))
+        while queue.get(running.id).status != "running":
+            time.sleep(0.01)
+        queue.submit(lambda report: None)  # waits for the only worker
+
+        with pytest.raises(JobQueueFullError):
+            queue.submit(lambda report: None)
+        release.set()
+
+    def test_close_fails_queued_jobs_and_runs_cleanup(self, queue):
+        release = threading.Event()
+        running = queue.submit(lambda report: release.wait(TIMEOUT))
+        while queue.get(running.id).status != "running":
+            time.sleep(0.01)
+        ran, cleaned = [], []
+        queued = queue.submit(ran.append, on_cancel=lambda: cleaned.append(True))
+
+        queue.close()
+        release.set()
+
+        job = queue.get(queued.id)
+        assert (job.status, job.error) == (
+            "failed",
+            "Job queue shut down before the job started",
+        )
+        assert cleaned == [True] and ran == []
+        with pytest.raises(JobQueueFullError):
+            queue.submit(lambda report: None)
+
+    def test_finished_jobs_expire(self):
+        now = [0.0]
+        queue = JobQueue(ttl_seconds=10, clock=lambda: now[0])
+        job = queue.submit(lambda report: "done")
+        _wait(lambda i: queue.get(i).to_dict(), job.id)
+
+        now[0] = 9.9
+        assert queue.get(job.id) is not None
+        now[0] = 10.0
+        assert queue.get(job.id) is None
+        queue.close()
+
+
+@pytest.mark.skipif(not SCORE.exists(), reason="Test MusicXML file not available")
+def test_file_job_round_trip(client):
+    pytest.importorskip("music21")
+    with open(SCORE, "rb") as f:
+        response = client.post(
+            "/api/jobs/file",
+            files={"file": ("score.mxl", f)},
+            data={"run_analysis": "true"},
+        )
+
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    assert response.headers["location"] == f"/api/jobs/{job_id}"
+
+    job = _wait(lambda i: client.get(f"/api/jobs/{i}").json(), job_id)
+
+    assert job["status"] == "succeeded", job.get("error")
+    assert job["result"]["chord_symbols"]
+    assert job["result"]["analysis_result"] is not None
+
+
+def test_file_job_rejects_unsupported_files(client):
+    response = client.post("/api/jobs/file", files={"file": ("notes.txt", b"C D E")})
+
+    assert response.status_code == 400
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/api/jobs/nope").status_code == 404
@@ -0,0 +1,144 @@
+"""
+Tests for the REST response cache and ETag revalidation.
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from demo.backend.rest_api.cache import ResponseCache, cache_key  # noqa: E402
+
+PROGRESSION = {"chords": ["C", "G", "Am", "F"], "key": "C major"}
+
+
+def _stats(client):
+    return client.get("/api/cache").json()
+
+
+class TestAnalyzeRoute:
+    def test_repeat_request_is_a_hit(self, client):
+        first = client.post("/api/analyze", json=PROGRESSION)
+        second = client.post("/api/analyze", json=PROGRESSION)
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+        stats = _stats(client)
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_if_none_match_gets_304(self, client):
+        etag = client.post("/api/analyze", json=PROGRESSION).headers["etag"]
+
+        response = client.post(
+            "/api/analyze", json=PROGRESSION, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_gets_full_response(self, client):
+        response = client.post(
+            "/api/analyze", json=PROGRESSION, headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["analysis"]
+
+    def test_equivalent_requests_share_an_entry(self, client):
+        client.post("/api/analyze", json=PROGRESSION)
+        client.post(
+            "/api/analyze",
+            json={"chords": [" C", "G ", "Am", "F"], "key": " C major "},
+        )
+
+        assert _stats(client)["hits"] == 1
+
+    def test_distinct_requests_do_not_collide(self, client):
+        client.post("/api/analyze", json=PROGRESSION)
+        client.post("/api/analyze", json={**PROGRESSION, "profile": "pop"})
+        client.post("/api/analyze", json={**PROGRESSION, "include_educational": False})
+
+        stats = _stats(client)
+        assert (stats["hits"], stats["entries"]) == (0, 3)
+
+    def test_errors_are_not_cached(self, client):
+        for _ in range(2):
+            response = client.post("/api/analyze", json={"romans": ["ii", "V", "I"]})
+            assert response.status_code == 400
+
+        assert _stats(client)["entries"] == 0
+
+    def test_batch_shares_the_cache(self, client):
+        single = client.post("/api/analyze", json=PROGRESSION)
+
+        response = client.post("/api/analyze/batch", json={"items": [PROGRESSION]})
+
+        assert response.json()["result"] == single.json()
+        assert _stats(client)["hits"] == 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl_seconds=10, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") is not None
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+
+    def test_resource_change_invalidates(self):
+        version = ["1"]
+        cache = ResponseCache(version=lambda: version[0])
+        cache.put("a", 1)
+
+        version[0] = "2"
+
+        assert cache.get("a") is None
+        assert cache.stats.invalidations == 1
+        assert len(cache) == 0
+
+    def test_zero_size_disables_storage(self):
+        cache = ResponseCache(max_entries=0)
+
+        entry = cache.put("a", {"x": 1})
+
+        assert entry.body == b'{"x": 1}'
+        assert cache.get("a") is None
+
+    def test_etag_comparison(self):
+        entry = ResponseCache().put("a", [1, 2])
+
+        assert entry.matches(entry.etag)
+        assert entry.matches(f'"other", W/{entry.etag}')
+        assert entry.matches("*")
+        assert not entry.matches(None) and not entry.matches('"other"')
+
+    def test_key_ignores_field_order(self):
+        assert cache_key("analyze", {"a": 1, "b": 2}) == cache_key(
+            "analyze", {"b": 2, "a": 1}
+        )
+        assert cache_key("analyze", {"a": 1}) != cache_key("scale", {"a": 1})
@@ -0,0 +1,50 @@
+"""
+Tests for the REST backend's application-lifetime services.
+
+The analysis service must be built and warmed once at startup, shared by
+every request, reported by the readiness probe and shut down with the app.
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from demo.backend.rest_api import routes, state  # noqa: E402
+from demo.backend.rest_api.main import create_app  # noqa: E402
+
+
+def test_services_are_warm_before_first_request(client):
+    response = client.get("/api/ready")
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["ready"] is True
+    assert report["warmup_ms"] > 0 and report["build_ms"] > 0
+
+
+def test_requests_share_one_service(client, monkeypatch):
+    def fail():
+        raise AssertionError("service rebuilt per request")
+
+    monkeypatch.setattr(state, "build_services", fail)
+    service = routes.get_service()
+
+    for chords in (["C", "F", "G", "C"], ["Am", "F", "C", "G"]):
+        response = client.post("/api/analyze", json={"chords": chords})
+        assert response.status_code == 200
+
+    assert routes.get_service() is service
+    assert routes.get_glossary_provider() is state.get_services().glossary
+
+
+def test_not_ready_outside_lifespan():
+    app = create_app()
+    state.stop_services()
+
+    response = TestClient(app).get("/api/ready")
+
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
@@ -16,6 +16,22 @@ def pytest_configure(config: pytest.Config) -> None:
     )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def resource_cache_dir(tmp_path_factory):
+    """
+    Keep the resource bundle cache inside the test session's temp area.
+
+    Without this, any test that loads patterns writes the compiled bundle to
+    ~/.cache/harmonic_analysis on the developer's (or CI's) machine.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(
+            "HARMONIC_ANALYSIS_CACHE_DIR",
+            str(tmp_path_factory.mktemp("resource_cache")),
+        )
+        yield
+
+
 # Check if educational features are available
 try:
     from harmonic_analysis.educational import is_available
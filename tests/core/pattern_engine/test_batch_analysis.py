@@ -0,0 +1,170 @@
+"""
+Tests for batch analysis.
+
+PatternEngine.analyze_batch() and the vectorized aggregation/calibration
+behind it must reproduce one-at-a-time results exactly, in input order.
+"""
+
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from harmonic_analysis.core.pattern_engine.aggregator import Aggregator
+from harmonic_analysis.core.pattern_engine.calibration import (
+    CalibrationMapping,
+    CalibrationMetrics,
+)
+from harmonic_analysis.core.pattern_engine.evidence import Evidence
+from harmonic_analysis.core.pattern_engine.pattern_engine import (
+    AnalysisContext,
+    PatternEngine,
+)
+from harmonic_analysis.core.pattern_engine.token_converter import romanize_chord
+
+PATTERNS_PATH = (
+    Path(__file__).parents[3]
+    / "src"
+    / "harmonic_analysis"
+    / "resources"
+    / "patterns"
+    / "patterns_unified.json"
+)
+
+CHORDS = ["C", "Dm", "Em", "F", "G", "G7", "Am", "Bdim", "Bb", "Ab", "D7", "E7"]
+METRICS = CalibrationMetrics(
+    ece=0.0, brier=0.0, correlation=1.0, variance=1.0, sample_count=100
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = PatternEngine()
+    engine.load_patterns(PATTERNS_PATH)
+    return engine
+
+
+def _contexts(count, seed=0):
+    rng = random.Random(seed)
+    contexts = []
+    for _ in range(count):
+        chords = [rng.choice(CHORDS) for _ in range(rng.randint(0, 10))]
+        romans = [
+            romanize_chord(chord, "C major", "classical").replace("b", "♭")
+            for chord in chords
+        ]
+        contexts.append(
+            AnalysisContext(
+                key="C major",
+                chords=chords,
+                roman_numerals=romans,
+                melody=[],
+                scales=[],
+                metadata={},
+            )
+        )
+    return contexts
+
+
+def _comparable(envelope):
+    data = envelope.to_dict()
+    data.pop("analysis_time_ms", None)
+    return data
+
+
+def _random_evidence(rng, count):
+    evidences = []
+    for _ in range(count):
+        start = rng.randrange(8)
+        tracks = rng.sample(["functional", "modal", "chromatic"], rng.randint(1, 2))
+        evidences.append(
+            Evidence(
+                pattern_id=f"{rng.choice(['cadence', 'modal', 'seq'])}.p{start}",
+                track_weights={track: rng.random() for track in tracks},
+                features={},
+                raw_score=rng.random(),
+                uncertainty=None,
+                span=(start, start + rng.randint(1, 3)),
+            )
+        )
+    return evidences
+
+
+class TestEngineBatch:
+    """analyze_batch() matches analyze() item by item."""
+
+    def test_batch_matches_single_analysis(self, engine):
+        contexts = _contexts(120)
+
+        envelopes = engine.analyze_batch(contexts)
+
+        assert [_comparable(e) for e in envelopes] == [
+            _comparable(engine.analyze(context)) for context in contexts
+        ]
+
+    def test_batch_applies_calibration(self):
+        engine = PatternEngine()
+        engine.load_patterns(PATTERNS_PATH)
+        engine._calibration_mapping = CalibrationMapping(
+            mapping_type="platt",
+            params={"A": 4.0, "B": -2.0},
+            metrics=METRICS,
+            passed_gates=True,
+        )
+        contexts = _contexts(30, seed=3)
+
+        envelopes = engine.analyze_batch(contexts)
+
+        assert [_comparable(e) for e in envelopes] == [
+            _comparable(engine.analyze(context)) for context in contexts
+        ]
+
+    def test_empty_batch(self, engine):
+        assert engine.analyze_batch([]) == []
+
+
+class TestAggregateBatch:
+    """Vectorized aggregation equals per-list aggregation."""
+
+    @pytest.mark.parametrize("strategy", ["soft_nms", "max_pool", "none"])
+    def test_matches_aggregate(self, strategy):
+        rng = random.Random(4)
+        aggregator = Aggregator(conflict_strategy=strategy)
+        lists = [_random_evidence(rng, rng.randint(0, 12)) for _ in range(50)]
+
+        assert aggregator.aggregate_batch(lists) == [
+            aggregator.aggregate(evidences) for evidences in lists
+        ]
+
+
+class TestCalibrationBatch:
+    """apply_batch() agrees with apply()."""
+
+    @pytest.mark.parametrize(
+        "mapping_type, params, passed",
+        [
+            ("identity", {}, True),
+            ("platt", {"A": 3.0, "B": -1.5}, True),
+            ("platt", {"A": 3.0, "B": -1.5}, False),
+            ("isotonic", {"X": [0.0, 0.5, 1.0], "Y": [0.1, 0.4, 0.9]}, True),
+            ("isotonic", {}, True),
+        ],
+    )
+    def test_matches_scalar_apply(self, mapping_type, params, passed):
+        mapping = CalibrationMapping(
+            mapping_type=mapping_type,
+            params=params,
+            metrics=METRICS,
+            passed_gates=passed,
+        )
+        values = np.linspace(0.0, 1.0, 21).reshape(3, 7)
+
+        calibrated = mapping.apply_batch(values)
+
+        assert calibrated.shape == values.shape
+        np.testing.assert_allclose(
+            calibrated,
+            [[mapping.apply(x) for x in row] for row in values.tolist()],
+            rtol=1e-12,
+        )
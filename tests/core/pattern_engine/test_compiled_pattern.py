@@ -0,0 +1,277 @@
+"""
+Tests for compiled pattern representation.
+
+PatternLoader compiles patterns once; the engine must produce the same
+matches from compiled patterns as from the raw JSON definitions.
+"""
+
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from harmonic_analysis.core.pattern_engine.compiled_pattern import (
+    SCOPE_HARMONIC,
+    SCOPE_MELODIC,
+    CompiledPattern,
+    CompiledPatternSet,
+    compile_pattern,
+)
+from harmonic_analysis.core.pattern_engine.evidence import Evidence
+from harmonic_analysis.core.pattern_engine.pattern_engine import (
+    AnalysisContext,
+    PatternEngine,
+)
+from harmonic_analysis.core.pattern_engine.pattern_loader import PatternLoader
+from harmonic_analysis.core.pattern_engine.plugin_registry import PluginRegistry
+from harmonic_analysis.core.pattern_engine.roman_numeral import (
+    normalize_roman_for_matching,
+    roman_match_key,
+)
+from harmonic_analysis.core.pattern_engine.sequence_scanner import LITERAL, REGEX
+
+PATTERNS_PATH = (
+    Path(__file__).parents[3]
+    / "src"
+    / "harmonic_analysis"
+    / "resources"
+    / "patterns"
+    / "patterns_unified.json"
+)
+
+
+def _pattern(**overrides):
+    pattern = {
+        "id": "test.cadence",
+        "name": "Test cadence",
+        "scope": ["harmonic"],
+        "track": ["functional"],
+        "matchers": {"roman_seq": ["V7", "I"]},
+        "evidence": {"weight": 0.8, "confidence_fn": "identity"},
+        "metadata": {"tags": ["Cadence", "Final"]},
+    }
+    pattern.update(overrides)
+    return pattern
+
+
+def _context(romans, key="C major", melody=None):
+    return AnalysisContext(
+        key=key,
+        chords=["C"] * len(romans),
+        roman_numerals=romans,
+        melody=melody or [],
+        scales=[],
+        metadata={},
+    )
+
+
+class TestCompilePattern:
+    """Single pattern compilation."""
+
+    def test_tokens_are_pre_normalized(self):
+        compiled = compile_pattern(_pattern(), 0, PluginRegistry())
+
+        (sequence,) = compiled.sequences
+        assert sequence.kind == "roman_seq"
+        assert [token.key for token in sequence.tokens] == [
+            roman_match_key("V"),
+            roman_match_key("I"),
+        ]
+        assert all(token.kind == LITERAL for token in sequence.tokens)
+
+    def test_regex_items_are_precompiled(self):
+        pattern = _pattern(matchers={"chord_seq": ["V/.*", ".*"]})
+        compiled = compile_pattern(pattern, 0)
+
+        token = compiled.sequences[0].tokens[0]
+        assert token.kind == REGEX
+        assert token.regex is not None and token.regex.match("v/ii")
+
+    def test_scope_bitmask(self):
+        compiled = compile_pattern(_pattern(scope=["harmonic", "melodic"]), 0)
+
+        assert compiled.scope_mask == SCOPE_HARMONIC | SCOPE_MELODIC
+        assert compiled.applies_to(SCOPE_HARMONIC | SCOPE_MELODIC)
+        assert not compiled.applies_to(SCOPE_HARMONIC)
+
+    def test_window_and_constraints_resolved(self):
+        pattern = _pattern(
+            matchers={
+                "roman_seq": ["V", "I"],
+                "window": {"min": 3, "overlap_ok": False},
+                "constraints": {"position": "end", "unknown": True},
+            }
+        )
+        compiled = compile_pattern(pattern, 0)
+
+        assert compiled.sequences[0].in_window is False
+        assert compiled.overlap_ok is False
+        assert len(compiled.constraints) == 1
+
+    def test_evaluator_resolution_falls_back_to_identity(self):
+        plugins = PluginRegistry()
+        pattern = _pattern(evidence={"weight": 0.5, "confidence_fn": "missing"})
+
+        compiled = compile_pattern(pattern, 0, plugins)
+
+        assert compiled.evaluator is plugins.get("identity")
+
+    def test_source_and_tags_are_read_only(self):
+        compiled = compile_pattern(_pattern(), 0)
+
+        assert isinstance(compiled.source, MappingProxyType)
+        assert compiled.tags == frozenset({"cadence", "final"})
+        with pytest.raises(TypeError):
+            compiled.source["id"] = "changed"  # type: ignore[index]
+
+    def test_normalizer_matches_engine(self):
+        engine = PatternEngine()
+        for roman in ["V7", "V/vi", "bVII", "Imaj7", "viiø7", "IVadd9", " ii "]:
+            assert normalize_roman_for_matching(
+                roman
+            ) == engine._normalize_roman_for_matching(roman)
+
+
+class TestPatternLoaderCompile:
+    """Library compilation through the loader."""
+
+    def test_load_compiled_library(self):
+        loader = PatternLoader()
+        data = loader.load(PATTERNS_PATH)
+
+        compiled = loader.load_compiled(PATTERNS_PATH, PluginRegistry())
+
+        assert isinstance(compiled, CompiledPatternSet)
+        assert len(compiled) == len(data["patterns"])
+        assert [p.id for p in compiled] == [p["id"] for p in data["patterns"]]
+        assert all(isinstance(p, CompiledPattern) for p in compiled)
+        assert all(p.evaluator is not None for p in compiled)
+
+    def test_by_id_keeps_first_duplicate(self):
+        data = {
+            "version": 1,
+            "patterns": [_pattern(name="first"), _pattern(name="second")],
+        }
+
+        compiled = PatternLoader().compile(data)
+
+        assert compiled.get("test.cadence").name == "first"
+        assert compiled.get("missing") is None
+
+
+class TestEngineCompiledPatterns:
+    """Engine integration with compiled patterns."""
+
+    def test_raw_and_compiled_patterns_agree(self):
+        engine = PatternEngine()
+        engine.load_patterns(PATTERNS_PATH)
+        context = _context(["ii", "V7", "I", "IV", "V", "I", "vi", "IV", "V", "I"])
+
+        for raw, compiled in zip(
+            engine._patterns["patterns"], engine.compiled_patterns
+        ):
+            assert engine._find_pattern_matches(
+                raw, context
+            ) == engine._find_pattern_matches(compiled, context)
+
+    def test_reassigned_patterns_are_recompiled(self):
+        engine = PatternEngine()
+        engine.set_patterns({"version": 1, "patterns": [_pattern()]})
+        assert [p.id for p in engine.compiled_patterns] == ["test.cadence"]
+
+        engine._patterns = {"patterns": [_pattern(id="other.cadence")]}
+
+        assert [p.id for p in engine.compiled_patterns] == ["other.cadence"]
+        assert engine._find_pattern_by_id("other.cadence")["name"] == "Test cadence"
+
+    def test_registering_plugin_recompiles(self):
+        engine = PatternEngine()
+        pattern = _pattern(evidence={"weight": 0.5, "confidence_fn": "custom"})
+        engine.set_patterns({"version": 1, "patterns": [pattern]})
+
+        def custom(pattern, context):
+            return Evidence(
+                pattern_id=pattern["id"],
+                track_weights={"functional": 0.9},
+                features={},
+                raw_score=0.9,
+                uncertainty=None,
+                span=tuple(context["span"]),
+            )
+
+        engine.plugins.register("custom", custom)
+        evidences = engine._match_patterns(_context(["V7", "I"]))
+
+        assert [e.raw_score for e in evidences] == [0.9]
+
+
+class TestTokenPrefilter:
+    """Patterns needing absent tokens are rejected before matching."""
+
+    @staticmethod
+    def _compiled(*patterns):
+        return PatternLoader().compile({"version": 1, "patterns": list(patterns)})
+
+    @staticmethod
+    def _mask(compiled, context):
+        engine = PatternEngine()
+        return compiled.context_token_mask(
+            engine._build_context_sequences(context, compiled.scanner.kinds)
+        )
+
+    def test_required_tokens_must_be_present(self):
+        compiled = self._compiled(
+            _pattern(id="a", matchers={"roman_seq": ["♭VII", "I"]}),
+            _pattern(id="b", matchers={"roman_seq": ["V7", "I"]}),
+        )
+        mask = self._mask(compiled, _context(["ii", "V", "I"]))
+
+        assert [p.admits(mask) for p in compiled] == [False, True]
+
+    def test_wildcard_and_regex_items_require_nothing(self):
+        compiled = self._compiled(
+            _pattern(id="a", matchers={"roman_seq": ["*", "V.*"]}),
+        )
+        (pattern,) = compiled
+
+        assert pattern.sequences[0].required_mask == 0
+        assert pattern.admits(self._mask(compiled, _context(["I"])))
+
+    def test_any_sequence_kind_can_admit(self):
+        compiled = self._compiled(
+            _pattern(matchers={"roman_seq": ["♭II", "I"], "chord_seq": ["G", "C"]}),
+        )
+        (pattern,) = compiled
+        context = AnalysisContext(
+            key="C major",
+            chords=["G", "C"],
+            roman_numerals=["V", "I"],
+            melody=[],
+            scales=[],
+            metadata={},
+        )
+
+        assert pattern.admits(self._mask(compiled, context))
+
+    def test_engine_counts_pruned_patterns(self):
+        engine = PatternEngine()
+        engine.load_patterns(PATTERNS_PATH)
+        total = len(engine.compiled_patterns)
+
+        engine._match_patterns(_context(["I", "IV", "V", "I"]))
+        stats = engine.prefilter_stats
+
+        assert stats.contexts == 1
+        assert stats.patterns_considered == total
+        assert stats.pruned_by_scope > 0  # melodic/scale patterns without input
+        assert stats.pruned_by_tokens > 0  # e.g. patterns requiring ♭VII
+        assert stats.to_dict()["pruned"] == stats.pruned < total
+
+        stats.reset()
+        assert stats.to_dict() == {
+            "contexts": 0,
+            "patterns_considered": 0,
+            "pruned_by_scope": 0,
+            "pruned_by_tokens": 0,
+            "pruned": 0,
+        }
@@ -0,0 +1,110 @@
+"""
+Tests for per-context derived-feature caching.
+
+Melodic intervals, scale degrees and the normalized mode are computed once
+per AnalysisContext and shared by every pattern that needs them.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from harmonic_analysis.core.pattern_engine.pattern_engine import (
+    AnalysisContext,
+    PatternEngine,
+)
+
+PATTERNS_PATH = (
+    Path(__file__).parents[3]
+    / "src"
+    / "harmonic_analysis"
+    / "resources"
+    / "patterns"
+    / "patterns_unified.json"
+)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = PatternEngine()
+    engine.load_patterns(PATTERNS_PATH)
+    return engine
+
+
+def _context(**overrides):
+    values = dict(
+        key="C major",
+        chords=["C", "F", "G7", "C"],
+        roman_numerals=["I", "IV", "V7", "I"],
+        melody=["E", "F", "D", "B", "C"],
+        scales=[],
+        metadata={},
+    )
+    values.update(overrides)
+    return AnalysisContext(**values)
+
+
+def _count_calls(monkeypatch, engine, name):
+    calls = []
+    original = getattr(engine, name)
+
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(engine, name, spy)
+    return calls
+
+
+class TestDerivedFeatures:
+    """Derived sequences are extracted once per context."""
+
+    @pytest.mark.parametrize(
+        "extractor", ["_extract_melodic_intervals", "_extract_scale_degrees"]
+    )
+    def test_extractors_run_once_per_context(self, engine, monkeypatch, extractor):
+        calls = _count_calls(monkeypatch, engine, extractor)
+        context = _context()
+
+        engine.analyze(context)
+        for pattern in engine.compiled_patterns:
+            engine._find_pattern_matches(pattern, context)
+
+        assert len(calls) == 1
+
+    def test_mode_is_normalized_once(self, engine, monkeypatch):
+        calls = _count_calls(monkeypatch, engine, "_detect_context_mode")
+        context = _context(key="D dorian")
+
+        assert engine._check_mode_constraint(context, "Dorian")
+        assert not engine._check_mode_constraint(context, "ionian")
+        assert len(calls) == 1
+
+    def test_cached_results_match_fresh_contexts(self, engine):
+        context = _context()
+        engine.analyze(context)
+
+        for pattern in engine.compiled_patterns:
+            assert engine._find_pattern_matches(
+                pattern, context
+            ) == engine._find_pattern_matches(pattern, _context())
+
+    def test_clear_derived_picks_up_mutations(self, engine):
+        context = _context(melody=["C", "D"])
+        assert engine._build_context_sequences(context, ["interval_seq"]) == {
+            "interval_seq": (["2"], ["2"])
+        }
+
+        context.melody.append("C")
+        context.clear_derived()
+
+        assert engine._build_context_sequences(context, ["interval_seq"]) == {
+            "interval_seq": (["2", "-2"], ["2", "-2"])
+        }
+
+    def test_cache_is_not_part_of_equality(self, engine):
+        context = _context()
+        engine.analyze(context)
+
+        assert context == _context()
+        assert "_derived" not in repr(context)
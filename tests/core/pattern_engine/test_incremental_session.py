@@ -0,0 +1,241 @@
+"""
+Tests for incremental analysis sessions.
+
+Appending chords one at a time must give the same envelope as analyzing the
+accumulated progression in one pass, and the running aggregation state must
+agree with the batch aggregator.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from harmonic_analysis.core.pattern_engine.aggregator import (
+    AggregationState,
+    Aggregator,
+)
+from harmonic_analysis.core.pattern_engine.evidence import Evidence
+from harmonic_analysis.core.pattern_engine.incremental_session import (
+    IncrementalAnalysisSession,
+)
+from harmonic_analysis.core.pattern_engine.pattern_engine import PatternEngine
+
+PATTERNS_PATH = (
+    Path(__file__).parents[3]
+    / "src"
+    / "harmonic_analysis"
+    / "resources"
+    / "patterns"
+    / "patterns_unified.json"
+)
+
+CHORDS = ["C", "Dm", "Em", "F", "G", "G7", "Am", "Bdim", "Bb", "Ab", "D7", "E7"]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = PatternEngine()
+    engine.load_patterns(PATTERNS_PATH)
+    return engine
+
+
+def _comparable(envelope):
+    data = envelope.to_dict()
+    data.pop("analysis_time_ms", None)
+    return data
+
+
+def _evidence(pattern_id, span, score):
+    return Evidence(
+        pattern_id=pattern_id,
+        track_weights={"functional": score},
+        features={},
+        raw_score=score,
+        uncertainty=None,
+        span=span,
+    )
+
+
+class TestIncrementalAnalysisSession:
+    """Session envelopes match single-pass analysis."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_append_matches_full_analysis(self, engine, seed):
+        rng = random.Random(seed)
+        session = IncrementalAnalysisSession(engine, "C major")
+
+        for _ in range(16):
+            envelope = session.append(rng.choice(CHORDS))
+
+            assert _comparable(envelope) == _comparable(
+                engine.analyze(session.context())
+            )
+
+    def test_extend_matches_repeated_append(self, engine):
+        progression = ["C", "Am", "F", "G7", "C", "Dm", "G", "C"]
+        appended = IncrementalAnalysisSession(engine, "C major")
+        for chord in progression:
+            appended.append(chord)
+
+        extended = IncrementalAnalysisSession(engine, "C major")
+        envelope = extended.extend(progression)
+
+        assert extended.roman_numerals == appended.roman_numerals
+        assert _comparable(envelope) == _comparable(appended.snapshot())
+
+    def test_end_anchored_matches_move_with_the_end(self):
+        engine = PatternEngine()
+        final = {
+            "id": "test.final_cadence",
+            "name": "Final cadence",
+            "scope": ["harmonic"],
+            "track": ["functional"],
+            "matchers": {"roman_seq": ["V", "I"], "constraints": {"position": "end"}},
+            "evidence": {"weight": 0.8, "confidence_fn": "identity"},
+        }
+        engine.set_patterns({"version": 1, "patterns": [final]})
+        session = IncrementalAnalysisSession(engine, "C major")
+
+        session.extend(["F", "G", "C"])
+        assert session.evidence_count == 1
+
+        envelope = session.append("Am")
+        assert session.evidence_count == 0
+        assert _comparable(envelope) == _comparable(engine.analyze(session.context()))
+
+        session.extend(["G", "C"])
+        assert [e.details["span"] for e in session.snapshot().evidence] == [[4, 6]]
+
+    def test_explicit_romans_are_used(self, engine):
+        session = IncrementalAnalysisSession(engine, "C major")
+
+        session.append("G7", roman="V7")
+        session.append("C", roman="I")
+
+        assert session.roman_numerals == ["V7", "I"]
+        assert len(session) == 2
+        assert session.evidence_count > 0
+
+    def test_key_is_required(self, engine):
+        with pytest.raises(ValueError):
+            IncrementalAnalysisSession(engine, "")
+
+
+class TestEdits:
+    """Edits re-analyze only around the edited chord."""
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_edits_match_full_analysis(self, engine, seed):
+        rng = random.Random(seed)
+        session = IncrementalAnalysisSession(engine, "C major")
+        session.extend([rng.choice(CHORDS) for _ in range(12)])
+
+        for _ in range(12):
+            operation = rng.choice(["replace", "insert", "delete"])
+            index = rng.randrange(len(session) + (operation == "insert"))
+            if operation == "replace":
+                envelope, _ = session.edit(
+                    index, session.chords[index], rng.choice(CHORDS)
+                )
+            elif operation == "insert":
+                envelope, _ = session.edit(index, None, rng.choice(CHORDS))
+            else:
+                envelope, _ = session.edit(index, session.chords[index], None)
+
+            assert _comparable(envelope) == _comparable(
+                engine.analyze(session.context())
+            )
+
+    def test_diff_reports_changed_evidence_only(self, engine):
+        session = IncrementalAnalysisSession(engine, "C major")
+        session.extend(["C", "F", "G", "C", "Am", "Dm", "G", "C"])
+        before = {
+            (e.reason, tuple(e.details["span"])) for e in session.snapshot().evidence
+        }
+
+        _, unchanged = session.edit(5, "Dm", "Dm")
+        envelope, diff = session.edit(2, "G", "Bb")
+
+        after = {(e.reason, tuple(e.details["span"])) for e in envelope.evidence}
+        assert not unchanged
+        assert diff
+        assert {(e.reason, tuple(e.details["span"])) for e in diff.added} == (
+            after - before
+        )
+        assert {(e.reason, tuple(e.details["span"])) for e in diff.removed} == (
+            before - after
+        )
+
+    def test_insert_shifts_later_evidence(self, engine):
+        session = IncrementalAnalysisSession(engine, "C major")
+        session.extend(["C", "F", "G7", "C"])
+        before = {
+            (e.reason, e.details["span"][0] + 1, e.details["span"][1] + 1)
+            for e in session.snapshot().evidence
+        }
+
+        envelope, diff = session.edit(0, None, "Am")
+
+        after = {
+            (e.reason, e.details["span"][0], e.details["span"][1])
+            for e in envelope.evidence
+        }
+        assert session.chords == ["Am", "C", "F", "G7", "C"]
+        assert before <= after
+        assert not diff.removed
+        assert all(e.details["span"][0] == 0 for e in diff.added)
+
+    @pytest.mark.parametrize(
+        "index, old, new",
+        [(0, "G", "C"), (5, None, "C"), (4, "C", None), (0, None, None)],
+    )
+    def test_invalid_edits_rejected(self, engine, index, old, new):
+        session = IncrementalAnalysisSession(engine, "C major")
+        session.extend(["C", "F", "G", "C"])
+
+        with pytest.raises(ValueError):
+            session.edit(index, old, new)
+
+
+class TestAggregationState:
+    """Running soft-NMS matches batch aggregation."""
+
+    def test_random_adds_and_removes_match_batch(self):
+        rng = random.Random(7)
+        aggregator = Aggregator()
+        state = AggregationState(aggregator)
+
+        for _ in range(60):
+            if len(state) and rng.random() < 0.3:
+                state.remove(rng.choice(state.keys()))
+            else:
+                start = rng.randrange(12)
+                key = (rng.randrange(20), 0, start)
+                if key in state:
+                    continue
+                span = (start, start + rng.randint(1, 4))
+                state.add(key, _evidence(f"p{key[0]}", span, rng.random()))
+
+            assert state.result() == aggregator.aggregate(state.evidences)
+
+    def test_relocate_keeps_decay(self):
+        aggregator = Aggregator()
+        state = AggregationState(aggregator)
+        state.add((0, 0, 0), _evidence("a", (0, 2), 0.9))
+        state.add((1, 0, 1), _evidence("b", (1, 3), 0.7))
+        state.add((1, 0, 4), _evidence("b", (4, 6), 0.6))
+
+        state.relocate({(1, 0, 4): ((1, 0, 5), _evidence("b", (5, 7), 0.6))})
+
+        assert state.keys() == [(0, 0, 0), (1, 0, 1), (1, 0, 5)]
+        assert state.result() == aggregator.aggregate(state.evidences)
+
+    def test_duplicate_key_rejected(self):
+        state = AggregationState(Aggregator())
+        state.add((0, 0, 0), _evidence("p", (0, 2), 0.5))
+
+        with pytest.raises(ValueError):
+            state.add((0, 0, 0), _evidence("p", (0, 2), 0.6))
+        with pytest.raises(KeyError):
+            state.remove((1, 0, 0))
@@ -0,0 +1,176 @@
+"""
+Tests for long-form (chunked) analysis.
+
+Chunked matching, the indexed soft-NMS pass and bisected section lookups
+must reproduce single-pass results exactly.
+"""
+
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from harmonic_analysis.core.pattern_engine import pattern_engine as engine_module
+from harmonic_analysis.core.pattern_engine.aggregator import Aggregator
+from harmonic_analysis.core.pattern_engine.evidence import Evidence
+from harmonic_analysis.core.pattern_engine.pattern_engine import (
+    AnalysisContext,
+    PatternEngine,
+)
+from harmonic_analysis.dto import SectionDTO
+
+PATTERNS_PATH = (
+    Path(__file__).parents[3]
+    / "src"
+    / "harmonic_analysis"
+    / "resources"
+    / "patterns"
+    / "patterns_unified.json"
+)
+
+ROMANS = ["I", "ii", "IV", "V", "V7", "vi", "vii°", "♭VII", "♭VI", "V/V", "V7/vi"]
+CHORDS = ["C", "Dm", "F", "G", "G7", "Am", "Bdim", "Bb", "Ab", "D", "E7"]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = PatternEngine()
+    engine.load_patterns(PATTERNS_PATH)
+    return engine
+
+
+def _context(length, seed=0, section_size=16):
+    rng = random.Random(seed)
+    picks = [rng.randrange(len(ROMANS)) for _ in range(length)]
+    sections = [
+        SectionDTO(id=str(i), start=start, end=min(start + section_size, length))
+        for i, start in enumerate(range(0, length, section_size))
+    ]
+    return AnalysisContext(
+        key="C major",
+        chords=[CHORDS[i] for i in picks],
+        roman_numerals=[ROMANS[i] for i in picks],
+        melody=[],
+        scales=[],
+        metadata={},
+        sections=sections,
+    )
+
+
+def _comparable(envelope):
+    data = envelope.to_dict()
+    data.pop("analysis_time_ms", None)
+    return data
+
+
+class TestChunkedAnalysis:
+    """analyze_long() matches analyze()."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 8, 50, None])
+    def test_chunks_match_single_pass(self, engine, chunk_size):
+        context = _context(300, seed=chunk_size or 0)
+
+        assert _comparable(engine.analyze_long(context, chunk_size)) == _comparable(
+            engine.analyze(context)
+        )
+
+    def test_chunked_evidence_is_identical(self, engine):
+        context = _context(500, seed=11)
+
+        chunked = engine._match_patterns_chunked(context, chunk_size=7)
+
+        assert chunked == engine._match_patterns(context)
+
+    def test_long_input_switches_to_chunked_mode(self, engine, monkeypatch):
+        context = _context(40)
+        calls = []
+        original = engine._match_patterns_chunked
+
+        def spy(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(engine_module, "LONG_FORM_THRESHOLD", 32)
+        monkeypatch.setattr(engine, "_match_patterns_chunked", spy)
+
+        engine.analyze(context)
+
+        assert len(calls) == 1
+
+    def test_max_window_bounds_every_match(self, engine):
+        window = engine.compiled_patterns.max_window
+        evidences = engine._match_patterns(_context(200, seed=5))
+
+        assert window > 0
+        assert all(e.span[1] - e.span[0] <= window for e in evidences)
+
+
+class TestSectionLocator:
+    """Section lookups keep first-listed-section semantics."""
+
+    def test_disjoint_sections_bisected(self):
+        sections = [
+            SectionDTO(id="B", start=8, end=16),
+            SectionDTO(id="A", start=0, end=8),
+            SectionDTO(id="C", start=20, end=24),
+        ]
+        locate = PatternEngine._section_locator(sections)
+
+        assert [getattr(locate(i), "id", None) for i in (0, 7, 8, 17, 23, 24)] == [
+            "A",
+            "A",
+            "B",
+            None,
+            "C",
+            None,
+        ]
+
+    def test_overlapping_sections_prefer_first_listed(self):
+        sections = [
+            SectionDTO(id="verse", start=4, end=12),
+            SectionDTO(id="whole", start=0, end=16),
+        ]
+        locate = PatternEngine._section_locator(sections)
+
+        assert locate(2).id == "whole"
+        assert locate(6).id == "verse"
+
+
+def _reference_soft_nms(aggregator, evidences):
+    """The original quadratic soft-NMS pass."""
+    ranked = sorted(evidences, key=lambda e: e.raw_score, reverse=True)
+    processed = []
+    for i, evidence in enumerate(ranked):
+        decay = 1.0
+        for j in range(i):
+            if ranked[j].overlaps(evidence):
+                diff = ranked[j].raw_score - evidence.raw_score
+                decay *= 1.0 - aggregator.overlap_decay * np.exp(-diff)
+        if decay > 0.1:
+            processed.append((evidence.pattern_id, evidence.raw_score * decay))
+    return processed
+
+
+def test_indexed_soft_nms_matches_quadratic_reference():
+    rng = random.Random(2)
+    aggregator = Aggregator()
+    evidences = []
+    for i in range(400):
+        start = rng.randrange(200)
+        evidences.append(
+            Evidence(
+                pattern_id=f"p{i}",
+                track_weights={"functional": 0.5},
+                features={},
+                raw_score=round(rng.random(), 2),
+                uncertainty=None,
+                span=(start, start + rng.randint(0, 6)),
+            )
+        )
+
+    resolved = aggregator._soft_nms_conflicts(evidences)
+
+    assert [(e.pattern_id, e.raw_score) for e in resolved] == _reference_soft_nms(
+        aggregator, evidences
+    )
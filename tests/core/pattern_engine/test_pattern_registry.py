@@ -0,0 +1,112 @@
+"""
+Tests for the process-wide pattern registry.
+
+Pattern files are validated and compiled once per content hash, and every
+engine shares the same frozen data, compiled patterns and glossary.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from harmonic_analysis.core.pattern_engine.glossary_provider import GlossaryProvider
+from harmonic_analysis.core.pattern_engine.pattern_engine import PatternEngine
+from harmonic_analysis.core.pattern_engine.pattern_loader import PatternLoader
+from harmonic_analysis.core.pattern_engine.pattern_registry import (
+    PatternRegistry,
+    get_pattern_registry,
+)
+
+PATTERNS_PATH = (
+    Path(__file__).parents[3]
+    / "src"
+    / "harmonic_analysis"
+    / "resources"
+    / "patterns"
+    / "patterns_unified.json"
+)
+
+
+def test_engines_share_frozen_patterns_and_compiled_set():
+    first = PatternEngine()
+    first.load_patterns(PATTERNS_PATH)
+    second = PatternEngine()
+    second.load_patterns(PATTERNS_PATH)
+
+    assert first._patterns is second._patterns
+    assert first.compiled_patterns is second.compiled_patterns
+    with pytest.raises(TypeError):
+        first._patterns["patterns"] = []  # type: ignore[index]
+
+
+def test_engines_share_read_only_glossary():
+    first = PatternEngine()
+    second = PatternEngine()
+
+    assert first._glossary is second._glossary
+    assert GlossaryProvider().glossary is first._glossary
+    with pytest.raises(TypeError):
+        first._glossary["terms"] = {}  # type: ignore[index]
+
+
+def test_registry_reloads_when_file_content_changes(tmp_path):
+    registry = PatternRegistry()
+    path = tmp_path / "patterns.json"
+    shutil.copy(PATTERNS_PATH, path)
+
+    original = registry.load(path)
+    assert registry.load(path) is original
+
+    data = json.loads(path.read_text())
+    data["patterns"] = data["patterns"][:1]
+    path.write_text(json.dumps(data))
+
+    reloaded = registry.load(path)
+    assert reloaded is not original
+    assert reloaded.digest != original.digest
+    assert len(reloaded.compiled) == 1
+
+
+def test_registry_rejects_invalid_file(tmp_path):
+    path = tmp_path / "patterns.json"
+    path.write_text(json.dumps({"version": 1}))
+
+    with pytest.raises(ValueError):
+        PatternRegistry().load(path)
+    with pytest.raises(FileNotFoundError):
+        PatternRegistry().load(tmp_path / "missing.json")
+
+
+def test_registry_validates_against_each_loaders_schema(tmp_path):
+    registry = PatternRegistry()
+    path = tmp_path / "patterns.json"
+    shutil.copy(PATTERNS_PATH, path)
+    strict_schema = tmp_path / "strict.schema.json"
+    strict_schema.write_text(
+        json.dumps({"type": "object", "required": ["patterns", "strict_marker"]})
+    )
+
+    original = registry.load(path)
+    assert registry.load(path, PatternLoader()) is original
+    with pytest.raises(ValueError):
+        registry.load(path, PatternLoader(strict_schema))
+
+    # The entry validated by the default schema survives the failed load
+    assert registry.load(path) is original
+
+
+def test_custom_plugins_get_their_own_compiled_set():
+    shared = PatternEngine()
+    shared.load_patterns(PATTERNS_PATH)
+
+    custom = PatternEngine()
+    custom.plugins.register("custom", lambda *args: None)
+    custom.load_patterns(PATTERNS_PATH)
+
+    assert custom._patterns is shared._patterns
+    assert custom.compiled_patterns is not shared.compiled_patterns
+    assert get_pattern_registry().load(PATTERNS_PATH).compiled is (
+        shared.compiled_patterns
+    )
@@ -0,0 +1,126 @@
+"""
+Tests for structured roman numeral tokens.
+
+Matching keys must group spellings exactly like the string normalizer the
+engine has always used, while the parsed fields expose degree, quality,
+extensions, inversion and secondary target as integers.
+"""
+
+import itertools
+import pickle
+
+import pytest
+
+from harmonic_analysis.core.pattern_engine.roman_numeral import (
+    EXT_ADD,
+    EXT_MAJOR_SEVENTH,
+    EXT_NINTH,
+    EXT_SEVENTH,
+    EXT_SUS,
+    QUALITY_AUGMENTED,
+    QUALITY_DIMINISHED,
+    QUALITY_HALF_DIMINISHED,
+    QUALITY_MAJOR,
+    QUALITY_MINOR,
+    RomanNumeral,
+    normalize_roman_for_matching,
+    parse_roman,
+    roman_match_key,
+)
+
+
+class TestParseRoman:
+    """Field extraction."""
+
+    @pytest.mark.parametrize(
+        "text, degree, accidental, quality",
+        [
+            ("I", 1, 0, QUALITY_MAJOR),
+            ("vi", 6, 0, QUALITY_MINOR),
+            ("♭VII", 7, -1, QUALITY_MAJOR),
+            ("bII", 2, -1, QUALITY_MAJOR),
+            ("#iv°", 4, 1, QUALITY_DIMINISHED),
+            ("viiø7", 7, 0, QUALITY_HALF_DIMINISHED),
+            ("III+", 3, 0, QUALITY_AUGMENTED),
+        ],
+    )
+    def test_degree_accidental_quality(self, text, degree, accidental, quality):
+        roman = parse_roman(text)
+
+        assert (roman.degree, roman.accidental, roman.quality) == (
+            degree,
+            accidental,
+            quality,
+        )
+
+    @pytest.mark.parametrize(
+        "text, extensions, inversion",
+        [
+            ("V7", EXT_SEVENTH, 0),
+            ("V65", EXT_SEVENTH, 1),
+            ("V43", EXT_SEVENTH, 2),
+            ("V42", EXT_SEVENTH, 3),
+            ("I6", 0, 1),
+            ("I64", 0, 2),
+            ("Imaj7", EXT_MAJOR_SEVENTH, 0),
+            ("ii9", EXT_NINTH, 0),
+            ("IVadd9", EXT_ADD, 0),
+            ("Vsus4", EXT_SUS, 0),
+        ],
+    )
+    def test_extensions_and_inversion(self, text, extensions, inversion):
+        roman = parse_roman(text)
+
+        assert roman.extensions == extensions
+        assert roman.inversion == inversion
+
+    def test_secondary_target(self):
+        roman = parse_roman("V7/vi")
+
+        assert roman.is_secondary
+        assert roman.secondary is not None
+        assert (roman.secondary.degree, roman.secondary.quality) == (6, QUALITY_MINOR)
+        assert roman.matches(parse_roman("V"))
+
+    def test_unrecognised_spelling_still_matches(self):
+        roman = parse_roman("N6")
+
+        assert roman.degree == 0
+        assert roman.match_key == roman_match_key("N")
+
+    def test_tokens_are_immutable_cached_and_picklable(self):
+        roman = parse_roman("V7")
+
+        assert parse_roman("V7") is roman
+        with pytest.raises(AttributeError):
+            roman.degree = 4  # type: ignore[misc]
+        assert pickle.loads(pickle.dumps(roman)) == roman
+        assert isinstance(roman, RomanNumeral)
+
+
+class TestMatchKeys:
+    """Integer keys preserve the legacy string-normalization equivalence."""
+
+    SPELLINGS = [
+        "".join(parts)
+        for parts in itertools.product(
+            ["", "b", "♭", "#", "♯", "bb"],
+            ["I", "ii", "III", "iv", "V", "vi", "VII", "N", "Ger"],
+            ["", "°", "ø", "+", "o"],
+            ["", "7", "64", "maj7", "add9", "sus4", "/V", "/vi"],
+        )
+    ]
+
+    def test_keys_agree_with_normalizer(self):
+        keys = {}
+        for spelling in self.SPELLINGS:
+            normalized = normalize_roman_for_matching(spelling)
+            key = roman_match_key(spelling)
+            assert keys.setdefault(normalized, key) == key
+
+        # Distinct normalized strings never share a key
+        assert len(set(keys.values())) == len(keys)
+
+    def test_common_spellings_use_integer_keys(self):
+        for spelling in ["I", "V7", "♭VII", "bVI", "vii°7", "iiø7", "V/V"]:
+            assert isinstance(roman_match_key(spelling), int)
@@ -0,0 +1,158 @@
+"""
+Tests for the multi-pattern sequence scanner.
+
+The scanner must report exactly the spans the per-pattern sliding window
+would find, including wildcard and regex items that fall outside the
+Aho-Corasick trie.
+"""
+
+import random
+from pathlib import Path
+
+from harmonic_analysis.core.pattern_engine.pattern_engine import (
+    AnalysisContext,
+    PatternEngine,
+)
+from harmonic_analysis.core.pattern_engine.sequence_scanner import (
+    LITERAL,
+    REGEX,
+    WILDCARD,
+    MultiPatternScanner,
+    SequenceScanner,
+    compile_sequence_token,
+    find_sequence_starts,
+)
+
+PATTERNS_PATH = (
+    Path(__file__).parents[3]
+    / "src"
+    / "harmonic_analysis"
+    / "resources"
+    / "patterns"
+    / "patterns_unified.json"
+)
+
+
+def _tokens(items):
+    return [compile_sequence_token(item) for item in items]
+
+
+class TestSequenceTokens:
+    """Token classification mirrors the engine's matching rules."""
+
+    def test_token_kinds(self):
+        assert compile_sequence_token("*").kind == WILDCARD
+        assert compile_sequence_token(".*").kind == WILDCARD
+        assert compile_sequence_token("V.*").kind == REGEX
+        assert compile_sequence_token("V").kind == LITERAL
+
+    def test_invalid_regex_falls_back_to_literal(self):
+        token = compile_sequence_token("V(", normalize=lambda s: s.lower())
+        assert token.kind == LITERAL
+        assert token.text == "v("
+
+    def test_regex_is_case_insensitive_prefix_match(self):
+        token = compile_sequence_token("V.*")
+        assert token.matches("", "vi")
+        assert token.matches("", "V7")
+        assert not token.matches("", "IV")
+
+
+class TestSequenceScanner:
+    """Single-kind automaton behaviour."""
+
+    def test_overlapping_literal_sequences(self):
+        scanner = SequenceScanner()
+        scanner.add(0, _tokens(["I", "IV"]))
+        scanner.add(1, _tokens(["IV", "I"]))
+        scanner.add(2, _tokens(["I", "IV", "I"]))
+        context = ["I", "IV", "I", "IV", "I"]
+
+        hits = scanner.scan(context, context)
+
+        assert hits == {0: [0, 2], 1: [1, 3], 2: [0, 2]}
+
+    def test_anchor_with_leading_wildcard(self):
+        scanner = SequenceScanner()
+        scanner.add(0, _tokens(["*", "V", "I"]))
+        context = ["V", "I", "ii", "V", "I"]
+
+        assert scanner.scan(context, context) == {0: [2]}
+
+    def test_unanchored_sequence(self):
+        scanner = SequenceScanner()
+        scanner.add(0, _tokens(["V/.*", ".*"]))
+        context = ["C", "V/ii", "ii", "V/V"]
+
+        assert scanner.scan(context, context) == {0: [1]}
+
+    def test_matches_brute_force_on_random_sequences(self):
+        rng = random.Random(7)
+        alphabet = ["I", "ii", "IV", "V", "vi", "V7"]
+        items = alphabet + ["*", "V.*", "ii|IV"]
+        sequences = [
+            [rng.choice(items) for _ in range(rng.randint(1, 4))] for _ in range(40)
+        ]
+
+        scanner = SequenceScanner()
+        for entry_id, sequence in enumerate(sequences):
+            scanner.add(entry_id, _tokens(sequence))
+
+        for _ in range(20):
+            context = [rng.choice(alphabet) for _ in range(rng.randint(0, 30))]
+            hits = scanner.scan(context, context)
+            for entry_id, sequence in enumerate(sequences):
+                expected = find_sequence_starts(_tokens(sequence), context, context)
+                assert hits.get(entry_id, []) == expected
+
+
+class TestMultiPatternScanner:
+    """Library-wide scanning grouped by pattern and matcher kind."""
+
+    def test_groups_hits_by_pattern_and_kind(self):
+        scanner = MultiPatternScanner(
+            [
+                (0, "roman_seq", _tokens(["V", "I"])),
+                (0, "chord_seq", _tokens(["G", "C"])),
+                (1, "interval_seq", _tokens(["1"])),
+            ]
+        )
+        hits = scanner.scan(
+            {
+                "roman_seq": (["V", "I"], ["V", "I"]),
+                "chord_seq": (["G", "C"], ["G", "C"]),
+                "interval_seq": (["2", "1"], ["2", "1"]),
+            }
+        )
+
+        assert scanner.kinds == ("roman_seq", "chord_seq", "interval_seq")
+        assert hits == {
+            0: {"roman_seq": [0], "chord_seq": [0]},
+            1: {"interval_seq": [1]},
+        }
+
+    def test_engine_scan_matches_per_pattern_search(self):
+        """Full-library scanning agrees with matching each pattern separately."""
+        engine = PatternEngine()
+        engine.load_patterns(PATTERNS_PATH)
+        rng = random.Random(11)
+        romans = ["I", "ii", "IV", "V", "V7", "vi", "♭VII", "♭II", "i", "iv", "V/vi"]
+
+        for _ in range(10):
+            sequence = [rng.choice(romans) for _ in range(rng.randint(2, 24))]
+            context = AnalysisContext(
+                key="C major",
+                chords=["C"] * len(sequence),
+                roman_numerals=sequence,
+                melody=[],
+                scales=[],
+                metadata={},
+            )
+            scanned = [(e.pattern_id, e.span) for e in engine._match_patterns(context)]
+            expected = [
+                (pattern["id"], span)
+                for pattern in engine._patterns["patterns"]
+                if engine._pattern_applies(pattern, context)
+                for span in engine._find_pattern_matches(pattern, context)
+            ]
+            assert scanned == expected
@@ -10,9 +10,13 @@ import numpy as np
 import pytest
 
 from harmonic_analysis.core.pattern_engine.calibration import (
+    CalibrationMapping,
     CalibrationReport,
     Calibrator,
+    load_default_calibration,
+    synthetic_calibration_data,
 )
+from harmonic_analysis.core.pattern_engine.pattern_engine import PatternEngine
 
 
 class TestCalibratorQualityGates:
@@ -388,3 +392,60 @@ class TestCalibratorEdgeCases:
 
         result = mapping.apply(float("inf"))
         assert isinstance(result, (int, float)), "Should handle infinity gracefully"
+
+
+class TestCalibrationArtifact:
+    """Test the persisted, versioned calibration artifact."""
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Test that a fitted mapping survives serialization unchanged."""
+        mapping = Calibrator().fit(*synthetic_calibration_data(seed=3))
+        path = tmp_path / "calibration.json"
+
+        mapping.save(path, provenance={"seed": 3})
+        loaded = CalibrationMapping.load(path)
+
+        assert loaded == mapping
+        values = np.linspace(0.0, 1.0, 11)
+        np.testing.assert_array_equal(
+            loaded.apply_batch(values), mapping.apply_batch(values)
+        )
+
+    def test_unsupported_version_rejected(self, tmp_path):
+        """Test that artifacts from another format version are refused."""
+        data = Calibrator().fit(*synthetic_calibration_data()).to_dict()
+        data["version"] = 99
+
+        with pytest.raises(ValueError):
+            CalibrationMapping.from_dict(data)
+        with pytest.raises(ValueError):
+            CalibrationMapping.from_dict({"format": "something-else"})
+
+    def test_synthetic_data_is_deterministic(self):
+        """Test that the synthetic training set depends only on the seed."""
+        assert synthetic_calibration_data(5) == synthetic_calibration_data(5)
+        assert synthetic_calibration_data(5) != synthetic_calibration_data(6)
+
+    def test_default_artifact_is_packaged(self):
+        """Test that the shipped artifact loads and passed its quality gates."""
+        mapping = load_default_calibration()
+
+        assert mapping.passed_gates
+        assert mapping.mapping_type in ["platt", "isotonic"]
+        assert load_default_calibration() is mapping
+
+    def test_engine_loads_artifact(self, tmp_path):
+        """Test that PatternEngine.load_calibration reads a saved artifact."""
+        mapping = CalibrationMapping(
+            mapping_type="platt",
+            params={"A": 2.0, "B": -1.0},
+            metrics=load_default_calibration().metrics,
+            passed_gates=True,
+        )
+        path = tmp_path / "calibration.json"
+        mapping.save(path)
+
+        engine = PatternEngine()
+        engine.load_calibration(path)
+
+        assert engine._calibrate(0.5) == mapping.apply(0.5)
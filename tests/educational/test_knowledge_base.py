@@ -214,6 +214,23 @@ class TestKnowledgeBase:
 
         assert explanation is None
 
+    def test_stamped_knowledge_base_skips_validation(self, monkeypatch, tmp_path):
+        """Test the bundled file skips jsonschema while a copy is validated."""
+        import jsonschema
+
+        calls = []
+        monkeypatch.setattr(
+            jsonschema, "validate", lambda *args, **kwargs: calls.append(args)
+        )
+
+        kb = KnowledgeBase()
+        assert calls == []
+
+        copy = tmp_path / "knowledge_base.json"
+        copy.write_bytes(kb._get_default_kb_path().read_bytes())
+        KnowledgeBase(kb_path=copy)
+        assert len(calls) == 1
+
 
 class TestEducationalService:
     """Test educational service functionality."""
@@ -6,10 +6,19 @@ helpful error messages for common validation failures.
 """
 
 import json
+import shutil
 
+import jsonschema
 import pytest
 
 from harmonic_analysis.core.pattern_engine.pattern_loader import PatternLoader
+from harmonic_analysis.resources.validation import (
+    RESOURCES_DIR,
+    VALIDATION_STAMPS_RESOURCE,
+    build_validation_stamps,
+)
+
+BUNDLED_PATTERNS = RESOURCES_DIR / "patterns" / "patterns_unified.json"
 
 
 class TestPatternLoaderValidation:
@@ -297,3 +306,46 @@ class TestPatternLoaderValidation:
         assert "window" in pattern["matchers"]
         assert len(pattern["evidence"]["features"]) == 3
         assert "examples" in pattern["metadata"]
+
+
+class TestValidationStamps:
+    """Test build-time validation stamps for bundled pattern files."""
+
+    @pytest.fixture
+    def validate_calls(self, monkeypatch):
+        calls = []
+        original = jsonschema.validate
+
+        def counting_validate(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(jsonschema, "validate", counting_validate)
+        return calls
+
+    def test_packaged_stamps_are_current(self):
+        """Re-run scripts/stamp_resources.py if this fails."""
+        with (RESOURCES_DIR / VALIDATION_STAMPS_RESOURCE).open() as f:
+            assert json.load(f) == build_validation_stamps()
+
+    def test_bundled_file_skips_schema_validation(self, validate_calls):
+        loaded = PatternLoader().load(BUNDLED_PATTERNS)
+
+        assert loaded["patterns"]
+        assert validate_calls == []
+
+    def test_user_file_is_validated_in_full(self, tmp_path, validate_calls):
+        user_file = tmp_path / "patterns_unified.json"
+        shutil.copy(BUNDLED_PATTERNS, user_file)
+
+        PatternLoader().load(user_file)
+
+        assert len(validate_calls) == 1
+
+    def test_different_schema_is_validated_in_full(self, validate_calls):
+        loader = PatternLoader()
+        loader.schema = PatternLoader.DEFAULT_SCHEMA
+
+        loader.load(BUNDLED_PATTERNS)
+
+        assert len(validate_calls) == 1
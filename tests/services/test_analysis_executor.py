@@ -0,0 +1,195 @@
+"""
+Tests for the bounded executor behind the async analysis API.
+
+Async analyses must run off the event loop, respect the in-flight limit,
+report queue metrics and reject early when the wait queue is full.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from harmonic_analysis.services.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisExecutorConfig,
+    AnalysisQueueFullError,
+)
+from harmonic_analysis.services.unified_pattern_service import UnifiedPatternService
+
+
+def _blocking(seconds, active, peak, lock):
+    with lock:
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+    time.sleep(seconds)
+    with lock:
+        active[0] -= 1
+    return seconds
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestAnalysisExecutor:
+    async def test_event_loop_stays_responsive(self):
+        executor = AnalysisExecutor(AnalysisExecutorConfig(max_workers=1))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(ticker())
+        await executor.run(time.sleep, 0.2)
+        task.cancel()
+        executor.shutdown()
+
+        assert ticks >= 5
+
+    async def test_in_flight_limit_and_queue_metrics(self):
+        executor = AnalysisExecutor(
+            AnalysisExecutorConfig(max_workers=4, max_in_flight=1)
+        )
+        active, peak, lock = [0], [0], threading.Lock()
+
+        await asyncio.gather(
+            *(executor.run(_blocking, 0.05, active, peak, lock) for _ in range(3))
+        )
+        executor.shutdown()
+
+        stats = executor.stats
+        assert peak[0] == 1
+        assert stats.completed == 3
+        assert stats.in_flight == 0 and stats.waiting == 0
+        assert stats.max_waiting_seen == 2
+        assert stats.max_wait_ms >= 40
+        assert stats.to_dict()["mean_wait_ms"] > 0
+
+    async def test_rejects_when_queue_full(self):
+        executor = AnalysisExecutor(
+            AnalysisExecutorConfig(max_workers=1, max_waiting=0)
+        )
+        active, peak, lock = [0], [0], threading.Lock()
+
+        results = await asyncio.gather(
+            executor.run(_blocking, 0.05, active, peak, lock),
+            executor.run(_blocking, 0.05, active, peak, lock),
+            return_exceptions=True,
+        )
+        executor.shutdown()
+
+        assert results[0] == 0.05
+        assert isinstance(results[1], AnalysisQueueFullError)
+        assert executor.stats.rejected == 1
+        assert executor.stats.completed == 1
+
+    def test_limits_hold_across_event_loops(self):
+        executor = AnalysisExecutor(
+            AnalysisExecutorConfig(max_workers=4, max_in_flight=1, max_waiting=1)
+        )
+        active, peak, lock = [0], [0], threading.Lock()
+        outcomes = []
+
+        def on_own_loop(seconds):
+            try:
+                outcomes.append(
+                    asyncio.run(executor.run(_blocking, seconds, active, peak, lock))
+                )
+            except AnalysisQueueFullError as exc:
+                outcomes.append(exc)
+
+        # Opening move: one loop takes the only slot, a second waits for it
+        holder = threading.Thread(target=on_own_loop, args=(0.2,))
+        holder.start()
+        _wait_until(lambda: executor.stats.in_flight > 0)
+        waiter = threading.Thread(target=on_own_loop, args=(0.01,))
+        waiter.start()
+        _wait_until(lambda: executor.stats.waiting > 0)
+        # A third loop finds the slot taken and the one queue place filled
+        on_own_loop(0.01)
+        holder.join()
+        waiter.join()
+        executor.shutdown()
+
+        assert peak[0] == 1
+        assert isinstance(outcomes[0], AnalysisQueueFullError)
+        assert sorted(outcomes[1:]) == [0.01, 0.2]
+        stats = executor.stats
+        assert (stats.completed, stats.rejected) == (2, 1)
+        assert stats.in_flight == 0 and stats.waiting == 0
+
+    async def test_cancelled_waiter_gives_up_its_place(self):
+        executor = AnalysisExecutor(
+            AnalysisExecutorConfig(max_workers=1, max_waiting=1)
+        )
+        active, peak, lock = [0], [0], threading.Lock()
+
+        running = asyncio.ensure_future(
+            executor.run(_blocking, 0.1, active, peak, lock)
+        )
+        await asyncio.sleep(0.01)
+        cancelled = asyncio.ensure_future(executor.run(time.sleep, 0))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+        assert executor.stats.waiting == 0
+        assert await executor.run(time.sleep, 0) is None
+        await running
+        executor.shutdown()
+        assert executor.stats.in_flight == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"kind": "fiber"}, {"max_workers": 0}, {"max_waiting": -1}],
+    )
+    def test_invalid_config(self, kwargs):
+        with pytest.raises(ValueError):
+            AnalysisExecutorConfig(**kwargs)
+
+
+class TestAsyncServiceOffload:
+    INPUT = {"chords": ["C", "Am", "F", "G7", "C"], "key_hint": "C major"}
+
+    @staticmethod
+    def _comparable(envelope):
+        data = envelope.to_dict()
+        data.pop("analysis_time_ms", None)
+        return data
+
+    @pytest.mark.parametrize("kind", ["thread", "process", "inline"])
+    async def test_offloaded_analysis_matches_inline(self, kind):
+        service = UnifiedPatternService(
+            executor_config=AnalysisExecutorConfig(kind=kind, max_workers=1)
+        )
+        try:
+            envelope = await service.analyze_with_patterns_async(**self.INPUT)
+        finally:
+            service.close()
+
+        expected = service._analyze(**self.INPUT)
+        assert self._comparable(envelope) == self._comparable(expected)
+        assert service.executor.stats.completed == 1
+
+    async def test_analysis_runs_off_the_loop_thread(self, monkeypatch):
+        service = UnifiedPatternService()
+        threads = []
+        original = service._analyze
+
+        def recording(**kwargs):
+            threads.append(threading.get_ident())
+            return original(**kwargs)
+
+        monkeypatch.setattr(service, "_analyze", recording)
+        await service.analyze_with_patterns_async(**self.INPUT)
+        service.close()
+
+        assert threads and threads[0] != threading.get_ident()
@@ -0,0 +1,179 @@
+"""
+Tests for columnar batch results.
+
+Columnar batches must carry the same fields as the envelopes they replace,
+index patterns and evidence by row offsets, round-trip through .npz and
+JSON Lines, and keep memory flat while streaming.
+"""
+
+import copy
+import io
+import json
+import math
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from harmonic_analysis.core.telemetry import TelemetryCollector
+from harmonic_analysis.services.columnar import (
+    EVIDENCE_COLUMNS,
+    PATTERN_COLUMNS,
+    ROW_COLUMNS,
+    ColumnarBatch,
+    ColumnarBuilder,
+    write_jsonl,
+)
+from harmonic_analysis.services.pattern_analysis_service import PatternAnalysisService
+
+INPUTS = [
+    {"chord_symbols": ["C", "F", "G", "C"], "key_hint": "C major"},
+    {"romans": ["ii", "V", "I"]},  # missing key_hint -> error row
+    {"chord_symbols": ["Am", "F", "C", "G"]},
+    {"melody": ["E4", "D4", "C4"], "key_hint": "C major"},
+    {"chord_symbols": ["G", "F", "C", "G"], "key_hint": "G mixolydian"},
+]
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = PatternAnalysisService()
+    yield service
+    service.close()
+
+
+@pytest.fixture(scope="module")
+def batch(service):
+    return ColumnarBatch.concat(
+        service.analyze_columnar(INPUTS, workers=1, chunksize=2)
+    )
+
+
+class TestColumnarBatch:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_columns_match_envelopes(self, service, workers):
+        batch = ColumnarBatch.concat(
+            service.analyze_columnar(INPUTS, workers=workers, chunksize=2)
+        )
+        offsets = batch.pattern_offsets
+
+        assert len(batch) == len(INPUTS)
+        assert batch.rows["error"][1].startswith("ValueError")
+        for row, item in enumerate(INPUTS):
+            if row == 1:
+                assert math.isnan(batch.rows["confidence"][row])
+                continue
+            primary = service.analyze_with_patterns(**item).primary
+            assert batch.rows["error"][row] == ""
+            assert batch.rows["primary_type"][row] == primary.type.value
+            assert batch.rows["confidence"][row] == pytest.approx(primary.confidence)
+            assert batch.rows["key_signature"][row] == (primary.key_signature or "")
+            patterns = slice(offsets[row], offsets[row + 1])
+            assert batch.patterns["pattern_id"][patterns].tolist() == [
+                match.pattern_id for match in primary.patterns
+            ]
+            assert batch.patterns["start"][patterns].tolist() == [
+                match.start for match in primary.patterns
+            ]
+
+    def test_tables_are_plain_equal_length_arrays(self, batch):
+        for table, columns in (
+            (batch.rows, ROW_COLUMNS),
+            (batch.patterns, PATTERN_COLUMNS),
+            (batch.evidence, EVIDENCE_COLUMNS),
+        ):
+            assert list(table) == [name for name, _ in columns]
+            assert all(isinstance(values, np.ndarray) for values in table.values())
+            assert len({len(values) for values in table.values()}) == 1
+
+        assert batch.pattern_offsets[-1] == len(batch.patterns["row"])
+        assert batch.evidence_offsets[-1] == len(batch.evidence["row"])
+        assert np.all(np.diff(batch.evidence_offsets) >= 0)
+
+    def test_concat_renumbers_rows(self, batch):
+        doubled = ColumnarBatch.concat([batch, batch])
+
+        assert len(doubled) == 2 * len(batch)
+        np.testing.assert_array_equal(
+            doubled.patterns["row"][len(batch.patterns["row"]) :],
+            batch.patterns["row"] + len(batch),
+        )
+
+    def test_failed_add_leaves_no_partial_row(self, service):
+        envelope = service.analyze_with_patterns(**INPUTS[0])
+        broken = copy.deepcopy(envelope)
+        # Rows and patterns reduce fine; the evidence span is malformed
+        broken.evidence[-1].details["span"] = [3]
+        builder = ColumnarBuilder()
+
+        builder.add(envelope)
+        with pytest.raises(IndexError):
+            builder.add(broken)
+        builder.add_error(IndexError("list index out of range"))
+        builder.add(envelope)
+        batch = builder.build()
+
+        assert len(batch) == 3
+        for table in (batch.rows, batch.patterns, batch.evidence):
+            assert len({len(values) for values in table.values()}) == 1
+        patterns = len(envelope.primary.patterns)
+        assert batch.pattern_offsets.tolist() == [0, patterns, patterns, 2 * patterns]
+        assert batch.rows["error"].tolist() == [
+            "",
+            "IndexError: list index out of range",
+            "",
+        ]
+
+    def test_npz_round_trip(self, batch, tmp_path):
+        path = tmp_path / "batch.npz"
+
+        batch.save_npz(path)
+        loaded = ColumnarBatch.load_npz(path)
+
+        for table in ("rows", "patterns", "evidence"):
+            for name, values in getattr(batch, table).items():
+                np.testing.assert_array_equal(getattr(loaded, table)[name], values)
+
+    def test_jsonl_rows(self, batch):
+        stream = io.StringIO()
+
+        assert write_jsonl([batch], stream) == len(INPUTS)
+
+        rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert rows[1]["confidence"] is None and rows[1]["error"]
+        assert [p["pattern_id"] for p in rows[0]["patterns"]] == list(
+            batch.patterns["pattern_id"][: batch.pattern_offsets[1]]
+        )
+
+    def test_feeds_pandas(self, batch):
+        pd = pytest.importorskip("pandas")
+
+        rows = pd.DataFrame(batch.rows)
+        patterns = pd.DataFrame(batch.patterns)
+
+        assert len(rows) == len(INPUTS)
+        assert patterns.merge(rows, left_on="row", right_index=True).shape[0] == len(
+            patterns
+        )
+
+    def test_streaming_memory_stays_flat(self, service, monkeypatch):
+        # Telemetry keeps a bounded session history; shrink it for the test
+        telemetry = TelemetryCollector(max_sessions=8)
+        monkeypatch.setattr(service._unified_service, "telemetry", telemetry)
+
+        def peak(chunks):
+            tracemalloc.start()
+            for _ in service.analyze_columnar(
+                iter(INPUTS * (chunks * 4)), workers=1, chunksize=20
+            ):
+                pass
+            result = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return result
+
+        peak(1)  # warm caches
+        assert peak(8) < peak(2) * 1.5
+        assert len(telemetry.session_metrics) == 8
+        # Totals still cover every successful analysis (4 of 5 inputs)
+        runs = (1 + 8 + 2) * 4
+        assert telemetry.get_aggregated_metrics()["session_count"] == runs * 4
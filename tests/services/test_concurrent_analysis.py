@@ -0,0 +1,244 @@
+"""
+Stress tests for running one service instance from many threads.
+
+Concurrent analyses must produce exactly the serial results, and the shared
+counters (telemetry sessions, prefilter stats, executor stats) must not lose
+updates.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from harmonic_analysis.core.telemetry import TelemetryCollector
+from harmonic_analysis.services.analysis_executor import AnalysisExecutorConfig
+from harmonic_analysis.services.analysis_arbitration_service import ArbitrationPolicy
+from harmonic_analysis.services.pattern_analysis_service import PatternAnalysisService
+from harmonic_analysis.services.unified_pattern_service import UnifiedPatternService
+
+THREADS = 8
+ROUNDS = 6
+
+INPUTS = [
+    {"chords": ["C", "F", "G", "C"], "key_hint": "C major"},
+    {"chords": ["Am", "F", "C", "G"]},
+    {"chords": ["G", "F", "C", "G"], "key_hint": "G mixolydian"},
+    {"chords": ["Dm7", "G7", "Cmaj7"], "key_hint": "C major"},
+    {"chords": ["C", "Am", "F", "G7", "C"], "profile": "pop"},
+    {"romans": ["I", "vi", "IV", "V", "I"], "key_hint": "C major"},
+    {"romans": ["i", "iv", "V", "i"], "key_hint": "A minor"},
+    {"melody": ["C4", "D4", "E4", "F4", "G4"], "key_hint": "C major"},
+    {"notes": ["D", "E", "F", "G", "A", "B", "C"], "key_hint": "D dorian"},
+]
+
+# analyze_many() takes PatternAnalysisService keywords
+BATCH_INPUTS = [
+    {
+        ("chord_symbols" if key == "chords" else key): value
+        for key, value in item.items()
+    }
+    for item in INPUTS
+]
+
+
+def _comparable(envelope):
+    data = envelope.to_dict()
+    data.pop("analysis_time_ms", None)
+    return data
+
+
+def _run_concurrently(analyze, jobs):
+    """Run every job on THREADS threads released together by a barrier."""
+    barrier = threading.Barrier(THREADS)
+
+    def worker(offset):
+        barrier.wait()
+        return [
+            (index, analyze(jobs[index])) for index in range(offset, len(jobs), THREADS)
+        ]
+
+    results = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        for chunk in pool.map(worker, range(THREADS)):
+            for index, value in chunk:
+                results[index] = value
+    return results
+
+
+class TestConcurrentAnalysis:
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def service():
+        return UnifiedPatternService()
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def serial(service):
+        return [_comparable(service.analyze_with_patterns(**item)) for item in INPUTS]
+
+    def test_threaded_results_match_serial(self, service, serial):
+        jobs = INPUTS * ROUNDS
+
+        results = _run_concurrently(
+            lambda item: _comparable(service.analyze_with_patterns(**item)), jobs
+        )
+
+        assert results == serial * ROUNDS
+
+    def test_threaded_batches_match_serial(self, service, serial):
+        results = _run_concurrently(
+            lambda batch: [_comparable(e) for e in service.analyze_batch(batch)],
+            [INPUTS] * THREADS,
+        )
+
+        assert results == [serial] * THREADS
+
+    def test_facade_with_arbitration_matches_serial(self):
+        service = PatternAnalysisService(arbitration_policy=ArbitrationPolicy())
+        chords = [item for item in INPUTS if "chords" in item]
+        expected = [
+            _comparable(service.analyze_with_patterns(chord_symbols=item["chords"]))
+            for item in chords
+        ]
+
+        results = _run_concurrently(
+            lambda item: _comparable(
+                service.analyze_with_patterns(chord_symbols=item["chords"])
+            ),
+            chords * ROUNDS,
+        )
+
+        assert results == expected * ROUNDS
+
+    def test_shared_counters_lose_no_updates(self, monkeypatch):
+        service = UnifiedPatternService()
+        telemetry = TelemetryCollector()
+        monkeypatch.setattr(service, "telemetry", telemetry)
+        session_ids = []
+        start = telemetry.log_analysis_start
+
+        def recording_start(context):
+            session_id = start(context)
+            session_ids.append(session_id)
+            return session_id
+
+        monkeypatch.setattr(telemetry, "log_analysis_start", recording_start)
+        service.engine.prefilter_stats.reset()
+        jobs = INPUTS * ROUNDS
+
+        _run_concurrently(lambda item: service.analyze_with_patterns(**item), jobs)
+
+        assert len(telemetry.session_metrics) == len(jobs)
+        assert len(set(session_ids)) == len(jobs)
+        assert telemetry.get_aggregated_metrics()["session_count"] == len(jobs)
+        assert service.engine.prefilter_stats.contexts == len(jobs)
+
+    def test_async_from_many_loops_keeps_exact_stats(self, serial):
+        service = UnifiedPatternService(
+            executor_config=AnalysisExecutorConfig(max_workers=2, max_in_flight=2)
+        )
+        jobs = INPUTS * ROUNDS
+
+        # Each thread drives the shared executor from its own event loop
+        results = _run_concurrently(
+            lambda item: _comparable(
+                asyncio.run(service.analyze_with_patterns_async(**item))
+            ),
+            jobs,
+        )
+        service.close()
+
+        assert results == serial * ROUNDS
+        stats = service.executor.stats
+        assert stats.completed == len(jobs)
+        assert (stats.in_flight, stats.waiting, stats.rejected) == (0, 0, 0)
+        assert stats.max_waiting_seen <= THREADS - 2
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        getattr(sys, "_is_gil_enabled", lambda: True)(),
+        reason="threads only scale CPU-bound analysis on free-threaded CPython",
+    )
+    def test_throughput_scales_with_threads(self, service):
+        jobs = INPUTS * ROUNDS * 4
+
+        def timed(threads):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(lambda item: service.analyze_with_patterns(**item), jobs))
+            return time.perf_counter() - started
+
+        timed(THREADS)  # warm-up
+        serial_time, threaded_time = timed(1), timed(4)
+
+        assert serial_time / threaded_time > 1.5
+
+
+class TestOverlappingBatchStreams:
+    """analyze_many() streams with different worker counts on one instance."""
+
+    @staticmethod
+    def _comparable(result):
+        if isinstance(result, Exception):
+            return (type(result), str(result))
+        data = dict(result)
+        data.pop("analysis_time_ms", None)
+        return data
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def expected():
+        service = PatternAnalysisService()
+        return [
+            TestOverlappingBatchStreams._comparable(
+                service.analyze_with_patterns(**item).to_dict()
+            )
+            for item in BATCH_INPUTS
+        ]
+
+    def test_resize_waits_for_running_stream(self, expected):
+        service = PatternAnalysisService()
+        try:
+            first = service.analyze_many(BATCH_INPUTS, workers=2, chunksize=1)
+            head = next(first)
+            old_pool = service._pool
+
+            # A different size replaces the warm pool mid-stream...
+            other = list(service.analyze_many(BATCH_INPUTS, workers=3, chunksize=1))
+            assert service._pool is not old_pool
+
+            # ...but the running stream keeps its pool until it finishes
+            rest = list(first)
+            assert old_pool._shutdown_thread
+            assert [self._comparable(r) for r in [head, *rest]] == expected
+            assert [self._comparable(r) for r in other] == expected
+        finally:
+            service.close()
+
+    def test_threads_with_different_worker_counts(self, expected):
+        service = PatternAnalysisService()
+        barrier = threading.Barrier(2)
+
+        def stream(workers):
+            barrier.wait()
+            return [
+                [
+                    self._comparable(r)
+                    for r in service.analyze_many(
+                        BATCH_INPUTS, workers=workers, chunksize=1
+                    )
+                ]
+                for _ in range(2)
+            ]
+
+        try:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(stream, (2, 3)))
+        finally:
+            service.close()
+
+        assert results == [[expected, expected], [expected, expected]]
@@ -185,6 +185,24 @@ class TestUnifiedServiceInitialization:
 
         print("✅ Legacy parameter initialization compatibility confirmed")
 
+    def test_calibration_loaded_from_artifact(self, monkeypatch):
+        """Test that startup loads the packaged mapping instead of fitting."""
+        from harmonic_analysis.core.pattern_engine.calibration import (
+            Calibrator,
+            load_default_calibration,
+        )
+
+        def no_fit(*args, **kwargs):
+            raise AssertionError("calibration must not be fitted at startup")
+
+        monkeypatch.setattr(Calibrator, "fit", no_fit)
+
+        first = UnifiedPatternService()
+        second = UnifiedPatternService()
+
+        assert first.calibration_mapping is load_default_calibration()
+        assert second.calibration_mapping is first.calibration_mapping
+
     def test_default_initialization(self):
         """Test that default initialization works correctly."""
         service = UnifiedPatternService()
@@ -194,3 +212,137 @@ class TestUnifiedServiceInitialization:
         assert service.auto_calibrate is True
 
         print("✅ Default initialization confirmed")
+
+
+class TestSynchronousPath:
+    """Test that the sync API runs directly, without loops or threads."""
+
+    @pytest.fixture
+    def no_loops_or_threads(self, monkeypatch):
+        import asyncio
+        import threading
+
+        def forbidden(*args, **kwargs):
+            raise AssertionError("sync analysis must not create loops or threads")
+
+        monkeypatch.setattr(asyncio, "run", forbidden)
+        monkeypatch.setattr(asyncio, "new_event_loop", forbidden)
+        monkeypatch.setattr(threading.Thread, "start", forbidden)
+
+    @pytest.mark.parametrize(
+        "service_class, kwargs",
+        [
+            (UnifiedPatternService, {"chords": ["C", "F", "G", "C"]}),
+            (PatternAnalysisService, {"chord_symbols": ["C", "F", "G", "C"]}),
+        ],
+    )
+    def test_sync_analysis_is_direct(self, no_loops_or_threads, service_class, kwargs):
+        envelope = service_class().analyze_with_patterns(key_hint="C major", **kwargs)
+
+        assert isinstance(envelope, AnalysisEnvelope)
+        assert envelope.primary.key_signature == "C major"
+
+    async def test_sync_analysis_inside_running_loop(self):
+        import threading
+
+        before = threading.active_count()
+        envelope = PatternAnalysisService().analyze_with_patterns(
+            chord_symbols=["Am", "F", "C", "G"]
+        )
+
+        assert isinstance(envelope, AnalysisEnvelope)
+        assert threading.active_count() == before
+
+
+class TestAnalyzeBatch:
+    """Batch analysis matches single analyses without an event loop."""
+
+    @pytest.fixture
+    def service(self):
+        """Create unified pattern service instance."""
+        return UnifiedPatternService()
+
+    @staticmethod
+    def _comparable(envelope):
+        data = envelope.to_dict()
+        data.pop("analysis_time_ms", None)
+        return data
+
+    def test_batch_matches_single_calls_in_order(self, service):
+        inputs = [
+            {"chords": ["C", "F", "G", "C"], "key_hint": "C major"},
+            {"chords": ["Am", "Dm", "G", "C"]},
+            {"romans": ["ii", "V", "I"], "key_hint": "G major"},
+            {"notes": ["D", "E", "F", "G", "A", "B", "C"], "key_hint": "D dorian"},
+            {"melody": ["E4", "D4", "C4"], "key_hint": "C major"},
+            {"chords": ["Em", "F"]},
+        ]
+
+        envelopes = service.analyze_batch(inputs)
+
+        assert [self._comparable(e) for e in envelopes] == [
+            self._comparable(service.analyze_with_patterns(**item)) for item in inputs
+        ]
+
+    def test_invalid_input_rejects_batch(self, service):
+        with pytest.raises(ValueError):
+            service.analyze_batch(
+                [{"chords": ["C", "G"]}, {"chords": ["C"], "romans": ["I"]}]
+            )
+
+
+class TestAnalyzeMany:
+    """Test parallel analysis on the PatternAnalysisService warm pool."""
+
+    INPUTS = [
+        {"chord_symbols": ["C", "F", "G", "C"], "key_hint": "C major"},
+        {"romans": ["ii", "V", "I"]},  # missing key_hint -> per-item error
+        {"romans": ["ii", "V", "I"], "key_hint": "G major"},
+        {"chord_symbols": ["Am", "Dm", "G", "C"]},
+        {"melody": ["E4", "D4", "C4"], "key_hint": "C major"},
+    ]
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def service():
+        service = PatternAnalysisService()
+        yield service
+        service.close()
+
+    @staticmethod
+    def _comparable(result):
+        if isinstance(result, Exception):
+            return (type(result), str(result))
+        data = dict(result)
+        data.pop("analysis_time_ms", None)
+        return data
+
+    def _expected(self, service):
+        expected = []
+        for item in self.INPUTS:
+            try:
+                expected.append(service.analyze_with_patterns(**item).to_dict())
+            except ValueError as e:
+                expected.append(e)
+        return [self._comparable(result) for result in expected]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_order_with_per_item_errors(self, service, workers):
+        results = list(service.analyze_many(self.INPUTS, workers=workers, chunksize=2))
+
+        assert isinstance(results[1], ValueError)
+        assert [self._comparable(r) for r in results] == self._expected(service)
+
+    def test_pool_stays_warm_and_accepts_lazy_inputs(self, service):
+        first = list(service.analyze_many(iter(self.INPUTS * 3), workers=2))
+        pool = service._pool
+
+        second = list(service.analyze_many(iter(self.INPUTS), workers=2))
+
+        assert service._pool is pool
+        assert len(first) == 3 * len(second)
+        assert [self._comparable(r) for r in second] == self._expected(service)
+
+    def test_invalid_arguments(self, service):
+        with pytest.raises(ValueError):
+            list(service.analyze_many(self.INPUTS, workers=1, chunksize=0))
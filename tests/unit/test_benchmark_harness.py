@@ -0,0 +1,79 @@
+"""
+Unit tests for the benchmark harness (benchmarks/).
+"""
+
+import json
+
+import pytest
+
+from benchmarks.cases import all_benchmarks
+from benchmarks.harness import (
+    Benchmark,
+    BenchmarkResult,
+    find_regressions,
+    load_baseline,
+    run_benchmark,
+    write_baseline,
+)
+
+
+def _result(name, ops_per_sec):
+    return BenchmarkResult(
+        name=name,
+        rounds=10,
+        ops_per_sec=ops_per_sec,
+        p50_ms=1.0,
+        p99_ms=2.0,
+        peak_alloc_kib=1.0,
+        alloc_blocks=3,
+    )
+
+
+class TestBenchmarkHarness:
+    """Timing, baseline round-trip and regression detection."""
+
+    def test_run_benchmark_reports_metrics(self):
+        result = run_benchmark(
+            Benchmark("sum", lambda: lambda: sum(range(100))), min_time=0.0
+        )
+
+        assert result.name == "sum"
+        assert result.rounds == 3
+        assert result.ops_per_sec > 0
+        assert 0 < result.p50_ms <= result.p99_ms
+
+    def test_baseline_round_trip(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        write_baseline(path, [_result("a", 100.0)])
+
+        assert load_baseline(path)["a"]["ops_per_sec"] == 100.0
+        assert load_baseline(tmp_path / "missing.json") == {}
+
+    def test_unknown_baseline_version_rejected(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"version": 99, "results": {}}))
+
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+    def test_regressions_beyond_threshold_only(self):
+        baseline = {
+            "slow": {"ops_per_sec": 100.0},
+            "fine": {"ops_per_sec": 100.0},
+        }
+        results = [_result("slow", 70.0), _result("fine", 80.0), _result("new", 1.0)]
+
+        regressions = find_regressions(results, baseline, threshold_pct=25.0)
+
+        assert [r.name for r in regressions] == ["slow"]
+        assert regressions[0].change_pct == pytest.approx(-30.0)
+
+    def test_suite_covers_every_length(self):
+        names = {benchmark.name for benchmark in all_benchmarks()}
+
+        for prefix in ("engine_analyze", "service_analyze"):
+            for kind in ("chords", "romans", "melody"):
+                for length in (4, 16, 64, 256, 1024, 4096):
+                    assert f"{prefix}.{kind}.{length}" in names
+            assert f"{prefix}.scale.7" in names
+        assert {"romanize", "detect_chords", "calibrator_fit", "serialize"} <= names
@@ -0,0 +1,62 @@
+"""
+Import-time budget for the top-level package.
+
+`import harmonic_analysis` must stay cheap: public names are resolved lazily
+and heavy dependencies (NumPy, scikit-learn, jsonschema) load on first use.
+"""
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+import harmonic_analysis
+
+# Generous ceiling on the package's own cumulative import time; the lazy
+# package imports in a few milliseconds, the eager one took over a second.
+IMPORT_BUDGET_US = 150_000
+
+HEAVY_MODULES = ("numpy", "sklearn", "jsonschema")
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestImportTime:
+    """Top-level import cost and lazy export behaviour."""
+
+    def test_import_within_budget(self):
+        result = _run("import harmonic_analysis")
+
+        match = re.search(
+            r"^import time:\s+\d+ \|\s+(\d+) \| harmonic_analysis$",
+            result.stderr,
+            re.MULTILINE,
+        )
+        assert match, result.stderr
+        assert int(match.group(1)) < IMPORT_BUDGET_US
+
+    def test_heavy_dependencies_not_imported(self):
+        result = _run(
+            "import sys, harmonic_analysis\n"
+            "harmonic_analysis.get_circle_of_fifths()\n"
+            f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_every_public_name_resolves(self):
+        for name in harmonic_analysis.__all__:
+            assert getattr(harmonic_analysis, name) is not None
+        assert set(harmonic_analysis.__all__) <= set(dir(harmonic_analysis))
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="not_a_real_name"):
+            harmonic_analysis.not_a_real_name
@@ -0,0 +1,139 @@
+"""
+Tests for the binary cold-start resource bundle.
+
+The bundle must return exactly what the JSON sources contain, be rebuilt when
+missing, corrupt or stale, and fall back to plain JSON when unavailable.
+"""
+
+import hashlib
+import json
+import marshal
+
+import pytest
+
+from harmonic_analysis.resources import bundle, load_json
+from harmonic_analysis.resources.bundle import (
+    BUNDLED_RESOURCES,
+    RESOURCES_DIR,
+    bundled_json,
+    clear_bundle_cache,
+    default_bundle_path,
+    load_resource_bundle,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("HARMONIC_ANALYSIS_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("HARMONIC_ANALYSIS_NO_BUNDLE", raising=False)
+    clear_bundle_cache()
+    yield tmp_path
+    clear_bundle_cache()
+
+
+@pytest.mark.parametrize("name", BUNDLED_RESOURCES)
+def test_bundled_json_matches_sources(name):
+    raw = (RESOURCES_DIR / name).read_bytes()
+
+    digest, data = bundled_json(RESOURCES_DIR / name)
+
+    assert digest == hashlib.sha256(raw).hexdigest()
+    assert data == json.loads(raw)
+
+
+def test_bundle_is_built_once_and_reused(cache_dir, monkeypatch):
+    assert load_resource_bundle() is not None
+    path = default_bundle_path()
+    assert path.parent == cache_dir and path.exists()
+
+    # A new process reads the bundle instead of rebuilding it
+    clear_bundle_cache()
+    monkeypatch.setattr(bundle, "build_resource_bundle", pytest.fail)
+    assert load_resource_bundle() is not None
+
+
+def test_each_lookup_returns_a_fresh_copy():
+    _, first = bundled_json(RESOURCES_DIR / "glossary.json")
+    first.clear()
+
+    assert load_json("glossary.json")
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"not a bundle",
+        marshal.dumps({"format": bundle.BUNDLE_FORMAT, "version": 0}),
+    ],
+)
+def test_corrupt_or_outdated_bundle_is_rebuilt(contents):
+    path = default_bundle_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(contents)
+
+    assert load_resource_bundle()["version"] == bundle.BUNDLE_VERSION
+    assert marshal.loads(path.read_bytes())["version"] == bundle.BUNDLE_VERSION
+
+
+def test_stale_source_is_rebuilt():
+    built = bundle.build_resource_bundle()
+    built["resources"]["glossary.json"]["stat"] = (0, 0)
+    default_bundle_path().write_bytes(marshal.dumps(built))
+
+    fresh = load_resource_bundle()
+
+    assert fresh["resources"]["glossary.json"]["stat"] != (0, 0)
+
+
+def test_unbundled_paths_are_not_served(tmp_path):
+    copy = tmp_path / "glossary.json"
+    copy.write_bytes((RESOURCES_DIR / "glossary.json").read_bytes())
+
+    assert bundled_json(copy) is None
+    assert bundled_json(RESOURCES_DIR / "patterns" / "patterns_full.json") is None
+
+
+def test_disabled_bundle_falls_back(monkeypatch):
+    monkeypatch.setenv("HARMONIC_ANALYSIS_NO_BUNDLE", "1")
+
+    assert bundled_json(RESOURCES_DIR / "glossary.json") is None
+    assert load_json("glossary.json") == json.loads(
+        (RESOURCES_DIR / "glossary.json").read_bytes()
+    )
+
+
+def test_unwritable_cache_dir_builds_once_in_memory(tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    monkeypatch.setenv("HARMONIC_ANALYSIS_CACHE_DIR", str(blocker))
+    builds = []
+    build = bundle.build_resource_bundle
+
+    def counting_build(*args, **kwargs):
+        builds.append(args)
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(bundle, "build_resource_bundle", counting_build)
+    expected = json.loads((RESOURCES_DIR / "glossary.json").read_bytes())
+
+    for _ in range(5):
+        assert load_json("glossary.json") == expected
+
+    assert len(builds) == 1
+    assert bundled_json(RESOURCES_DIR / "glossary.json")[1] == expected
+    with pytest.raises(OSError):
+        build(default_bundle_path())
+
+
+def test_unbundlable_sources_are_not_retried(monkeypatch):
+    calls = []
+
+    def broken_build(*args, **kwargs):
+        calls.append(args)
+        raise ValueError("bad JSON")
+
+    monkeypatch.setattr(bundle, "build_resource_bundle", broken_build)
+
+    assert load_resource_bundle() is None
+    assert load_resource_bundle() is None
+    assert len(calls) == 1